@@ -6,6 +6,7 @@ Reusable across multiple plugins (Stream-Mapparr, Channel Mapparr, etc.)
 
 import os
 import re
+import sys
 import json
 import logging
 import unicodedata
@@ -30,6 +31,15 @@ except ImportError:  # standalone load (tests / direct import)
         _strip_stylized_tokens,  # noqa: F401
     )
 
+# Optional batched scorer: one rapidfuzz call scores the query against every
+# candidate in C instead of one calculate_similarity() round-trip per candidate.
+# Same metric as the core's fast path (Levenshtein normalized_similarity).
+try:
+    from rapidfuzz import process as _rf_process
+    from rapidfuzz.distance import Levenshtein as _rf_lev
+except ImportError:
+    _rf_process = None
+
 # Version: YY.DDD.HHMM (Julian date format: Year.DayOfYear.Time)
 __version__ = "26.165.0009"
 
@@ -49,6 +59,11 @@ _ZONE_EAST_RE = re.compile(r'\(\s*E(?:AST)?\s*\)|\bEAST\b', re.IGNORECASE)
 # is too ambiguous (premium/etc.) to read as a zone.
 _ZONE_PACIFIC_RE = re.compile(r'\(\s*PACIFIC\s*\)|\(\s*PT\s*\)|\bPACIFIC\b', re.IGNORECASE)
 
+# Separators dropped for the space-insensitive exact-match form.
+_NOSPACE_RE = re.compile(r'[\s&\-]+')
+# Broadcast service suffix on a database callsign ("WABC-TV" -> "WABC").
+_CALLSIGN_SUFFIX_RE = re.compile(r'-(?:TV|CD|LP|DT|LD)$')
+
 
 class FuzzyMatcher(FuzzyMatcherCore):
     """Stream-Mapparr matcher: the shared pure core (FuzzyMatcherCore) plus this
@@ -78,6 +93,9 @@ class FuzzyMatcher(FuzzyMatcherCore):
         self._norm_cache = {}          # raw_name -> normalized_lower
         self._norm_nospace_cache = {}   # raw_name -> normalized with spaces/&/- removed
         self._processed_cache = {}     # raw_name -> process_string_for_matching result
+        self._digit_tokens_cache = {}  # raw_name -> frozenset of digit-only tokens (numeric-sibling guard)
+        self._query_cache = {}         # (query, tags, flags) -> (normalized, digit tokens, processed)
+        self._fallback_norm_cache = {}  # (raw_name, tags) -> normalize_name result, names precompute didn't see
         self._cached_ignore_tags = None  # user_ignored_tags used during precompute
         self._cached_flags = {}        # ignore_quality/regional/geographic/misc used during precompute
 
@@ -158,7 +176,7 @@ class FuzzyMatcher(FuzzyMatcherCore):
                         callsign = raw_channel.get('callsign', '').strip()
                         if callsign:
                             self.channel_lookup[callsign] = raw_channel
-                            base_callsign = re.sub(r'-(?:TV|CD|LP|DT|LD)$', '', callsign)
+                            base_callsign = _CALLSIGN_SUFFIX_RE.sub('', callsign)
                             if base_callsign != callsign:
                                 self.channel_lookup[base_callsign] = raw_channel
                     else:
@@ -223,7 +241,7 @@ class FuzzyMatcher(FuzzyMatcherCore):
             # setdefault: keep the first (primary) station for a given key so a
             # later subchannel entry can't clobber the main affiliate.
             self.channel_lookup.setdefault(callsign, station)
-            base_callsign = re.sub(r'-(?:TV|CD|LP|DT|LD)$', '', callsign)
+            base_callsign = _CALLSIGN_SUFFIX_RE.sub('', callsign)
             if base_callsign != callsign:
                 self.channel_lookup.setdefault(base_callsign, station)
             loaded += 1
@@ -296,7 +314,7 @@ class FuzzyMatcher(FuzzyMatcherCore):
                         callsign = raw_channel.get('callsign', '').strip()
                         if callsign:
                             self.channel_lookup[callsign] = raw_channel
-                            base_callsign = re.sub(r'-(?:TV|CD|LP|DT|LD)$', '', callsign)
+                            base_callsign = _CALLSIGN_SUFFIX_RE.sub('', callsign)
                             if base_callsign != callsign:
                                 self.channel_lookup[base_callsign] = raw_channel
                     else:
@@ -338,6 +356,9 @@ class FuzzyMatcher(FuzzyMatcherCore):
         self._norm_cache.clear()
         self._norm_nospace_cache.clear()
         self._processed_cache.clear()
+        self._digit_tokens_cache.clear()
+        self._query_cache.clear()
+        self._fallback_norm_cache.clear()
         self._cached_ignore_tags = user_ignored_tags
         self._cached_flags = {
             'ignore_quality': ignore_quality,
@@ -355,28 +376,75 @@ class FuzzyMatcher(FuzzyMatcherCore):
             if norm and len(norm) >= 2:
                 norm_lower = norm.lower()
                 self._norm_cache[name] = norm_lower
-                self._norm_nospace_cache[name] = re.sub(r'[\s&\-]+', '', norm_lower)
+                self._norm_nospace_cache[name] = _NOSPACE_RE.sub('', norm_lower)
                 self._processed_cache[name] = self.process_string_for_matching(norm)
+                self._digit_tokens_cache[name] = frozenset(t for t in norm_lower.split() if t.isdigit())
 
         self.logger.info(f"Pre-normalized {len(self._norm_cache)} stream names (from {len(names)} total)")
 
+    def _fallback_norm(self, name, user_ignored_tags):
+        """normalize_name() with the stored flags for a name precompute didn't cover.
+
+        Each fuzzy_match() stage asks for the same candidate again, so the
+        result is memoized per tag list until the next precompute call.
+        """
+        tags = user_ignored_tags if user_ignored_tags is not None else self._cached_ignore_tags
+        key = (name, tuple(tags or ()))
+        try:
+            return self._fallback_norm_cache[key]
+        except KeyError:
+            norm = self.normalize_name(name, tags, **self._cached_flags)
+            self._fallback_norm_cache[key] = norm
+            return norm
+
     def _get_cached_norm(self, name, user_ignored_tags=None):
         """Get cached normalization or compute on the fly using stored flags."""
         if name in self._norm_cache:
             return self._norm_cache[name], self._norm_nospace_cache[name]
-        tags = user_ignored_tags if user_ignored_tags is not None else self._cached_ignore_tags
-        norm = self.normalize_name(name, tags, **self._cached_flags)
+        norm = self._fallback_norm(name, user_ignored_tags)
         if not norm or len(norm) < 2:
             return None, None
         norm_lower = norm.lower()
-        return norm_lower, re.sub(r'[\s&\-]+', '', norm_lower)
+        return norm_lower, _NOSPACE_RE.sub('', norm_lower)
+
+    def _get_cached_digit_tokens(self, name, candidate_lower):
+        """Digit-only tokens of a candidate's normalized form; cached for precomputed names."""
+        tokens = self._digit_tokens_cache.get(name)
+        if tokens is None:
+            tokens = frozenset(t for t in candidate_lower.split() if t.isdigit())
+        return tokens
+
+    def _get_query_forms(self, query_name, user_ignored_tags, ignore_quality, ignore_regional,
+                         ignore_geographic, ignore_misc):
+        """Normalized query, its digit tokens and its token-sorted form, memoized.
+
+        A channel name is matched against the same stream list once per channel
+        and again per threshold in the preview, so its normalization is cached
+        until the next precompute_normalizations() call.
+        """
+        key = (query_name, tuple(user_ignored_tags), ignore_quality, ignore_regional,
+               ignore_geographic, ignore_misc)
+        forms = self._query_cache.get(key)
+        if forms is None:
+            normalized = self.normalize_name(query_name, user_ignored_tags,
+                                             ignore_quality=ignore_quality,
+                                             ignore_regional=ignore_regional,
+                                             ignore_geographic=ignore_geographic,
+                                             ignore_misc=ignore_misc)
+            if normalized:
+                forms = (normalized,
+                         frozenset(t for t in normalized.split() if t.isdigit()),
+                         self.process_string_for_matching(normalized))
+            else:
+                forms = (normalized, frozenset(), '')
+            self._query_cache[key] = forms
+        return forms
 
     def _get_cached_processed(self, name, user_ignored_tags=None):
         """Get cached processed string or compute on the fly using stored flags."""
         if name in self._processed_cache:
             return self._processed_cache[name]
-        tags = user_ignored_tags if user_ignored_tags is not None else self._cached_ignore_tags
-        norm = self.normalize_name(name, tags, **self._cached_flags)
+        norm = self._fallback_norm(name, user_ignored_tags)
         if not norm or len(norm) < 2:
             return None
         return self.process_string_for_matching(norm)
@@ -512,7 +580,7 @@ class FuzzyMatcher(FuzzyMatcherCore):
             if query_digit_tokens:
                 candidate_lower, _ = self._get_cached_norm(candidate, user_ignored_tags)
                 if candidate_lower:
-                    cand_digit_tokens = {t for t in candidate_lower.split() if t.isdigit()}
+                    cand_digit_tokens = self._get_cached_digit_tokens(candidate, candidate_lower)
                     if not cand_digit_tokens or not (query_digit_tokens & cand_digit_tokens):
                         continue
 
@@ -569,7 +637,7 @@ class FuzzyMatcher(FuzzyMatcherCore):
             if not n:
                 return None, None
             low = n.lower()
-            return low, re.sub(r'[\s&\-]+', '', low)
+            return low, _NOSPACE_RE.sub('', low)
 
         alias_low, alias_nospace = set(), set()
         for v in variants:
@@ -608,62 +676,93 @@ class FuzzyMatcher(FuzzyMatcherCore):
         Returns:
             Tuple of (matched_name, score, match_type) or (None, 0, None) if no match found
         """
-        if not candidate_names:
-            return None, 0, None
+        threshold = self.match_threshold
+        return self.fuzzy_match_thresholds(
+            query_name, candidate_names, [threshold], user_ignored_tags,
+            remove_cinemax=remove_cinemax, ignore_quality=ignore_quality,
+            ignore_regional=ignore_regional, ignore_geographic=ignore_geographic,
+            ignore_misc=ignore_misc)[threshold]
+
+    def fuzzy_match_thresholds(self, query_name, candidate_names, thresholds, user_ignored_tags=None,
+                               remove_cinemax=False, ignore_quality=True, ignore_regional=True,
+                               ignore_geographic=True, ignore_misc=True):
+        """
+        fuzzy_match() evaluated at several thresholds in one pass over the candidates.
+
+        Stage 1 does not depend on the threshold, and stages 2 and 3 keep the
+        first candidate with the highest score, so each stage's winner is
+        computed once and then gated per threshold exactly as fuzzy_match()
+        would with match_threshold set to that value.
+
+        Returns:
+            Dict mapping each threshold to a (matched_name, score, match_type)
+            tuple, (None, 0, None) where nothing matches at that threshold
+        """
+        no_match = (None, 0, None)
+        results = {threshold: no_match for threshold in thresholds}
+        if not candidate_names or not results:
+            return results
 
         if user_ignored_tags is None:
             user_ignored_tags = []
 
         # Normalize query (channel name - don't remove Cinemax from it)
-        normalized_query = self.normalize_name(query_name, user_ignored_tags,
-                                                ignore_quality=ignore_quality,
-                                                ignore_regional=ignore_regional,
-                                                ignore_geographic=ignore_geographic,
-                                                ignore_misc=ignore_misc)
-        
+        normalized_query, query_digit_tokens, processed_query = self._get_query_forms(
+            query_name, user_ignored_tags, ignore_quality, ignore_regional,
+            ignore_geographic, ignore_misc)
+
         if not normalized_query:
-            return None, 0, None
+            return results
 
         # Numeric-sibling guard: when the query contains digit-only tokens (e.g. "Fox Sports 1"),
         # the discriminating digit becomes a single-char edit under token-sort Levenshtein and
         # long shared prefixes mask it — FS1 vs FS2 scores 25/26 = 96% and slips past threshold 95.
         # Mirrors the inline guard in plugin.py (~2329). Applied to every stage for defense in depth.
-        query_digit_tokens = {t for t in normalized_query.split() if t.isdigit()}
 
         best_match = None
         best_ratio = 0
-        match_type = None
 
         # Stage 1: Exact match (after normalization)
         normalized_query_lower = normalized_query.lower()
-        normalized_query_nospace = re.sub(r'[\s&\-]+', '', normalized_query_lower)
-
+        normalized_query_nospace = _NOSPACE_RE.sub('', normalized_query_lower)
+        query_len = len(normalized_query_lower)
+
+        # Playlists carry many entries that normalize identically ("BBC One HD",
+        # "BBC One FHD"); every stage is a pure function of the normalized form
+        # and keeps the first strictly-better candidate, so later duplicates
+        # can never win and are scored only once.
+        seen_lower = set()
         for candidate in candidate_names:
             # Use cached normalization when available
             candidate_lower, candidate_nospace = self._get_cached_norm(candidate, user_ignored_tags)
-            if not candidate_lower:
+            if not candidate_lower or candidate_lower in seen_lower:
                 continue
+            seen_lower.add(candidate_lower)
 
             if query_digit_tokens:
-                cand_digit_tokens = {t for t in candidate_lower.split() if t.isdigit()}
+                cand_digit_tokens = self._get_cached_digit_tokens(candidate, candidate_lower)
                 if not cand_digit_tokens or not (query_digit_tokens & cand_digit_tokens):
                     continue
 
             # Exact match (space/punctuation insensitive)
             if normalized_query_nospace == candidate_nospace:
-                return candidate, 100, "exact"
+                return {threshold: (candidate, 100, "exact") for threshold in results}
 
-            # Very high similarity (97%+)
+            # Very high similarity (97%+). The edit distance is at least the
+            # length difference, so a length ratio under 0.97 can't get there.
+            candidate_len = len(candidate_lower)
+            if min(query_len, candidate_len) / max(query_len, candidate_len) < 0.97:
+                continue
             ratio = self.calculate_similarity(normalized_query_lower, candidate_lower, min_ratio=0.97)
             if ratio >= 0.97 and ratio > best_ratio:
                 best_match = candidate
                 best_ratio = ratio
-                match_type = "exact"
 
         if best_match:
-            return best_match, int(best_ratio * 100), match_type
+            return {threshold: (best_match, int(best_ratio * 100), "exact") for threshold in results}
 
-        # Stage 2: Substring matching
+        # Stage 2: Substring matching. The winner is the first candidate with the
+        # highest length ratio; a threshold takes it only if that ratio clears it.
         for candidate in candidate_names:
             # Use cached normalization when available
             candidate_lower, _ = self._get_cached_norm(candidate, user_ignored_tags)
@@ -671,55 +770,97 @@ class FuzzyMatcher(FuzzyMatcherCore):
                 continue
 
             if query_digit_tokens:
-                cand_digit_tokens = {t for t in candidate_lower.split() if t.isdigit()}
+                cand_digit_tokens = self._get_cached_digit_tokens(candidate, candidate_lower)
                 if not cand_digit_tokens or not (query_digit_tokens & cand_digit_tokens):
                     continue
 
             # Check if one is a substring of the other
             if normalized_query_lower in candidate_lower or candidate_lower in normalized_query_lower:
-                length_ratio = min(len(normalized_query_lower), len(candidate_lower)) / max(len(normalized_query_lower), len(candidate_lower))
-                if length_ratio >= 0.75:
-                    ratio = self.calculate_similarity(normalized_query_lower, candidate_lower,
-                                                      min_ratio=self.match_threshold / 100.0)
-                    if ratio > best_ratio:
-                        best_match = candidate
-                        best_ratio = ratio
-                        match_type = "substring"
-
-        if best_match and int(best_ratio * 100) >= self.match_threshold:
-            return best_match, int(best_ratio * 100), match_type
+                length_ratio = min(query_len, len(candidate_lower)) / max(query_len, len(candidate_lower))
+                # One string contains the other, so the edit distance is exactly the
+                # length difference and calculate_similarity() equals length_ratio
+                # — skip the O(n*m) DP.
+                if length_ratio >= 0.75 and length_ratio > best_ratio:
+                    best_match = candidate
+                    best_ratio = length_ratio
+
+        pending = []
+        for threshold in results:
+            if best_match and best_ratio >= threshold / 100.0 and int(best_ratio * 100) >= threshold:
+                results[threshold] = (best_match, int(best_ratio * 100), "substring")
+            else:
+                pending.append(threshold)
+        if not pending:
+            return results
 
         # Stage 3: Fuzzy matching with token sorting
-        processed_query = self.process_string_for_matching(normalized_query)
-        best_score = -1.0
-        best_fuzzy = None
-        threshold_ratio = self.match_threshold / 100.0
-
+        eligible = []
+        seen_processed = set()
         for candidate in candidate_names:
             if query_digit_tokens:
                 candidate_lower, _ = self._get_cached_norm(candidate, user_ignored_tags)
                 if candidate_lower:
-                    cand_digit_tokens = {t for t in candidate_lower.split() if t.isdigit()}
+                    cand_digit_tokens = self._get_cached_digit_tokens(candidate, candidate_lower)
                     if not cand_digit_tokens or not (query_digit_tokens & cand_digit_tokens):
                         continue
 
             # Use cached processed string when available
             processed_candidate = self._get_cached_processed(candidate, user_ignored_tags)
-            if not processed_candidate:
+            if not processed_candidate or processed_candidate in seen_processed:
                 continue
+            seen_processed.add(processed_candidate)
+            eligible.append((candidate, processed_candidate))
 
-            score = self.calculate_similarity(processed_query, processed_candidate,
-                                              min_ratio=threshold_ratio)
-            if score > best_score:
-                best_score = score
-                best_fuzzy = candidate
+        # Scores at or above the lowest pending threshold are exact, which is
+        # all the per-threshold gate below needs.
+        best_fuzzy, best_score = self._best_similarity(
+            processed_query, eligible, min(pending) / 100.0)
 
         percentage_score = int(best_score * 100)
-        if percentage_score >= self.match_threshold and best_fuzzy:
-            return best_fuzzy, percentage_score, f"fuzzy ({percentage_score})"
+        for threshold in pending:
+            if best_fuzzy and best_score >= threshold / 100.0 and percentage_score >= threshold:
+                results[threshold] = (best_fuzzy, percentage_score, f"fuzzy ({percentage_score})")
 
-        return None, 0, None
+        return results
     
+    def _best_similarity(self, query, choices, min_ratio):
+        """Best (candidate, score) for query over [(candidate, processed), ...].
+
+        Same result as calling calculate_similarity(query, processed, min_ratio)
+        per choice and keeping the first strictly-greater score: ties go to the
+        earliest choice, and a score below min_ratio reads as 0.0. With rapidfuzz
+        installed the whole list is scored in one extractOne call. Returns
+        (None, -1.0) for an empty list.
+        """
+        if not choices:
+            return None, -1.0
+
+        core_module = sys.modules[FuzzyMatcherCore.__module__]
+        if _rf_process is not None and getattr(core_module, '_USE_RAPIDFUZZ', False):
+            _, score, index = _rf_process.extractOne(
+                query, [processed for _, processed in choices],
+                scorer=_rf_lev.normalized_similarity, processor=None)
+            if min_ratio > 0.0 and score < min_ratio:
+                score = 0.0
+            return choices[index][0], score
+
+        best_score = -1.0
+        best_match = None
+        query_len = len(query)
+        for candidate, processed in choices:
+            # The length ratio bounds the similarity from above; below min_ratio
+            # calculate_similarity() would return 0.0 anyway.
+            processed_len = len(processed)
+            if (min_ratio > 0.0 and query_len and processed_len
+                    and min(query_len, processed_len) / max(query_len, processed_len) < min_ratio):
+                score = 0.0
+            else:
+                score = self.calculate_similarity(query, processed, min_ratio=min_ratio)
+            if score > best_score:
+                best_score = score
+                best_match = candidate
+        return best_match, best_score
+
     def match_broadcast_channel(self, channel_name):
         """
         Match broadcast (OTA) channel by callsign.
@@ -6,6 +6,7 @@ Automatically adds matching streams to channels based on name similarity and qua
 import logging
 import json
 import csv
+import functools
 import os
 import re
 import urllib.request
@@ -13,12 +14,18 @@ import urllib.error
 import time
 import sys
 import types
+from collections import Counter, defaultdict, namedtuple
 import unicodedata
 import pytz
+from concurrent.futures import ThreadPoolExecutor
 try:
     import fcntl  # POSIX-only; provides the cross-worker scheduler flock (bug-069)
 except ImportError:  # Windows / non-Docker test host
     fcntl = None
+try:
+    import orjson  # optional: faster decoder for the large channel/station databases
+except ImportError:  # stdlib json fallback (Dispatcharr does not ship orjson)
+    orjson = None
 from datetime import datetime, timedelta, timezone as dt_timezone
 from django.utils import timezone
 from django.db import transaction
@@ -87,6 +94,10 @@ def _scheduler_state():
         state = sys.modules.setdefault(_SCHEDULER_STATE_MODULE, candidate)
     return state
 
+# Serializes progress-file writes between action threads and the deferred
+# flush of a throttled update (Plugin._flush_pending_progress).
+_PROGRESS_PERSIST_LOCK = threading.RLock()
+
 # Setup logging - Dispatcharr provides a pre-configured logger via context
 LOGGER = logging.getLogger("plugins.stream_mapparr")
 
@@ -190,6 +201,112 @@ def _mname(stream):
     return stream["name"] if mn is None else mn
 
 
+def _load_json_path(path):
+    """Parse a UTF-8 JSON file, with orjson when installed and stdlib json otherwise.
+    Decode errors surface as ValueError either way (orjson.JSONDecodeError
+    subclasses json.JSONDecodeError)."""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dump_json_path(path, data):
+    """Write data as compact JSON, with orjson when installed and stdlib json
+    otherwise. Used for the processed-data snapshot, which holds every loaded
+    channel and stream and is only ever read back by the plugin.
+
+    The file is written to a sibling temp file and published with os.replace,
+    so a reader (or a crash mid-write) never sees a truncated snapshot."""
+    tmp = f"{path}.tmp"
+    try:
+        if orjson is not None:
+            with open(tmp, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(tmp, 'w') as f:
+                json.dump(data, f, separators=(',', ':'))
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+# CSV cell text for a boolean, indexed by the bool itself.
+_YES_NO = ('No', 'Yes')
+
+# Strings accepted as True for settings that arrive as text (form posts, JSON).
+_TRUTHY_STRINGS = frozenset(('true', 'yes', '1'))
+
+_WORD_RE = re.compile(r'\w+')
+# Word runs of 2+ chars: the same tokens as replacing punctuation with spaces,
+# splitting, and dropping single characters.
+_MULTI_CHAR_WORD_RE = re.compile(r'\w{2,}')
+# Every callsign FuzzyMatcher.extract_callsign can return starts with K/W and
+# two more letters (any case), so names without this cannot yield one.
+_US_CALLSIGN_HINT_RE = re.compile(r'[KW][A-Z]{2}', re.IGNORECASE)
+# File names of every CSV this plugin writes to the export dir.
+_EXPORT_CSV_NAME_RE = re.compile(r'stream_mapparr_.*\.csv', re.DOTALL)
+
+# Per-run, per-stream-name matching artifacts (see Plugin._stream_artifact_lookup).
+# signature is a 64-bit Bloom-style OR of token hashes: two names whose
+# signatures share no bit cannot share a token, which rejects most
+# (channel, stream) pairs with one int AND before any set operation.
+_StreamArtifacts = namedtuple('_StreamArtifacts', 'cleaned lower tokens multi_tokens number_tokens signature')
+
+
+def _token_signature(tokens):
+    sig = 0
+    for token in tokens:
+        sig |= 1 << (hash(token) & 63)
+    return sig
+
+
+@functools.lru_cache(maxsize=128)
+def _ignore_tag_patterns(ignore_tags):
+    """Compile a tuple of user ignore tags into (word_re, bracket_re) — one
+    alternation each instead of one re.sub per tag per name. Bracketed tags
+    ("[4K]", "(Backup)") are stripped with surrounding whitespace; bare words
+    on word boundaries. Longest tags first so a tag that prefixes another
+    can't shadow it. Either slot is None when no tag of that kind exists."""
+    word_tags, bracket_tags = [], []
+    for tag in sorted(set(ignore_tags), key=len, reverse=True):
+        if not tag:
+            continue
+        if any(c in tag for c in '[]()'):
+            bracket_tags.append(re.escape(tag))
+        else:
+            word_tags.append(re.escape(tag))
+    word_re = re.compile(r'\b(?:' + '|'.join(word_tags) + r')\b', re.IGNORECASE) if word_tags else None
+    bracket_re = re.compile(r'\s*(?:' + '|'.join(bracket_tags) + r')\s*', re.IGNORECASE) if bracket_tags else None
+    return word_re, bracket_re
+
+
+@functools.lru_cache(maxsize=64)
+def _pytz_timezone(name):
+    """pytz.timezone, memoized per IANA name for the scheduler and validation
+    paths. Unknown names raise and are not cached."""
+    return pytz.timezone(name)
+
+
+@functools.lru_cache(maxsize=1024)
+def _word_boundary_pattern(word):
+    """Case-insensitive \\b<word>\\b matcher, compiled once per word (quality
+    tokens, OTA callsigns)."""
+    return re.compile(rf'\b{re.escape(word)}\b', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=4096)
+def _ota_callsign_pattern(base_callsign):
+    """Case-sensitive \\b<callsign>(-XX[n])?\\b matcher (WKRG, WKRG-DT, WKRG-DT2),
+    compiled once per base callsign for US OTA matching."""
+    return re.compile(rf'\b{re.escape(base_callsign)}(?:-[A-Z]{{2}}\d?)?\b')
+
+
 def _apply_regex_rules_to_streams(streams, rules, logger=None):
     """Stamp stream['match_name'] on every dict (spec §5), under the §4 gate-4
     containment: input length cap, per-name output-growth cap (revert + stop),
@@ -316,11 +433,16 @@ class PluginConfig:
     RATE_LIMIT_LOW = 0.1                        # 10 operations/second
     RATE_LIMIT_MEDIUM = 0.5                     # 2 operations/second
     RATE_LIMIT_HIGH = 2.0                       # 1 operation/2 seconds
+    RATE_LIMIT_BURST = 3                        # Token-bucket capacity: ops allowed back-to-back before pacing
+    CHANNEL_STREAM_BULK_BATCH_SIZE = 500        # Max ChannelStream rows per INSERT in bulk_create
+    VISIBILITY_UPDATE_BATCH_SIZE = 5000         # Max channel ids per IN list in visibility UPDATEs
+    EXISTING_STREAMS_PREFETCH_CHANNELS = 200    # Channels whose assigned streams are read just before their writes
 
     # === SCHEDULING SETTINGS ===
     DEFAULT_TIMEZONE = "UTC"                     # Fallback when Dispatcharr's global Time Zone is unset/invalid
     DEFAULT_SCHEDULED_TIMES = ""                # Empty = no scheduling
     DEFAULT_ENABLE_CSV_EXPORT = True            # Create CSV when streams added
+    CSV_EXPORT_BUFFER_BYTES = 1 << 20           # Write buffer for CSV exports (fewer write() calls on large runs)
 
     SCHEDULER_CHECK_INTERVAL = 30               # Seconds between schedule checks
     SCHEDULER_TIME_WINDOW = 30                  # ± seconds to trigger scheduled run
@@ -329,6 +451,7 @@ class PluginConfig:
 
     # === CACHE SETTINGS ===
     VERSION_CHECK_CACHE_HOURS = 24              # Hours to cache GitHub version check
+    CHANNEL_DB_LOAD_WORKERS = 4                 # Parallel readers for enabled *_channels.json files
 
     # === FILE PATHS ===
     DATA_DIR = "/data"
@@ -346,9 +469,14 @@ class PluginConfig:
     LAST_RESULTS_FILE = "/data/stream_mapparr_last_results.json"    # last completed run (View Last Results)
     PROGRESS_TOAST_MIN_INTERVAL = 5  # default seconds between live progress toasts
     PROGRESS_STALE_SECONDS = 180     # a 'running' flag older than this is treated as stalled/crashed
+    PROGRESS_PERSIST_MIN_INTERVAL = 0.25  # seconds between progress-file writes while an op is running
+    PROGRESS_LOG_MIN_INTERVAL = 5    # seconds between "Processing N/M" log lines in per-item loops
 
     # === OPERATION LOCK SETTINGS ===
     OPERATION_LOCK_TIMEOUT_MINUTES = 10  # Lock expires after 10 minutes (in case of errors)
+    OPERATION_LOCK_CHECK_TTL_SECONDS = 1.0  # Reuse a lock-file read this long for polling checks (not acquire)
+    LOOKUP_QUERY_CACHE_TTL_SECONDS = 60     # Profiles/groups/M3U accounts rows shared by validate + action
+    VALIDATION_CACHE_TTL_SECONDS = 60       # Reuse a passing settings validation for identical settings
 
     # === PROGRESS TRACKING SETTINGS ===
     # Avg wall-clock per channel-group during matching (observed: 18 groups / 19k streams
@@ -606,7 +734,10 @@ class ProgressTracker:
 
 class SmartRateLimiter:
     """
-    Handles rate limiting with configurable delays to pace ORM write operations.
+    Token-bucket pacing for ORM write operations: refills at 1/base_delay tokens
+    per second up to RATE_LIMIT_BURST, so a short burst goes through unthrottled
+    and the sustained rate still matches the configured level. Thread-safe; the
+    sleep happens outside the lock so concurrent callers queue by reservation.
     """
     def __init__(self, setting_value="medium", logger=None):
         self.logger = logger
@@ -622,10 +753,26 @@ class SmartRateLimiter:
         else:
             self.base_delay = PluginConfig.RATE_LIMIT_MEDIUM
 
+        self.rate = 1.0 / self.base_delay if self.base_delay > 0 else 0.0
+        self.capacity = float(PluginConfig.RATE_LIMIT_BURST)
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
     def wait(self):
         """Call this before an operation to pace execution."""
-        if not self.disabled and self.base_delay > 0:
-            time.sleep(self.base_delay)
+        if self.disabled or self.base_delay <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            # Take the token now even if it isn't there yet (negative balance);
+            # the deficit is how long this caller must wait for it to refill.
+            self.tokens -= 1
+            delay = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if delay > 0:
+            time.sleep(delay)
 
 class Plugin:
     """Dispatcharr Stream-Mapparr Plugin"""
@@ -1106,6 +1253,8 @@ class Plugin:
     # Use config values for quality tag ordering
     CHANNEL_QUALITY_TAG_ORDER = PluginConfig.CHANNEL_QUALITY_TAG_ORDER
     STREAM_QUALITY_ORDER = PluginConfig.STREAM_QUALITY_ORDER
+    _NON_BLANK_QUALITY_TAGS = tuple(tag for tag in CHANNEL_QUALITY_TAG_ORDER if tag)
+    _CHANNEL_QUALITY_TAG_RANK = {tag: i for i, tag in enumerate(CHANNEL_QUALITY_TAG_ORDER)}
 
     def __init__(self):
         # -- SINGLETON GUARD --
@@ -1174,8 +1323,7 @@ class Plugin:
     def update_schedule_action(self, settings, logger):
         """Save settings and update scheduled tasks"""
         try:
-            scheduled_times_str = settings.get("scheduled_times") or ""
-            scheduled_times_str = scheduled_times_str.strip() if scheduled_times_str else ""
+            scheduled_times_str = self._setting_str(settings, "scheduled_times")
             logger.debug(f"[Stream-Mapparr] Update Schedule - scheduled_times value: '{scheduled_times_str}'")
 
             # Save settings to disk
@@ -1215,7 +1363,9 @@ class Plugin:
             
             # Find all periodic tasks created by this plugin
             tasks = PeriodicTask.objects.filter(name__startswith='stream_mapparr_')
-            task_count = tasks.count()
+            # Names are needed for the report anyway; counting them saves a COUNT query
+            task_names = list(tasks.values_list('name', flat=True))
+            task_count = len(task_names)
             
             if task_count == 0:
                 return {
@@ -1223,9 +1373,6 @@ class Plugin:
                     "message": "No orphaned periodic tasks found. Database is clean!"
                 }
             
-            # Get task names before deletion
-            task_names = list(tasks.values_list('name', flat=True))
-            
             # Delete the tasks
             deleted = tasks.delete()
             
@@ -1483,8 +1630,7 @@ class Plugin:
         self._stop_background_scheduler()
         
         # Parse scheduled times
-        scheduled_times_str = settings.get("scheduled_times") or ""
-        scheduled_times_str = scheduled_times_str.strip() if scheduled_times_str else ""
+        scheduled_times_str = self._setting_str(settings, "scheduled_times")
         if not scheduled_times_str:
             LOGGER.info("[Stream-Mapparr] No scheduled times configured, scheduler not started")
             return
@@ -1501,15 +1647,13 @@ class Plugin:
         stop_event = threading.Event()
 
         def scheduler_loop():
-            import pytz
-
             # Get timezone from settings
             tz_str = self._get_system_timezone(settings)
             try:
-                local_tz = pytz.timezone(tz_str)
+                local_tz = _pytz_timezone(tz_str)
             except pytz.exceptions.UnknownTimeZoneError:
                 LOGGER.error(f"[Stream-Mapparr] Unknown timezone: {tz_str}, falling back to {PluginConfig.DEFAULT_TIMEZONE}")
-                local_tz = pytz.timezone(PluginConfig.DEFAULT_TIMEZONE)
+                local_tz = _pytz_timezone(PluginConfig.DEFAULT_TIMEZONE)
 
             # Initialize last run tracker to prevent immediate execution
             # when scheduler starts at a time that matches a scheduled time
@@ -1557,11 +1701,11 @@ class Plugin:
                                     # Get scheduled task settings
                                     do_sort = settings.get('scheduled_sort_streams', False)
                                     if isinstance(do_sort, str):
-                                        do_sort = do_sort.lower() in ('true', 'yes', '1')
+                                        do_sort = do_sort.lower() in _TRUTHY_STRINGS
                                     
                                     do_match = settings.get('scheduled_match_streams', True)
                                     if isinstance(do_match, str):
-                                        do_match = do_match.lower() in ('true', 'yes', '1')
+                                        do_match = do_match.lower() in _TRUTHY_STRINGS
                                     
                                     step = 2
                                     total_steps = (2 if do_sort else 0) + (1 if do_match else 0) + 1
@@ -1707,19 +1851,27 @@ class Plugin:
             return None
 
     def _get_channel_databases(self):
-        """Scan for channel database files and return metadata for each."""
+        """Scan for channel database files and return metadata for each.
+
+        The scan parses every *_channels.json just to read its label, so the
+        result is cached against the (path, mtime_ns, size) of each file and
+        only rebuilt when a database is added, removed or changed.
+        """
         plugin_dir = os.path.dirname(__file__)
         databases = []
         try:
             from glob import glob
             pattern = os.path.join(plugin_dir, '*_channels.json')
             channel_files = sorted(glob(pattern))
+            fingerprint = self._files_fingerprint(channel_files)
+            cached = getattr(self, '_channel_databases_cache', None)
+            if cached is not None and cached[0] == fingerprint:
+                return [dict(db) for db in cached[1]]
             for channel_file in channel_files:
                 try:
                     filename = os.path.basename(channel_file)
                     country_code = filename.split('_')[0].upper()
-                    with open(channel_file, 'r', encoding='utf-8') as f:
-                        file_data = json.load(f)
+                    file_data = _load_json_path(channel_file)
                     if isinstance(file_data, dict) and 'country_code' in file_data:
                         country_name = file_data.get('country_name', filename)
                         version = file_data.get('version', '')
@@ -1733,15 +1885,28 @@ class Plugin:
                     continue
             if len(databases) == 1:
                 databases[0]['default'] = True
+            self._channel_databases_cache = (fingerprint, [dict(db) for db in databases])
         except Exception as e:
             LOGGER.error(f"[Stream-Mapparr] Error scanning for channel databases: {e}")
         return databases
 
+    @staticmethod
+    def _files_fingerprint(paths):
+        """((path, mtime_ns, size), ...) for paths; (path, None, None) if unreadable."""
+        fingerprint = []
+        for path in paths:
+            try:
+                st = os.stat(path)
+                fingerprint.append((path, st.st_mtime_ns, st.st_size))
+            except OSError:
+                fingerprint.append((path, None, None))
+        return tuple(fingerprint)
+
     def _get_bool_setting(self, settings, key, default=False):
         """Coerce a setting that may be a bool or a string ('true'/'yes'/'1', case-insensitive)."""
         val = settings.get(key, default)
         if isinstance(val, str):
-            return val.strip().lower() in ("true", "yes", "1")
+            return val.strip().lower() in _TRUTHY_STRINGS
         return bool(val)
 
     def _should_auto_match_on_refresh(self, settings):
@@ -1806,10 +1971,10 @@ class Plugin:
         ir = settings.get("ignore_regional_tags", PluginConfig.DEFAULT_IGNORE_REGIONAL_TAGS)
         ig = settings.get("ignore_geographic_tags", PluginConfig.DEFAULT_IGNORE_GEOGRAPHIC_TAGS)
         im = settings.get("ignore_misc_tags", PluginConfig.DEFAULT_IGNORE_MISC_TAGS)
-        if isinstance(iq, str): iq = iq.lower() in ('true', 'yes', '1')
-        if isinstance(ir, str): ir = ir.lower() in ('true', 'yes', '1')
-        if isinstance(ig, str): ig = ig.lower() in ('true', 'yes', '1')
-        if isinstance(im, str): im = im.lower() in ('true', 'yes', '1')
+        if isinstance(iq, str): iq = iq.lower() in _TRUTHY_STRINGS
+        if isinstance(ir, str): ir = ir.lower() in _TRUTHY_STRINGS
+        if isinstance(ig, str): ig = ig.lower() in _TRUTHY_STRINGS
+        if isinstance(im, str): im = im.lower() in _TRUTHY_STRINGS
         return bool(iq), bool(ir), bool(ig), bool(im)
 
     def _resolve_prioritize_quality(self, settings):
@@ -1824,14 +1989,14 @@ class Plugin:
         """
         value = settings.get('prioritize_quality', PluginConfig.DEFAULT_PRIORITIZE_QUALITY)
         if isinstance(value, str):
-            value = value.lower() in ('true', 'yes', '1')
+            value = value.lower() in _TRUTHY_STRINGS
         return bool(value)
 
     def _resolve_allow_same_name_streams(self, settings):
         """Resolve the opt-in 'allow_same_name_streams' toggle (bug-140)."""
         value = settings.get('allow_same_name_streams', PluginConfig.DEFAULT_ALLOW_SAME_NAME_STREAMS)
         if isinstance(value, str):
-            value = value.lower() in ('true', 'yes', '1')
+            value = value.lower() in _TRUTHY_STRINGS
         return bool(value)
 
     def _resolve_enabled_databases(self, settings):
@@ -1851,7 +2016,7 @@ class Plugin:
             setting_key = f"db_enabled_{db_info['id']}"
             val = settings.get(setting_key, db_info['default'])
             if isinstance(val, str):
-                val = val.lower() in ('true', 'yes', '1')
+                val = val.lower() in _TRUTHY_STRINGS
             if val:
                 enabled.add(db_info['id'])
         return enabled if enabled else None
@@ -1863,7 +2028,7 @@ class Plugin:
         Degrade-don't-fail: never raises. Empty/absent setting -> ([], [])."""
         cfg = PluginConfig
         settings = settings if isinstance(settings, dict) else {}
-        raw = (settings.get("stream_name_regex_rules") or "").strip()
+        raw = self._setting_str(settings, "stream_name_regex_rules")
         if not raw:
             return [], []
         try:
@@ -1957,7 +2122,7 @@ class Plugin:
             for k, v in ALIAS_COUNTRY_OVERRIDES.get(str(country).upper(), {}).items():
                 alias_map[k] = list(dict.fromkeys(alias_map.get(k, []) + list(v)))
 
-        custom_str = (settings.get("custom_aliases") or "").strip()
+        custom_str = self._setting_str(settings, "custom_aliases")
         if custom_str:
             try:
                 custom = json.loads(custom_str)
@@ -2024,16 +2189,39 @@ class Plugin:
     # ORM HELPER METHODS - Direct database access (replaces HTTP API methods)
     # =========================================================================
 
+    def _cached_lookup_rows(self, key, fetch):
+        """Memoize a small lookup-table query (profiles, groups, M3U accounts).
+
+        Validation and the action that follows it read the same tables; the
+        rows are kept for LOOKUP_QUERY_CACHE_TTL_SECONDS and dropped by
+        _reset_run_caches(), so scheduled entry points that skip run() still
+        see fresh rows on their next pass. Returns a new list each call.
+        """
+        cache = getattr(self, '_lookup_rows_cache', None)
+        if cache is None:
+            cache = self._lookup_rows_cache = {}
+        now = time.monotonic()
+        entry = cache.get(key)
+        if entry is None or now >= entry[0]:
+            entry = cache[key] = (now + PluginConfig.LOOKUP_QUERY_CACHE_TTL_SECONDS, fetch())
+        return list(entry[1])
+
     def _get_all_profiles(self, logger):
         """Fetch all channel profiles via Django ORM."""
-        return list(ChannelProfile.objects.all().values('id', 'name'))
+        return self._cached_lookup_rows(
+            'profiles', lambda: list(ChannelProfile.objects.all().values('id', 'name')))
 
     def _get_all_groups(self, logger):
         """Fetch all channel groups via Django ORM."""
-        return list(ChannelGroup.objects.all().values('id', 'name'))
+        return self._cached_lookup_rows(
+            'groups', lambda: list(ChannelGroup.objects.all().values('id', 'name')))
 
-    def _get_all_channels(self, logger):
-        """Fetch all channels via Django ORM."""
+    def _get_all_channels(self, logger, channel_ids=None):
+        """Fetch all channels via Django ORM.
+
+        channel_ids, when given (a list or a values() subquery), restricts the
+        query to those channels so profile/group filtering happens in SQL.
+        """
         fields = ['id', 'name', 'channel_number', 'channel_group_id', 'channel_group__name']
         # Include attached_channel_id if the model has it (used by visibility management)
         try:
@@ -2041,19 +2229,32 @@ class Plugin:
             fields.append('attached_channel_id')
         except Exception:
             pass
-        return list(Channel.objects.select_related('channel_group').all().values(*fields))
+        queryset = Channel.objects.select_related('channel_group').all()
+        if channel_ids is not None:
+            queryset = queryset.filter(id__in=channel_ids)
+        return list(queryset.values(*fields))
+
+    def _get_all_streams(self, logger, channel_group_ids=None, m3u_account_ids=None):
+        """Fetch all streams via Django ORM, returning dicts compatible with existing processing logic.
 
-    def _get_all_streams(self, logger):
-        """Fetch all streams via Django ORM, returning dicts compatible with existing processing logic."""
+        channel_group_ids / m3u_account_ids, when given, restrict the query to
+        those stream groups / M3U accounts so the filtering happens in SQL.
+        """
+        queryset = Stream.objects.all()
+        if channel_group_ids is not None:
+            queryset = queryset.filter(channel_group_id__in=channel_group_ids)
+        if m3u_account_ids is not None:
+            queryset = queryset.filter(m3u_account_id__in=m3u_account_ids)
         # 'url' is fetched for the allow_same_name_streams dedup key (bug-140).
-        return list(Stream.objects.all().values(
+        return list(queryset.values(
             'id', 'name', 'm3u_account', 'url', 'channel_group', 'channel_group__name'
         ))
 
     def _get_all_m3u_accounts(self, logger):
         """Fetch all M3U accounts via Django ORM."""
         from apps.m3u.models import M3UAccount
-        return list(M3UAccount.objects.all().values('id', 'name'))
+        return self._cached_lookup_rows(
+            'm3u_accounts', lambda: list(M3UAccount.objects.all().values('id', 'name')))
 
     def _get_stream_groups(self, logger):
         """Fetch distinct stream group titles via Django ORM."""
@@ -2074,6 +2275,45 @@ class Plugin:
             logger.warning(f"[Stream-Mapparr] Could not trigger frontend refresh: {e}")
         return False
 
+    @staticmethod
+    def _profiles_by_lower_name(profiles):
+        """Case-insensitive profile-name index; the first profile wins on a clash."""
+        by_name = {}
+        for profile in profiles:
+            by_name.setdefault(profile.get('name', '').lower(), profile)
+        return by_name
+
+    @staticmethod
+    def _name_to_id(rows):
+        """name -> id index over lookup rows; rows missing either key are skipped
+        and a later duplicate name wins, as with a dict comprehension."""
+        index = {}
+        for row in rows:
+            name = row.get('name')
+            row_id = row.get('id')
+            if name is not None and row_id is not None:
+                index[name] = row_id
+        return index
+
+    @staticmethod
+    def _m3u_priority_map(m3u_ids):
+        """M3U account id -> priority (0 = highest) in selection order. The map
+        doubles as the membership set; an id listed twice keeps its first slot."""
+        priority_map = {}
+        for m3u_id in m3u_ids:
+            priority_map.setdefault(m3u_id, len(priority_map))
+        return priority_map
+
+    @staticmethod
+    def _setting_str(settings, key, default=""):
+        """Stripped string value of a text setting; ``default`` when unset or blank."""
+        value = settings.get(key)
+        if isinstance(value, str):
+            value = value.strip()
+            if value:
+                return value
+        return default
+
     @staticmethod
     def _parse_tags(tags_str):
         """Parse comma-separated tags with support for quoted strings."""
@@ -2191,9 +2431,27 @@ class Plugin:
 
     def _clean_channel_name(self, name, ignore_tags=None, ignore_quality=True, ignore_regional=True,
                            ignore_geographic=True, ignore_misc=True, remove_cinemax=False, remove_country_prefix=False):
-        """Remove brackets and their contents from channel name for matching, and remove ignore tags."""
+        """Remove brackets and their contents from channel name for matching, and remove ignore tags.
+
+        Results are memoized for the run (the same channel and stream names are
+        cleaned with the same flags by grouping, matching, threshold analysis and
+        zone routing); _reset_run_caches() clears the memo.
+        """
+        cache = getattr(self, '_clean_name_cache', None)
+        if cache is None:
+            cache = self._clean_name_cache = {}
+        key = (name, tuple(ignore_tags) if ignore_tags else (), ignore_quality, ignore_regional,
+               ignore_geographic, ignore_misc, remove_cinemax, remove_country_prefix,
+               self.fuzzy_matcher is None)
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        except TypeError:  # unhashable name (defensive) - clean without memoizing
+            key = None
+
         if self.fuzzy_matcher:
-            return self.fuzzy_matcher.normalize_name(
+            cleaned = self.fuzzy_matcher.normalize_name(
                 name, ignore_tags,
                 ignore_quality=ignore_quality,
                 ignore_regional=ignore_regional,
@@ -2202,8 +2460,14 @@ class Plugin:
                 remove_cinemax=remove_cinemax,
                 remove_country_prefix=remove_country_prefix
             )
+        else:
+            cleaned = self._basic_clean_channel_name(name, ignore_tags, remove_country_prefix)
+        if key is not None:
+            cache[key] = cleaned
+        return cleaned
 
-        # Fallback to basic cleaning
+    def _basic_clean_channel_name(self, name, ignore_tags=None, remove_country_prefix=False):
+        """Regex-only cleaner used when the fuzzy matcher is unavailable."""
         if ignore_tags is None:
             ignore_tags = []
 
@@ -2226,32 +2490,106 @@ class Plugin:
                 break
             cleaned = new_cleaned
 
-        # Remove ignore tags
-        for tag in ignore_tags:
-            if '[' in tag or ']' in tag or '(' in tag or ')' in tag:
-                escaped_tag = re.escape(tag)
-                cleaned = re.sub(r'\s*' + escaped_tag + r'\s*', ' ', cleaned, flags=re.IGNORECASE)
-            else:
-                cleaned = re.sub(r'\b' + re.escape(tag) + r'\b', '', cleaned, flags=re.IGNORECASE)
+        # Remove ignore tags (one compiled alternation per kind, cached per tag set)
+        if ignore_tags:
+            word_re, bracket_re = _ignore_tag_patterns(tuple(ignore_tags))
+            if bracket_re:
+                cleaned = bracket_re.sub(' ', cleaned)
+            if word_re:
+                cleaned = word_re.sub('', cleaned)
 
         return cleaned.strip()
 
+    def _stream_artifact_lookup(self, ignore_tags, ignore_quality=True, ignore_regional=True,
+                                ignore_geographic=True, ignore_misc=True, remove_cinemax=False):
+        """Return a name -> _StreamArtifacts lookup for one cleaning-flag
+        combination, memoized for the run.
+
+        Every channel is matched against the same stream list, so cleaning and
+        tokenizing each stream name once per run (instead of once per channel,
+        plus again for the cleaned_stream_names result) removes most of the
+        regex work. Reset by _reset_run_caches().
+        """
+        caches = getattr(self, '_stream_artifact_cache', None)
+        if caches is None:
+            caches = self._stream_artifact_cache = {}
+        flags = (tuple(ignore_tags or ()), ignore_quality, ignore_regional,
+                 ignore_geographic, ignore_misc, remove_cinemax)
+        table = caches.setdefault(flags, {})
+
+        def lookup(name):
+            artifacts = table.get(name)
+            if artifacts is None:
+                cleaned = self._clean_channel_name(
+                    name, ignore_tags, ignore_quality, ignore_regional,
+                    ignore_geographic, ignore_misc, remove_cinemax=remove_cinemax)
+                cleaned_lower = cleaned.lower() if cleaned else ''
+                tokens = frozenset(cleaned_lower.split())
+                artifacts = _StreamArtifacts(
+                    cleaned, cleaned_lower, tokens,
+                    frozenset(t for t in tokens if len(t) > 1),
+                    frozenset(t for t in tokens if t.isdigit()), _token_signature(tokens))
+                table[name] = artifacts
+            return artifacts
+        return lookup
+
+    def _stream_words_lower(self, name):
+        """Lowercased maximal \\w+ runs of a stream name, memoized for the run.
+
+        For a callsign that is itself a single word, `\\b<callsign>\\b` (case-
+        insensitive) matches exactly when the callsign is one of these words, so
+        OTA channels test set membership instead of running a regex over every
+        stream name for every channel.
+        """
+        cache = getattr(self, '_stream_words_cache', None)
+        if cache is None:
+            cache = self._stream_words_cache = {}
+        words = cache.get(name)
+        if words is None:
+            words = cache[name] = frozenset(w.lower() for w in _WORD_RE.findall(name))
+        return words
+
+    @staticmethod
+    def _ota_callsign_stream_index(streams, callsigns):
+        """base callsign -> streams (in input order) whose name has it as a whole
+        word, for every callsign in `callsigns`.
+
+        `\\b<callsign>(?:-[A-Z]{2}\\d?)?\\b` matches a single-word callsign
+        exactly when it is one of the name's maximal \\w+ runs (the optional
+        suffix always starts after a non-word '-'), so one pass over the streams
+        replaces a regex scan of every stream for every channel.
+        """
+        index = defaultdict(list)
+        for stream in streams:
+            for word in set(_WORD_RE.findall(_mname(stream))):
+                if word in callsigns:
+                    index[word].append(stream)
+        return index
+
+    def _callsign_stream_filter(self, callsign):
+        """Predicate(name) -> bool equivalent to a case-insensitive
+        `\\b<callsign>\\b` search; word-set lookup for plain callsigns, the
+        compiled regex for anything else (e.g. 'WFAA-TV')."""
+        if _WORD_RE.fullmatch(callsign):
+            callsign_lower = callsign.lower()
+            return lambda name: callsign_lower in self._stream_words_lower(name)
+        return _word_boundary_pattern(callsign).search
+
     def _extract_quality(self, stream_name):
         """Extract quality indicator from stream name."""
+        stream_lower = stream_name.lower()
         for quality in self.STREAM_QUALITY_ORDER:
             if quality in ["(H)", "(F)", "(D)"]:
                 if quality in stream_name:
                     return quality
             else:
-                quality_clean = quality.strip('[]()').strip()
-                patterns = [
-                    rf'\[{re.escape(quality_clean)}\]',
-                    rf'\({re.escape(quality_clean)}\)',
-                    rf'\b{re.escape(quality_clean)}\b'
-                ]
-                for pattern in patterns:
-                    if re.search(pattern, stream_name, re.IGNORECASE):
-                        return quality
+                # Bracketed forms are plain substring checks; only the bare-word
+                # form needs the (cached) word-boundary regex.
+                quality_lower = quality.strip('[]()').strip().lower()
+                if f'[{quality_lower}]' in stream_lower or f'({quality_lower})' in stream_lower:
+                    return quality
+                if _word_boundary_pattern(quality_lower).search(stream_name):
+                    return quality
         return None
 
     # Country/region aliases. Maps whatever string forms appear in channel group
@@ -2354,16 +2692,9 @@ class Plugin:
 
     def _extract_channel_quality_tag(self, channel_name):
         """Extract quality tag from channel name for prioritization."""
-        for tag in self.CHANNEL_QUALITY_TAG_ORDER:
-            if tag == "":
-                has_tag = False
-                for check_tag in self.CHANNEL_QUALITY_TAG_ORDER[:-1]:  # Exclude blank
-                    if check_tag in channel_name:
-                        has_tag = True
-                        break
-                if not has_tag:
-                    return ""
-            elif tag in channel_name:
+        # The blank sentinel is the fallback: reached only when no real tag is present.
+        for tag in self._NON_BLANK_QUALITY_TAGS:
+            if tag in channel_name:
                 return tag
         return ""
 
@@ -2539,11 +2870,10 @@ class Plugin:
         path = PluginConfig.THROUGHPUT_CACHE_FILE
         try:
             if os.path.exists(path):
-                with open(path, 'r') as f:
-                    data = json.load(f)
-                    if isinstance(data, dict):
-                        self._throughput_cache = data
-                        return
+                data = _load_json_path(path)
+                if isinstance(data, dict):
+                    self._throughput_cache = data
+                    return
         except Exception as e:
             LOGGER.warning(f"[Stream-Mapparr] Could not load throughput cache: {e}")
         self._throughput_cache = {}
@@ -2675,6 +3005,16 @@ class Plugin:
             pass
         return PluginConfig.DEFAULT_PROBE_USER_AGENT
 
+    def _reset_run_caches(self):
+        """Drop per-run memoization so a long-lived (singleton) plugin instance
+        doesn't carry stale DB state from one action/scheduled run into the next."""
+        self._stream_health_cache = {}
+        self._stream_artifact_cache = {}
+        self._clean_name_cache = {}
+        self._stream_words_cache = {}
+        self._lookup_rows_cache = {}
+        self._group_key_cache = None
+
     def _filter_working_streams(self, streams, logger):
         """
         Filter out dead streams (0x0 resolution) based on IPTV Checker metadata.
@@ -2689,49 +3029,61 @@ class Plugin:
         working_streams = []
         dead_count = 0
         no_metadata_count = 0
-        
+
+        # Per-run memo of IPTV Checker metadata: _match_streams_to_channel calls
+        # this once per channel with the same stream list, so only ids not seen
+        # yet this run hit the DB (one IN query instead of one query per stream).
+        # Reset by _reset_run_caches() at each entry point.
+        health_cache = getattr(self, '_stream_health_cache', None)
+        if health_cache is None:
+            health_cache = self._stream_health_cache = {}
+        ids_missing = [s['id'] for s in streams if s['id'] not in health_cache]
+        if ids_missing:
+            try:
+                for stream_id, width, height in Stream.objects.filter(
+                        id__in=ids_missing).values_list('id', 'width', 'height'):
+                    health_cache[stream_id] = (width, height)
+                # Not in the DB reads the same as "not checked yet" (both included)
+                for stream_id in ids_missing:
+                    health_cache.setdefault(stream_id, (None, None))
+            except Exception as e:
+                # Error checking streams - include them (benefit of doubt)
+                logger.warning(f"[Stream-Mapparr] Error checking stream health: {e}, including streams")
+
         for stream in streams:
             stream_id = stream['id']
             stream_name = stream.get('name', 'Unknown')
-            
-            try:
-                # Query Stream model for IPTV Checker metadata
-                stream_obj = Stream.objects.filter(id=stream_id).first()
-                
-                if not stream_obj:
-                    # Stream not in database - include it (benefit of doubt)
-                    working_streams.append(stream)
-                    no_metadata_count += 1
-                    continue
-                
-                # Check if stream has been marked dead by IPTV Checker
-                # IPTV Checker stores width and height as 0 for dead streams
-                width = getattr(stream_obj, 'width', None)
-                height = getattr(stream_obj, 'height', None)
-                
-                # If width or height is None, IPTV Checker hasn't checked this stream yet
-                if width is None or height is None:
-                    # No metadata yet - include it (benefit of doubt)
-                    working_streams.append(stream)
-                    no_metadata_count += 1
-                    continue
-                
-                # Check if stream is dead (0x0 resolution)
-                if width == 0 or height == 0:
-                    # Dead stream - skip it
-                    dead_count += 1
-                    logger.debug(f"[Stream-Mapparr] Filtered dead stream: '{stream_name}' (ID: {stream_id}, resolution: {width}x{height})")
-                    continue
-                
-                # Working stream - include it
+
+            if stream_id not in health_cache:
+                # Metadata lookup failed - include it (benefit of doubt)
                 working_streams.append(stream)
-                logger.debug(f"[Stream-Mapparr] Working stream: '{stream_name}' (ID: {stream_id}, resolution: {width}x{height})")
-                
-            except Exception as e:
-                # Error checking stream - include it (benefit of doubt)
-                logger.warning(f"[Stream-Mapparr] Error checking stream {stream_id} health: {e}, including stream")
+                no_metadata_count += 1
+                continue
+
+            # Check if stream has been marked dead by IPTV Checker
+            # IPTV Checker stores width and height as 0 for dead streams
+            width, height = health_cache[stream_id]
+
+            # If width or height is None, IPTV Checker hasn't checked this stream yet
+            if width is None or height is None:
+                # No metadata yet - include it (benefit of doubt)
                 working_streams.append(stream)
-        
+                no_metadata_count += 1
+                continue
+
+            # Check if stream is dead (0x0 resolution)
+            if width == 0 or height == 0:
+                # Dead stream - skip it
+                dead_count += 1
+                logger.debug("[Stream-Mapparr] Filtered dead stream: '%s' (ID: %s, resolution: %sx%s)",
+                             stream_name, stream_id, width, height)
+                continue
+
+            # Working stream - include it
+            working_streams.append(stream)
+            logger.debug("[Stream-Mapparr] Working stream: '%s' (ID: %s, resolution: %sx%s)",
+                         stream_name, stream_id, width, height)
+
         # Log summary
         if dead_count > 0:
             logger.info(f"[Stream-Mapparr] Filtered out {dead_count} dead streams with 0x0 resolution")
@@ -2760,7 +3112,7 @@ class Plugin:
         """
         wait_enabled = settings.get('wait_for_iptv_checker', PluginConfig.DEFAULT_WAIT_FOR_IPTV_CHECKER)
         if isinstance(wait_enabled, str):
-            wait_enabled = wait_enabled.lower() in ('true', 'yes', '1')
+            wait_enabled = wait_enabled.lower() in _TRUTHY_STRINGS
         
         if not wait_enabled:
             logger.debug("[Stream-Mapparr] Wait for IPTV Checker disabled, proceeding immediately")
@@ -2862,11 +3214,17 @@ class Plugin:
         Returns:
             List of deduplicated stream dictionaries
         """
-        seen_keys = set()
-        deduplicated = []
+        if len(streams) < 2:
+            return [stream for stream in streams if stream.get('name', '')]
+
+        # Insertion-ordered dict: setdefault keeps the FIRST stream per key
+        # (the best one, since dedup runs after the quality sort).
+        deduplicated = {}
 
         for stream in streams:
             stream_name = stream.get('name', '')
+            if not stream_name:
+                continue
             # Key on (name, M3U account) so the same name from two different
             # sources both survive. Streams without an account share the key
             # (name, None), which is fine for non-M3U streams.
@@ -2875,14 +3233,18 @@ class Plugin:
                 # Missing/blank url degrades to the legacy key (None), so a dict
                 # without a url cannot masquerade as a distinct feed.
                 dedup_key = dedup_key + (stream.get('url') or None,)
-            if stream_name and dedup_key not in seen_keys:
-                seen_keys.add(dedup_key)
-                deduplicated.append(stream)
+            deduplicated.setdefault(dedup_key, stream)
 
-        return deduplicated
+        return list(deduplicated.values())
 
     def _load_channels_data(self, logger, settings=None):
-        """Load channel data from enabled *_channels.json files."""
+        """Load channel data from enabled *_channels.json files.
+
+        The merged list is kept on the instance against the (path, mtime_ns,
+        size) of each enabled file and handed back as the same list while none
+        of them change, so the name indexes built over it are reused too.
+        Callers treat it as read-only.
+        """
         plugin_dir = os.path.dirname(__file__)
         channels_data = []
 
@@ -2903,41 +3265,62 @@ class Plugin:
                 logger.warning("[Stream-Mapparr] No channel databases are enabled. Please enable at least one database in settings.")
                 return channels_data
 
-            for db_info in enabled_databases:
-                channel_file = db_info['file_path']
-                db_label = db_info['label']
-                country_code = db_info['id']
-
-                try:
-                    with open(channel_file, 'r', encoding='utf-8') as f:
-                        file_data = json.load(f)
-
-                    if isinstance(file_data, dict) and 'channels' in file_data:
-                        channels_list = file_data['channels']
-                        for channel in channels_list:
-                            channel['_country_code'] = country_code
-                    elif isinstance(file_data, list):
-                        channels_list = file_data
-                        for channel in channels_list:
-                            channel['_country_code'] = country_code
-                    else:
-                        logger.error(f"[Stream-Mapparr] Invalid format in {channel_file}")
-                        continue
+            fingerprint = self._files_fingerprint(db_info['file_path'] for db_info in enabled_databases)
+            cached = getattr(self, '_channels_data_cache', None)
+            if cached is not None and cached[0] == fingerprint:
+                logger.debug("[Stream-Mapparr] Reusing %d channels from unchanged channel database(s)", len(cached[1]))
+                return cached[1]
+
+            # Files are independent, so read+parse them in parallel. map() keeps
+            # the enabled-database order: _get_channel_info_from_json is
+            # first-match-wins, so results must not be merged in completion order.
+            workers = min(PluginConfig.CHANNEL_DB_LOAD_WORKERS, len(enabled_databases))
+            if workers > 1:
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    loaded = list(pool.map(lambda db: self._read_channel_database(db, logger),
+                                           enabled_databases))
+            else:
+                loaded = [self._read_channel_database(db, logger) for db in enabled_databases]
 
+            for channels_list in loaded:
+                if channels_list:
                     channels_data.extend(channels_list)
-                    logger.debug(f"[Stream-Mapparr] Loaded {len(channels_list)} channels from {db_label}")
-
-                except Exception as e:
-                    logger.error(f"[Stream-Mapparr] Error loading {channel_file}: {e}")
 
             db_names = [db_info['label'] for db_info in enabled_databases]
             logger.info(f"[Stream-Mapparr] Loaded total of {len(channels_data)} channels from {len(enabled_databases)} enabled database(s): {', '.join(db_names)}")
+            self._channels_data_cache = (fingerprint, channels_data)
 
         except Exception as e:
             logger.error(f"[Stream-Mapparr] Error loading channel data files: {e}")
 
         return channels_data
 
+    def _read_channel_database(self, db_info, logger):
+        """Read one enabled *_channels.json and tag each entry with its
+        _country_code. Returns the channel list, or None on a bad file (the
+        error is logged here so one broken database doesn't sink the rest)."""
+        channel_file = db_info['file_path']
+        country_code = db_info['id']
+        try:
+            file_data = _load_json_path(channel_file)
+
+            if isinstance(file_data, dict) and 'channels' in file_data:
+                channels_list = file_data['channels']
+            elif isinstance(file_data, list):
+                channels_list = file_data
+            else:
+                logger.error(f"[Stream-Mapparr] Invalid format in {channel_file}")
+                return None
+            for channel in channels_list:
+                channel['_country_code'] = country_code
+
+            logger.debug("[Stream-Mapparr] Loaded %d channels from %s", len(channels_list), db_info['label'])
+            return channels_list
+
+        except Exception as e:
+            logger.error(f"[Stream-Mapparr] Error loading {channel_file}: {e}")
+            return None
+
     def _is_ota_channel(self, channel_info):
         """Check if a channel has callsign (indicating it's an OTA broadcast channel)."""
         if not channel_info:
@@ -3072,8 +3455,7 @@ class Plugin:
             return callsign_db
 
         try:
-            with open(stations_path, 'r', encoding='utf-8') as f:
-                stations = json.load(f)
+            stations = _load_json_path(stations_path)
 
             logger.info(f"[Stream-Mapparr] Parsing {len(stations)} stations from networks.json")
 
@@ -3087,16 +3469,17 @@ class Plugin:
                 if not base_callsign:
                     continue
 
-                # First occurrence wins (primary station for the callsign).
-                if base_callsign not in callsign_db:
-                    network = (station.get('network_affiliation') or '').strip()
-                    city = (station.get('community_served_city') or '').title()
-                    state = (station.get('community_served_state') or '').upper()
-                    callsign_db[base_callsign] = {
-                        'base_name': f"{callsign} ({network}) {city} {state}".strip(),
-                        'category': network,
-                        'type': 'broadcast (OTA)',
-                    }
+                # First occurrence wins (primary station for the callsign):
+                # setdefault is a single probe, and repeat base callsigns are rare
+                # enough that building a discarded entry for them costs less.
+                network = (station.get('network_affiliation') or '').strip()
+                city = (station.get('community_served_city') or '').title()
+                state = (station.get('community_served_state') or '').upper()
+                callsign_db.setdefault(base_callsign, {
+                    'base_name': f"{callsign} ({network}) {city} {state}".strip(),
+                    'category': network,
+                    'type': 'broadcast (OTA)',
+                })
 
             logger.info(f"[Stream-Mapparr] Built US callsign database with {len(callsign_db)} unique callsigns")
             return callsign_db
@@ -3193,17 +3576,24 @@ class Plugin:
                     )
                     working_streams = same_country_streams
 
-        channel_info = self._get_channel_info_from_json(channel_name, channels_data, logger)
+        channel_name_lower = channel_name.lower()
+        channel_info = self._get_channel_info_from_json(
+            channel_name, channels_data, logger, channel_name_lower=channel_name_lower)
         database_used = channel_info.get('_country_code', 'N/A') if channel_info else 'N/A'
-        channel_has_max = 'max' in channel_name.lower()
+        channel_has_max = 'max' in channel_name_lower
 
         cleaned_channel_name = self._clean_channel_name(
             channel_name, ignore_tags, ignore_quality, ignore_regional,
             ignore_geographic, ignore_misc
         )
+        cleaned_channel_lower = cleaned_channel_name.lower() if cleaned_channel_name else ''
+
+        stream_artifacts = self._stream_artifact_lookup(
+            ignore_tags, ignore_quality, ignore_regional, ignore_geographic,
+            ignore_misc, remove_cinemax=channel_has_max)
 
-        if "24/7" in channel_name.lower():
-            logger.debug(f"[Stream-Mapparr] Cleaned channel name for matching: {cleaned_channel_name}")
+        if "24/7" in channel_name_lower:
+            logger.debug("[Stream-Mapparr] Cleaned channel name for matching: %s", cleaned_channel_name)
 
         # Determine the OTA callsign for this channel. Prefer the database
         # entry, but fall back to a callsign carried in parentheses in the
@@ -3216,14 +3606,14 @@ class Plugin:
             callsign = self._resolve_ota_callsign(channel_name)
 
         if callsign:
-            logger.debug(f"[Stream-Mapparr] Matching OTA channel: {channel_name} using callsign: {callsign}")
+            logger.debug("[Stream-Mapparr] Matching OTA channel: %s using callsign: %s", channel_name, callsign)
 
             matching_streams = []
-            callsign_pattern = r'\b' + re.escape(callsign) + r'\b'
+            has_callsign = self._callsign_stream_filter(callsign)
             needs_corroboration = self._callsign_needs_corroboration(callsign)
 
             for stream in working_streams:
-                if re.search(callsign_pattern, _mname(stream), re.IGNORECASE):
+                if has_callsign(_mname(stream)):
                     if needs_corroboration and not self._callsign_corroborated(_mname(stream), callsign):
                         logger.debug(
                             f"[Stream-Mapparr] Dropping uncorroborated common-word "
@@ -3234,21 +3624,11 @@ class Plugin:
             if matching_streams:
                 sorted_streams = self._sort_streams_by_quality(matching_streams)
                 sorted_streams = self._deduplicate_streams(sorted_streams, allow_same_name_streams)
-                cleaned_stream_names = [self._clean_channel_name(
-                    _mname(s), ignore_tags, ignore_quality, ignore_regional,
-                    ignore_geographic, ignore_misc, remove_cinemax=channel_has_max
-                ) for s in sorted_streams]
+                cleaned_stream_names = [stream_artifacts(_mname(s)).cleaned for s in sorted_streams]
                 return sorted_streams, cleaned_channel_name, cleaned_stream_names, "Callsign match", database_used
 
         # Use fuzzy matching if available
         if self.fuzzy_matcher:
-            stream_names = [_mname(stream) for stream in working_streams]
-            matched_stream_name, score, match_type = self.fuzzy_matcher.fuzzy_match(
-                channel_name, stream_names, ignore_tags, remove_cinemax=channel_has_max,
-                ignore_quality=ignore_quality, ignore_regional=ignore_regional,
-                ignore_geographic=ignore_geographic, ignore_misc=ignore_misc
-            )
-
             # Alias force-include: exact-normalized alias hits bypass the
             # channel-name re-match filter below (an alias-only stream has low
             # name similarity by design). Collected independently of the fuzzy
@@ -3258,127 +3638,143 @@ class Plugin:
                 ignore_regional, ignore_geographic, ignore_misc)
             alias_ids = {id(s) for s in alias_streams}
 
-            if matched_stream_name or alias_streams:
-                matching_streams = list(alias_streams)
-
-                # Clean the channel name for comparison
-                cleaned_channel_for_matching = self._clean_channel_name(
-                    channel_name, ignore_tags, ignore_quality, ignore_regional,
-                    ignore_geographic, ignore_misc, remove_cinemax=channel_has_max
-                )
+            # The re-match scan below decides which streams are returned; the
+            # whole-list fuzzy_match() only gates the result and labels it. Run
+            # the cheap scan first and skip fuzzy_match() when it finds nothing,
+            # which is the common case for channels with no stream in the list.
+            matching_streams = list(alias_streams)
 
-                # Match streams against the CHANNEL name, not just the best-matched stream
-                # This allows collecting all streams that are similar to the channel
-                for stream in working_streams:
-                    if id(stream) in alias_ids:
-                        continue  # already force-included via alias
-                    cleaned_stream = self._clean_channel_name(
-                        _mname(stream), ignore_tags, ignore_quality, ignore_regional,
-                        ignore_geographic, ignore_misc, remove_cinemax=channel_has_max
-                    )
-
-                    if not cleaned_stream or len(cleaned_stream) < 2: continue
-                    if not cleaned_channel_for_matching or len(cleaned_channel_for_matching) < 2: continue
+            # Clean the channel name for comparison
+            cleaned_channel_for_matching = self._clean_channel_name(
+                channel_name, ignore_tags, ignore_quality, ignore_regional,
+                ignore_geographic, ignore_misc, remove_cinemax=channel_has_max
+            )
 
-                    # Check if stream is similar enough to channel using fuzzy matcher's logic
-                    stream_lower = cleaned_stream.lower()
-                    channel_lower = cleaned_channel_for_matching.lower()
-                    
-                    # Exact match
-                    if stream_lower == channel_lower:
+            channel_lower = cleaned_channel_for_matching.lower() if cleaned_channel_for_matching else ''
+            channel_token_set = frozenset(channel_lower.split())
+            channel_token_sig = _token_signature(channel_token_set)
+            threshold_ratio = self.fuzzy_matcher.match_threshold / 100.0
+
+            # Everything the token-overlap test needs from the channel side is
+            # loop-invariant, so it is computed once here rather than per stream.
+            # CRITICAL FIX: For channels with numeric suffixes (like "Premier Sports 1", "Sky Sports 1"),
+            # we must keep single-digit tokens to prevent false matches between numbered channels.
+            # isdecimal() is exactly the \d class, without a regex call.
+            channel_has_numbers = any(c.isdecimal() for c in channel_lower)
+            # Extract numeric tokens from channel name for strict matching
+            channel_number_tokens = {t for t in channel_token_set if t.isdigit()}
+            if channel_has_numbers:
+                # Keep ALL tokens including single digits (1, 2, 3, etc.) for numbered channels
+                # This ensures "Premier Sports 1" requires token "1" to match
+                channel_tokens_filtered = channel_token_set
+            else:
+                # For non-numbered channels, remove single-char tokens but keep 2-char tokens like "al"
+                # This prevents matching on noise like single letters
+                channel_tokens_filtered = frozenset(t for t in channel_token_set if len(t) > 1)
+
+            # A channel name that cleans down to <2 chars can't match any stream
+            streams_to_scan = working_streams if len(channel_lower) >= 2 else ()
+
+            # Match streams against the CHANNEL name, not just the best-matched stream
+            # This allows collecting all streams that are similar to the channel
+            for stream in streams_to_scan:
+                if id(stream) in alias_ids:
+                    continue  # already force-included via alias
+                artifacts = stream_artifacts(_mname(stream))
+                cleaned_stream = artifacts.cleaned
+                stream_lower = artifacts.lower
+                stream_number_tokens = artifacts.number_tokens
+
+                if not cleaned_stream or len(cleaned_stream) < 2: continue
+
+                # Check if stream is similar enough to channel using fuzzy matcher's logic
+                # Exact match
+                if stream_lower == channel_lower:
+                    matching_streams.append(stream)
+                    continue
+                
+                # Substring match: stream contains channel OR channel contains stream
+                if stream_lower in channel_lower or channel_lower in stream_lower:
+                    # CRITICAL FIX: Add length ratio requirement to prevent false positives
+                    # like "story" matching "history" (story is 5 chars, history is 7 chars)
+                    # Require strings to be within 75% of same length for substring match
+                    # This ensures substring matches are semantically meaningful
+                    length_ratio = min(len(stream_lower), len(channel_lower)) / max(len(stream_lower), len(channel_lower))
+                    # When one string contains the other, the Levenshtein distance is
+                    # exactly the length difference, so calculate_similarity() would
+                    # return this same ratio (bug-026 definition) — no DP needed.
+                    if (length_ratio >= 0.75 and length_ratio >= threshold_ratio
+                            and int(length_ratio * 100) >= self.fuzzy_matcher.match_threshold):
                         matching_streams.append(stream)
+                    continue
+
+                # Token-based matching: check if significant tokens overlap
+                # This catches cases like "ca al jazeera" vs "al jazeera english"
+                # A stream sharing no token with the channel can never pass the
+                # overlap test below (filtering only removes tokens), so skip
+                # the set work for the bulk of the catalog up front.
+                if not (artifacts.signature & channel_token_sig) or \
+                        artifacts.tokens.isdisjoint(channel_token_set):
+                    continue
+                stream_tokens = artifacts.tokens
+                channel_tokens = channel_tokens_filtered
+
+                # PREVENT FALSE POSITIVES: If channel contains numbers, stream must also contain matching numbers
+                # This prevents "BBC1" from matching "CBBC", "BBC4" from matching "CBBC", etc.
+                if channel_number_tokens:
+                    # Channel has numbers - stream must have at least one matching number
+                    if not stream_number_tokens:
+                        # Stream has no numbers but channel does - likely false positive, skip
                         continue
-                    
-                    # Substring match: stream contains channel OR channel contains stream
-                    if stream_lower in channel_lower or channel_lower in stream_lower:
-                        # CRITICAL FIX: Add length ratio requirement to prevent false positives
-                        # like "story" matching "history" (story is 5 chars, history is 7 chars)
-                        # Require strings to be within 75% of same length for substring match
-                        # This ensures substring matches are semantically meaningful
-                        length_ratio = min(len(stream_lower), len(channel_lower)) / max(len(stream_lower), len(channel_lower))
-                        if length_ratio >= 0.75:
-                            # Calculate similarity to ensure it meets threshold
-                            similarity = self.fuzzy_matcher.calculate_similarity(
-                                stream_lower, channel_lower,
-                                min_ratio=self.fuzzy_matcher.match_threshold / 100.0)
-                            if int(similarity * 100) >= self.fuzzy_matcher.match_threshold:
-                                matching_streams.append(stream)
+                    if not channel_number_tokens & stream_number_tokens:
+                        # Stream has numbers but none match channel numbers - skip this stream
                         continue
-
-                    # Token-based matching: check if significant tokens overlap
-                    # This catches cases like "ca al jazeera" vs "al jazeera english"
-                    # Split into tokens (words)
-                    stream_tokens = set(stream_lower.split())
-                    channel_tokens = set(channel_lower.split())
-                    
-                    # CRITICAL FIX: For channels with numeric suffixes (like "Premier Sports 1", "Sky Sports 1"),
-                    # we must keep single-digit tokens to prevent false matches between numbered channels.
-                    # Detect if channel contains any numbers
-                    channel_has_numbers = bool(re.search(r'\d', channel_lower))
-                    
-                    # Extract numeric tokens from channel name for strict matching
-                    channel_number_tokens = {t for t in channel_tokens if t.isdigit()}
-                    stream_number_tokens = {t for t in stream_tokens if t.isdigit()}
+                
+                if not channel_has_numbers:
+                    # Same single-char noise filter as the channel side (above)
+                    stream_tokens = artifacts.multi_tokens
+                
+                # Check if there's significant overlap
+                if stream_tokens and channel_tokens:
+                    common_tokens = stream_tokens & channel_tokens
+                    overlap_ratio = len(common_tokens) / min(len(stream_tokens), len(channel_tokens))
                     
-                    # PREVENT FALSE POSITIVES: If channel contains numbers, stream must also contain matching numbers
-                    # This prevents "BBC1" from matching "CBBC", "BBC4" from matching "CBBC", etc.
-                    if channel_number_tokens:
-                        # Channel has numbers - stream must have at least one matching number
-                        if not stream_number_tokens:
-                            # Stream has no numbers but channel does - likely false positive, skip
-                            continue
-                        if not channel_number_tokens & stream_number_tokens:
-                            # Stream has numbers but none match channel numbers - skip this stream
-                            continue
+                    # HYBRID APPROACH: Adjust matching strictness based on threshold
+                    # At high thresholds (90%+): Use strict matching (only all channel tokens present)
+                    # At lower thresholds (<90%): Use permissive matching (sufficient overlap OR all channel tokens)
+                    # This prevents false matches like "Premier Sports 1" matching "Premier Sports 2" at 85%
+                    # while still allowing flexibility at lower thresholds
+                    all_channel_tokens_present = channel_tokens.issubset(stream_tokens)
                     
-                    if channel_has_numbers:
-                        # Keep ALL tokens including single digits (1, 2, 3, etc.) for numbered channels
-                        # This ensures "Premier Sports 1" requires token "1" to match
-                        stream_tokens = {t for t in stream_tokens if len(t) >= 1}
-                        channel_tokens = {t for t in channel_tokens if len(t) >= 1}
+                    if self.fuzzy_matcher.match_threshold >= 90:
+                        # Strict mode: Only match if ALL channel tokens are present in stream
+                        # This ensures "Premier Sports 1" only matches streams containing "premier", "sports", AND "1"
+                        should_check_similarity = all_channel_tokens_present
                     else:
-                        # For non-numbered channels, remove single-char tokens but keep 2-char tokens like "al"
-                        # This prevents matching on noise like single letters
-                        stream_tokens = {t for t in stream_tokens if len(t) > 1}
-                        channel_tokens = {t for t in channel_tokens if len(t) > 1}
+                        # Permissive mode: Match if sufficient overlap OR all channel tokens present
+                        min_tokens_needed = min(len(stream_tokens), len(channel_tokens))
+                        has_sufficient_overlap = len(common_tokens) >= min_tokens_needed or overlap_ratio >= 0.75
+                        should_check_similarity = has_sufficient_overlap or all_channel_tokens_present
                     
-                    # Check if there's significant overlap
-                    if stream_tokens and channel_tokens:
-                        common_tokens = stream_tokens & channel_tokens
-                        overlap_ratio = len(common_tokens) / min(len(stream_tokens), len(channel_tokens))
-                        
-                        # HYBRID APPROACH: Adjust matching strictness based on threshold
-                        # At high thresholds (90%+): Use strict matching (only all channel tokens present)
-                        # At lower thresholds (<90%): Use permissive matching (sufficient overlap OR all channel tokens)
-                        # This prevents false matches like "Premier Sports 1" matching "Premier Sports 2" at 85%
-                        # while still allowing flexibility at lower thresholds
-                        all_channel_tokens_present = channel_tokens.issubset(stream_tokens)
-                        
-                        if self.fuzzy_matcher.match_threshold >= 90:
-                            # Strict mode: Only match if ALL channel tokens are present in stream
-                            # This ensures "Premier Sports 1" only matches streams containing "premier", "sports", AND "1"
-                            should_check_similarity = all_channel_tokens_present
-                        else:
-                            # Permissive mode: Match if sufficient overlap OR all channel tokens present
-                            min_tokens_needed = min(len(stream_tokens), len(channel_tokens))
-                            has_sufficient_overlap = len(common_tokens) >= min_tokens_needed or overlap_ratio >= 0.75
-                            should_check_similarity = has_sufficient_overlap or all_channel_tokens_present
-                        
-                        if should_check_similarity:
-                            # Calculate full string similarity
-                            similarity = self.fuzzy_matcher.calculate_similarity(
-                                stream_lower, channel_lower,
-                                min_ratio=self.fuzzy_matcher.match_threshold / 100.0)
-                            if int(similarity * 100) >= self.fuzzy_matcher.match_threshold:
-                                matching_streams.append(stream)
+                    if should_check_similarity:
+                        # Calculate full string similarity
+                        similarity = self.fuzzy_matcher.calculate_similarity(
+                            stream_lower, channel_lower,
+                            min_ratio=self.fuzzy_matcher.match_threshold / 100.0)
+                        if int(similarity * 100) >= self.fuzzy_matcher.match_threshold:
+                            matching_streams.append(stream)
 
-                if matching_streams:
+            if matching_streams:
+                stream_names = [_mname(stream) for stream in working_streams]
+                matched_stream_name, score, match_type = self.fuzzy_matcher.fuzzy_match(
+                    channel_name, stream_names, ignore_tags, remove_cinemax=channel_has_max,
+                    ignore_quality=ignore_quality, ignore_regional=ignore_regional,
+                    ignore_geographic=ignore_geographic, ignore_misc=ignore_misc
+                )
+                if matched_stream_name or alias_streams:
                     sorted_streams = self._sort_streams_by_quality(matching_streams)
                     sorted_streams = self._deduplicate_streams(sorted_streams, allow_same_name_streams)
-                    cleaned_stream_names = [self._clean_channel_name(
-                        _mname(s), ignore_tags, ignore_quality, ignore_regional,
-                        ignore_geographic, ignore_misc, remove_cinemax=channel_has_max
-                    ) for s in sorted_streams]
+                    cleaned_stream_names = [stream_artifacts(_mname(s)).cleaned for s in sorted_streams]
                     reason = ("Alias match" if (alias_streams and not matched_stream_name)
                               else f"Fuzzy match ({match_type}, score: {score})")
                     return sorted_streams, cleaned_channel_name, cleaned_stream_names, reason, database_used
@@ -3395,44 +3791,34 @@ class Plugin:
         if channel_info and channel_info.get('channel_name'):
             json_channel_name = channel_info['channel_name']
             for stream in working_streams:
-                cleaned_stream_name = self._clean_channel_name(
-                    _mname(stream), ignore_tags, ignore_quality, ignore_regional,
-                    ignore_geographic, ignore_misc, remove_cinemax=channel_has_max
-                )
+                artifacts = stream_artifacts(_mname(stream))
+                cleaned_stream_name, cleaned_stream_lower = artifacts.cleaned, artifacts.lower
                 if not cleaned_stream_name or len(cleaned_stream_name) < 2: continue
                 if not cleaned_channel_name or len(cleaned_channel_name) < 2: continue
 
-                if cleaned_stream_name.lower() == cleaned_channel_name.lower():
+                if cleaned_stream_lower == cleaned_channel_lower:
                     matching_streams.append(stream)
 
             if matching_streams:
                 sorted_streams = self._sort_streams_by_quality(matching_streams)
                 sorted_streams = self._deduplicate_streams(sorted_streams, allow_same_name_streams)
-                cleaned_stream_names = [self._clean_channel_name(
-                    _mname(s), ignore_tags, ignore_quality, ignore_regional,
-                    ignore_geographic, ignore_misc, remove_cinemax=channel_has_max
-                ) for s in sorted_streams]
+                cleaned_stream_names = [stream_artifacts(_mname(s)).cleaned for s in sorted_streams]
                 return sorted_streams, cleaned_channel_name, cleaned_stream_names, "Exact match (channels.json)", database_used
 
         # Fallback to basic substring matching
         for stream in working_streams:
-            cleaned_stream_name = self._clean_channel_name(
-                _mname(stream), ignore_tags, ignore_quality, ignore_regional,
-                ignore_geographic, ignore_misc, remove_cinemax=channel_has_max
-            )
+            artifacts = stream_artifacts(_mname(stream))
+            cleaned_stream_name, cleaned_stream_lower = artifacts.cleaned, artifacts.lower
             if not cleaned_stream_name or len(cleaned_stream_name) < 2: continue
             if not cleaned_channel_name or len(cleaned_channel_name) < 2: continue
 
-            if cleaned_channel_name.lower() in cleaned_stream_name.lower() or cleaned_stream_name.lower() in cleaned_channel_name.lower():
+            if cleaned_channel_lower in cleaned_stream_lower or cleaned_stream_lower in cleaned_channel_lower:
                 matching_streams.append(stream)
 
         if matching_streams:
             sorted_streams = self._sort_streams_by_quality(matching_streams)
             sorted_streams = self._deduplicate_streams(sorted_streams, allow_same_name_streams)
-            cleaned_stream_names = [self._clean_channel_name(
-                _mname(s), ignore_tags, ignore_quality, ignore_regional,
-                ignore_geographic, ignore_misc, remove_cinemax=channel_has_max
-            ) for s in sorted_streams]
+            cleaned_stream_names = [stream_artifacts(_mname(s)).cleaned for s in sorted_streams]
             return sorted_streams, cleaned_channel_name, cleaned_stream_names, "Basic substring match", database_used
 
         return [], cleaned_channel_name, [], "No match", database_used
@@ -3460,8 +3846,10 @@ class Plugin:
             thresholds_to_test.sort(reverse=True)
 
         channel_name = channel['name']
-        channel_info = self._get_channel_info_from_json(channel_name, channels_data, logger)
-        channel_has_max = 'max' in channel_name.lower()
+        channel_name_lower = channel_name.lower()
+        channel_info = self._get_channel_info_from_json(
+            channel_name, channels_data, logger, channel_name_lower=channel_name_lower)
+        channel_has_max = 'max' in channel_name_lower
 
         candidate_streams = all_streams
         if restrict_matching_to_country:
@@ -3477,11 +3865,11 @@ class Plugin:
         # For OTA channels, callsign matching doesn't use threshold
         if self._is_ota_channel(channel_info):
             callsign = channel_info['callsign']
-            callsign_pattern = r'\b' + re.escape(callsign) + r'\b'
+            has_callsign = self._callsign_stream_filter(callsign)
             matching_streams = []
 
             for stream in candidate_streams:
-                if re.search(callsign_pattern, _mname(stream), re.IGNORECASE):
+                if has_callsign(_mname(stream)):
                     matching_streams.append(stream)
             
             if matching_streams:
@@ -3493,6 +3881,10 @@ class Plugin:
                 }
             return results
         
+        stream_artifacts = self._stream_artifact_lookup(
+            ignore_tags, ignore_quality, ignore_regional, ignore_geographic,
+            ignore_misc, remove_cinemax=channel_has_max)
+
         # For non-OTA channels, test each threshold.
         # Alias hits are threshold-independent — collect once, before the loop.
         alias_streams = self._collect_alias_streams(
@@ -3500,61 +3892,66 @@ class Plugin:
             ignore_regional, ignore_geographic, ignore_misc)
         alias_ids = {id(s) for s in alias_streams}
 
+        if not self.fuzzy_matcher:
+            return results
+
+        # Score the channel once for every threshold instead of re-running the
+        # whole fuzzy pipeline per threshold with a temporarily patched
+        # match_threshold.
+        stream_names = [_mname(stream) for stream in candidate_streams]
+        threshold_matches = self.fuzzy_matcher.fuzzy_match_thresholds(
+            channel_name, stream_names, thresholds_to_test, ignore_tags,
+            remove_cinemax=channel_has_max, ignore_quality=ignore_quality,
+            ignore_regional=ignore_regional, ignore_geographic=ignore_geographic,
+            ignore_misc=ignore_misc
+        )
+
+        # Neighbouring thresholds usually agree on the winner; the stream set
+        # depends only on it, so collect/sort/dedup once per distinct winner.
+        streams_by_match = {}
         for threshold in thresholds_to_test:
-            if not self.fuzzy_matcher:
+            matched_stream_name, score, match_type = threshold_matches[threshold]
+            if not (matched_stream_name or alias_streams):
                 continue
-                
-            # Temporarily set the threshold
-            original_threshold = self.fuzzy_matcher.match_threshold
-            self.fuzzy_matcher.match_threshold = threshold
-            
-            try:
-                stream_names = [_mname(stream) for stream in candidate_streams]
-                matched_stream_name, score, match_type = self.fuzzy_matcher.fuzzy_match(
-                    channel_name, stream_names, ignore_tags, remove_cinemax=channel_has_max,
-                    ignore_quality=ignore_quality, ignore_regional=ignore_regional,
-                    ignore_geographic=ignore_geographic, ignore_misc=ignore_misc
-                )
 
-                if matched_stream_name or alias_streams:
-                    cleaned_channel_name = self._clean_channel_name(
-                        channel_name, ignore_tags, ignore_quality, ignore_regional,
-                        ignore_geographic, ignore_misc
-                    )
-                    cleaned_matched = self._clean_channel_name(
-                        matched_stream_name, ignore_tags, ignore_quality, ignore_regional,
-                        ignore_geographic, ignore_misc, remove_cinemax=channel_has_max
-                    ) if matched_stream_name else ""
-
-                    matching_streams = list(alias_streams)
-                    for stream in candidate_streams:
-                        if id(stream) in alias_ids:
-                            continue  # already force-included via alias
-                        cleaned_stream = self._clean_channel_name(
-                            _mname(stream), ignore_tags, ignore_quality, ignore_regional,
-                            ignore_geographic, ignore_misc, remove_cinemax=channel_has_max
-                        )
+            sorted_streams = streams_by_match.get(matched_stream_name)
+            if sorted_streams is None:
+                # The matched name is one of the candidate stream names, so its
+                # cleaned form is already in the run's artifact table.
+                if matched_stream_name:
+                    matched_artifacts = stream_artifacts(matched_stream_name)
+                    cleaned_matched, cleaned_matched_lower = matched_artifacts.cleaned, matched_artifacts.lower
+                else:
+                    cleaned_matched, cleaned_matched_lower = "", ""
 
-                        if not cleaned_stream or len(cleaned_stream) < 2:
-                            continue
-                        if not cleaned_matched or len(cleaned_matched) < 2:
-                            continue
+                matching_streams = list(alias_streams)
+                for stream in candidate_streams:
+                    if id(stream) in alias_ids:
+                        continue  # already force-included via alias
+                    artifacts = stream_artifacts(_mname(stream))
+                    cleaned_stream, cleaned_stream_lower = artifacts.cleaned, artifacts.lower
 
-                        if cleaned_stream.lower() == cleaned_matched.lower():
-                            matching_streams.append(stream)
+                    if not cleaned_stream or len(cleaned_stream) < 2:
+                        continue
+                    if not cleaned_matched or len(cleaned_matched) < 2:
+                        continue
+
+                    if cleaned_stream_lower == cleaned_matched_lower:
+                        matching_streams.append(stream)
+
+                sorted_streams = []
+                if matching_streams:
+                    sorted_streams = self._sort_streams_by_quality(matching_streams)
+                    sorted_streams = self._deduplicate_streams(sorted_streams, allow_same_name_streams)
+                streams_by_match[matched_stream_name] = sorted_streams
+
+            if sorted_streams:
+                results[threshold] = {
+                    'streams': list(sorted_streams),
+                    'match_type': match_type if matched_stream_name else "alias",
+                    'score': score
+                }
 
-                    if matching_streams:
-                        sorted_streams = self._sort_streams_by_quality(matching_streams)
-                        sorted_streams = self._deduplicate_streams(sorted_streams, allow_same_name_streams)
-                        results[threshold] = {
-                            'streams': sorted_streams,
-                            'match_type': match_type if matched_stream_name else "alias",
-                            'score': score
-                        }
-            finally:
-                # Restore original threshold
-                self.fuzzy_matcher.match_threshold = original_threshold
-        
         return results
 
     def _send_progress_update(self, action_id, status, progress, message, context=None, details=None):
@@ -3584,7 +3981,7 @@ class Plugin:
 
             is_complete = progress >= 100 or status in ('success', 'completed', 'error')
             if not is_complete:
-                LOGGER.debug(f"[Stream-Mapparr] Progress: {action_id} - {progress}% - {message}")
+                LOGGER.debug("[Stream-Mapparr] Progress: %s - %s%% - %s", action_id, progress, message)
                 return
 
             is_success = status in ('success', 'completed')
@@ -3616,7 +4013,7 @@ class Plugin:
             log_level = LOGGER.info if is_success else LOGGER.error
             log_level(f"[Stream-Mapparr] ✅ {action_id.replace('_', ' ').upper()} COMPLETED: {message}")
 
-            LOGGER.debug(f"[Stream-Mapparr] Sending WebSocket notification: {notification_data}")
+            LOGGER.debug("[Stream-Mapparr] Sending WebSocket notification: %s", notification_data)
             send_websocket_update('updates', 'update', notification_data)
         except Exception as e:
             LOGGER.warning(f"[Stream-Mapparr] Failed to send notification: {e}")
@@ -3644,7 +4041,7 @@ class Plugin:
         """
         if not settings.get('fire_webhook_on_completion', False):
             return
-        url = (settings.get('webhook_url') or '').strip()
+        url = self._setting_str(settings, "webhook_url")
         if not url:
             return
         if not url.startswith(('http://', 'https://')):
@@ -3728,8 +4125,7 @@ class Plugin:
     def _read_json_file(self, path):
         """Read a JSON file, returning None if missing or corrupt."""
         try:
-            with open(path, 'r') as f:
-                return json.load(f)
+            return _load_json_path(path)
         except FileNotFoundError:
             return None
         except (json.JSONDecodeError, ValueError) as e:
@@ -3771,8 +4167,52 @@ class Plugin:
         read accurate live state."""
         if action_id in self._INTERNAL_PROGRESS_ACTIONS:
             return None
-        now = time.time()
+        with _PROGRESS_PERSIST_LOCK:
+            return self._write_progress(action_id, status, progress, message)
+
+    def _defer_progress(self, pending, delay):
+        """Keep `pending` (the newest throttled update) and write it once the
+        throttle interval is over, unless a newer write lands first."""
+        self._pending_progress = pending
+        timer = getattr(self, '_progress_flush_timer', None)
+        if timer is None or not timer.is_alive():
+            timer = threading.Timer(max(delay, 0.0), self._flush_pending_progress)
+            timer.daemon = True
+            self._progress_flush_timer = timer
+            timer.start()
+
+    def _flush_pending_progress(self):
+        """Timer callback: write the update _defer_progress kept, if still pending."""
+        with _PROGRESS_PERSIST_LOCK:
+            pending = getattr(self, '_pending_progress', None)
+            self._pending_progress = None
+            self._progress_flush_timer = None
+            if pending is None:
+                return
+            self._last_progress_persist = None  # the interval is over
+            try:
+                self._write_progress(*pending)
+            except Exception as e:
+                LOGGER.debug(f"[Stream-Mapparr] deferred progress persist failed: {e}")
+
+    def _write_progress(self, action_id, status, progress, message):
+        """_persist_progress body; the caller holds _PROGRESS_PERSIST_LOCK."""
         norm = 'running' if status == 'running' else ('complete' if status in ('success', 'completed') else 'error')
+        # Back-to-back running steps (5%, 10%, 20%...) land within milliseconds;
+        # only the first in each interval pays the read + atomic write right
+        # away. The newest skipped one is written when the interval ends, so a
+        # step announced just before a long phase still shows up. Start and
+        # terminal states are always written.
+        mono = time.monotonic()
+        last = getattr(self, '_last_progress_persist', None)
+        if (norm == 'running' and last is not None and last[0] == action_id
+                and mono - last[1] < PluginConfig.PROGRESS_PERSIST_MIN_INTERVAL):
+            self._defer_progress((action_id, status, progress, message),
+                                 PluginConfig.PROGRESS_PERSIST_MIN_INTERVAL - (mono - last[1]))
+            return None
+        self._pending_progress = None  # superseded by this write
+        self._last_progress_persist = (action_id, mono) if norm == 'running' else None
+        now = time.time()
         prev = self._load_progress_state()
         # Start a fresh clock when a new running operation begins.
         is_new_op = norm == 'running' and not (prev.get('action') == action_id and prev.get('status') == 'running')
@@ -3918,28 +4358,36 @@ class Plugin:
             logger.error(f"[Stream-Mapparr] test_regex_rules failed: {e}")
             return {"status": "error", "message": f"Test failed: {e}"}
 
-    def _check_operation_lock(self, logger):
+    def _check_operation_lock(self, logger, use_cache=True):
         """
         Check if an operation is currently running.
         Returns (is_locked, lock_info) where lock_info contains action name and start time.
         Auto-expires locks older than configured timeout.
         Verifies process is actually running to handle container restarts.
+
+        Polling callers may get a result up to OPERATION_LOCK_CHECK_TTL_SECONDS
+        old; _acquire_operation_lock passes use_cache=False, and this process's
+        own acquire/release/clear invalidate the cached read.
         """
+        cached = getattr(self, '_lock_check_cache', None)
+        now = time.monotonic()
+        if use_cache and cached is not None and now < cached[0]:
+            return cached[1], cached[2]
+        is_locked, lock_info = self._read_operation_lock(logger)
+        self._lock_check_cache = (now + PluginConfig.OPERATION_LOCK_CHECK_TTL_SECONDS, is_locked, lock_info)
+        return is_locked, lock_info
+
+    def _read_operation_lock(self, logger):
+        """Uncached lock-file read behind _check_operation_lock."""
         lock_file = PluginConfig.OPERATION_LOCK_FILE
 
         if not os.path.exists(lock_file):
             return False, None
 
         try:
-            with open(lock_file, 'r') as f:
-                lock_data = json.load(f)
-
-            action_name = lock_data.get('action', 'unknown')
-            lock_time_str = lock_data.get('start_time')
-            lock_pid = lock_data.get('pid')
+            action_name, lock_time, lock_pid = self._parse_operation_lock(lock_file)
 
-            if lock_time_str:
-                lock_time = datetime.fromisoformat(lock_time_str)
+            if lock_time:
                 age_minutes = (datetime.now() - lock_time).total_seconds() / 60
 
                 # Auto-expire stale locks
@@ -3976,24 +4424,42 @@ class Plugin:
 
         return False, None
 
+    @staticmethod
+    def _parse_operation_lock(lock_file):
+        """Return (action, start_time, pid) from the lock file.
+
+        The lock is two plain lines, "<action>\\n<pid>\\n", and its mtime is the
+        start time (it is written once, on acquire). Locks left by older
+        versions are a JSON object with action/start_time/pid and are still
+        read so an upgrade mid-operation does not orphan them.
+        """
+        mtime = os.stat(lock_file).st_mtime
+        with open(lock_file, 'r') as f:
+            raw = f.read()
+        if raw.lstrip().startswith('{'):
+            lock_data = json.loads(raw)
+            lock_time_str = lock_data.get('start_time')
+            lock_time = datetime.fromisoformat(lock_time_str) if lock_time_str else None
+            return lock_data.get('action', 'unknown'), lock_time, lock_data.get('pid')
+        lines = raw.splitlines()
+        action_name = lines[0].strip() if lines and lines[0].strip() else 'unknown'
+        lock_pid = int(lines[1]) if len(lines) > 1 and lines[1].strip() else None
+        return action_name, datetime.fromtimestamp(mtime), lock_pid
+
     def _acquire_operation_lock(self, action_name, logger):
         """
         Acquire operation lock. Returns True if acquired, False if already locked.
         """
-        is_locked, lock_info = self._check_operation_lock(logger)
+        is_locked, lock_info = self._check_operation_lock(logger, use_cache=False)
 
         if is_locked:
             logger.warning(f"[Stream-Mapparr] Cannot start {action_name} - {lock_info['action']} is already running ({lock_info['age_minutes']:.1f} min)")
             return False
 
         try:
-            lock_data = {
-                'action': action_name,
-                'start_time': datetime.now().isoformat(),
-                'pid': os.getpid()
-            }
             with open(PluginConfig.OPERATION_LOCK_FILE, 'w') as f:
-                json.dump(lock_data, f, indent=2)
+                f.write(f"{action_name}\n{os.getpid()}\n")
+            self._lock_check_cache = None
 
             logger.info(f"[Stream-Mapparr] Lock acquired for {action_name}")
             return True
@@ -4003,6 +4469,7 @@ class Plugin:
 
     def _release_operation_lock(self, logger):
         """Release operation lock."""
+        self._lock_check_cache = None
         try:
             if os.path.exists(PluginConfig.OPERATION_LOCK_FILE):
                 os.remove(PluginConfig.OPERATION_LOCK_FILE)
@@ -4010,17 +4477,69 @@ class Plugin:
         except Exception as e:
             logger.warning(f"[Stream-Mapparr] Failed to release lock: {e}")
 
-    def _get_channel_info_from_json(self, channel_name, channels_data, logger):
-        """Find channel info from channels.json by matching channel name."""
-        for entry in channels_data:
-            if entry.get('channel_name', '') == channel_name:
-                return entry
+    def _get_channel_info_from_json(self, channel_name, channels_data, logger, channel_name_lower=None):
+        """Find channel info from channels.json by matching channel name.
 
-        channel_name_lower = channel_name.lower()
+        Exact name first, then case-insensitive; the first entry wins in both.
+        The name indexes are built once per channels_data list and reused for
+        every channel of the run. Callers that already hold channel_name.lower()
+        can pass it to skip recomputing it.
+        """
+        exact_index, lower_index = self._channel_info_index(channels_data)
+        entry = exact_index.get(channel_name)
+        if entry is not None:
+            return entry
+        if channel_name_lower is None:
+            channel_name_lower = channel_name.lower()
+        return lower_index.get(channel_name_lower)
+
+    def _channel_info_index(self, channels_data):
+        """(exact name -> entry, lowercased name -> entry) for channels_data, cached
+        until a different list is passed in."""
+        cached = getattr(self, '_channel_info_index_cache', None)
+        if cached is not None and cached[0] is channels_data:
+            return cached[1], cached[2]
+        exact_index, lower_index = {}, {}
         for entry in channels_data:
-            if entry.get('channel_name', '').lower() == channel_name_lower:
-                return entry
-        return None
+            name = entry.get('channel_name', '')
+            exact_index.setdefault(name, entry)
+            lower_index.setdefault(name.lower(), entry)
+        self._channel_info_index_cache = (channels_data, exact_index, lower_index)
+        return exact_index, lower_index
+
+    def _channel_group_key(self, channel_name, channels_data, logger, ignore_tags,
+                           ignore_quality=True, ignore_regional=True,
+                           ignore_geographic=True, ignore_misc=True):
+        """Key under which channels share one match: OTA_<callsign> for broadcast
+        channels, otherwise the cleaned channel name.
+
+        Used by the ETA estimate and by every action that groups channels before
+        matching, so they all agree. Keys are memoized per channels_data list
+        until a different list is passed in or _reset_run_caches() runs.
+        """
+        cached = getattr(self, '_group_key_cache', None)
+        if cached is None or cached[0] is not channels_data:
+            cached = self._group_key_cache = (channels_data, {})
+        cache = cached[1]
+        key = (channel_name, tuple(ignore_tags) if ignore_tags else (),
+               ignore_quality, ignore_regional, ignore_geographic, ignore_misc)
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+
+        channel_info = self._get_channel_info_from_json(channel_name, channels_data, logger)
+        if self._is_ota_channel(channel_info):
+            callsign = channel_info.get('callsign', '')
+            if callsign:
+                group_key = f"OTA_{callsign}"
+            else:
+                group_key = self._clean_channel_name(channel_name, ignore_tags)
+        else:
+            group_key = self._clean_channel_name(channel_name, ignore_tags, ignore_quality,
+                                                 ignore_regional, ignore_geographic, ignore_misc)
+        cache[key] = group_key
+        return group_key
 
     def save_settings(self, settings, context):
         """Save settings. Schedule changes are applied via the Update Schedule action."""
@@ -4053,6 +4572,39 @@ class Plugin:
         padded_eta = eta_seconds * PluginConfig.ETA_SAFETY_FACTOR
         return padded_eta < PluginConfig.SYNC_THRESHOLD_SECONDS
 
+    def _processed_data_eta_snapshot(self):
+        """(channel names, ignore_tags, cleaning flags) from processed_data, or None.
+
+        Every background action estimates its ETA first, but the file only
+        changes when channels are (re)loaded, so the few fields the estimate
+        needs are kept on the instance and re-read only when the file's
+        mtime/size change.
+        """
+        try:
+            st = os.stat(self.processed_data_file)
+        except OSError:
+            return None
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = getattr(self, '_processed_eta_cache', None)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        processed_data = _load_json_path(self.processed_data_file)
+        channels = processed_data.get('channels', [])
+        snapshot = None
+        if channels:
+            snapshot = (
+                tuple(channel['name'] for channel in channels),
+                processed_data.get('ignore_tags', []),
+                (
+                    processed_data.get('ignore_quality', True),
+                    processed_data.get('ignore_regional', True),
+                    processed_data.get('ignore_geographic', True),
+                    processed_data.get('ignore_misc', True),
+                ),
+            )
+        self._processed_eta_cache = (stamp, snapshot)
+        return snapshot
+
     def _estimate_eta_seconds(self, settings, logger):
         """Estimate runtime of a matching action in seconds.
 
@@ -4061,30 +4613,17 @@ class Plugin:
         cannot be computed (e.g. first run before load_process_channels).
         """
         try:
-            if not os.path.exists(self.processed_data_file):
+            snapshot = self._processed_data_eta_snapshot()
+            if snapshot is None:
                 return None
-            with open(self.processed_data_file, 'r') as f:
-                processed_data = json.load(f)
-            channels = processed_data.get('channels', [])
-            if not channels:
-                return None
-            ignore_tags = processed_data.get('ignore_tags', [])
+            channel_names, ignore_tags, clean_flags = snapshot
             channels_data = self._load_channels_data(logger, settings)
+            # Channel-info lookups hit the per-list name index and cleaned names
+            # land in the per-run memo, which the action that follows reuses.
             seen = set()
-            for channel in channels:
-                channel_info = self._get_channel_info_from_json(channel['name'], channels_data, logger)
-                if self._is_ota_channel(channel_info):
-                    callsign = channel_info.get('callsign', '')
-                    key = f"OTA_{callsign}" if callsign else channel['name']
-                else:
-                    key = self._clean_channel_name(
-                        channel['name'], ignore_tags,
-                        processed_data.get('ignore_quality', True),
-                        processed_data.get('ignore_regional', True),
-                        processed_data.get('ignore_geographic', True),
-                        processed_data.get('ignore_misc', True),
-                    )
-                seen.add(key)
+            for channel_name in channel_names:
+                seen.add(self._channel_group_key(
+                    channel_name, channels_data, logger, ignore_tags, *clean_flags))
             return len(seen) * PluginConfig.ESTIMATED_SECONDS_PER_ITEM
         except Exception as e:
             logger.debug(f"[Stream-Mapparr] Could not estimate ETA: {e}")
@@ -4107,6 +4646,7 @@ class Plugin:
             # next sort call. Without this, a long-lived plugin instance would
             # carry stale flags/cache between action runs.
             self._throughput_state_primed = False
+            self._reset_run_caches()
 
             # Initialize fuzzy matcher with configured threshold
             match_threshold = self._resolve_match_threshold(settings)
@@ -4250,8 +4790,40 @@ class Plugin:
             LOGGER.error(traceback.format_exc())
             return {"status": "error", "message": str(e)}
 
-    def _validate_plugin_settings(self, settings, logger):
-        """Helper method to validate plugin settings."""
+    def _validate_plugin_settings(self, settings, logger, use_cache=True):
+        """Validate plugin settings, reusing a recent passing result.
+
+        load_process_channels and the preview/add actions that wrap it validate
+        the same settings back to back, and scheduled runs repeat them; a
+        passing result for identical settings is reused for
+        VALIDATION_CACHE_TTL_SECONDS. Failures are never cached, so a fix made
+        in Dispatcharr is picked up on the next call. The Validate Settings
+        button passes use_cache=False.
+        """
+        try:
+            cache_key = json.dumps(settings, sort_keys=True, default=str)
+        except (TypeError, ValueError):
+            cache_key = None
+        cached = getattr(self, '_validation_cache', None)
+        if (use_cache and cache_key is not None and cached is not None
+                and cached[0] == cache_key and time.monotonic() < cached[1]):
+            logger.debug("[Stream-Mapparr] Reusing settings validation from the last "
+                         "%.0fs", PluginConfig.VALIDATION_CACHE_TTL_SECONDS)
+            return False, list(cached[2])
+
+        has_errors, validation_results = self._run_settings_validation(settings, logger)
+        if has_errors or cache_key is None:
+            self._validation_cache = None
+        else:
+            self._validation_cache = (
+                cache_key,
+                time.monotonic() + PluginConfig.VALIDATION_CACHE_TTL_SECONDS,
+                list(validation_results),
+            )
+        return has_errors, validation_results
+
+    def _run_settings_validation(self, settings, logger):
+        """Uncached settings validation behind _validate_plugin_settings."""
         validation_results = []
         has_errors = False
 
@@ -4274,8 +4846,7 @@ class Plugin:
 
             # 2. Validate profile name exists
             logger.debug("[Stream-Mapparr] Validating profile names...")
-            profile_names_str = settings.get("profile_name") or ""
-            profile_names_str = profile_names_str.strip() if profile_names_str else ""
+            profile_names_str = self._setting_str(settings, "profile_name")
             if profile_names_str == "_none":
                 profile_names_str = ""
             if not profile_names_str:
@@ -4283,19 +4854,14 @@ class Plugin:
                 has_errors = True
             else:
                 profile_names = [name.strip() for name in profile_names_str.split(',') if name.strip()]
-                profiles = self._get_all_profiles(logger)
-                available_profile_names = [p.get('name') for p in profiles if 'name' in p]
+                profiles_by_lower_name = self._profiles_by_lower_name(self._get_all_profiles(logger))
 
                 missing_profiles = []
                 found_profiles = []
                 for profile_name in profile_names:
-                    found = False
-                    for profile in profiles:
-                        if profile.get('name', '').lower() == profile_name.lower():
-                            found = True
-                            found_profiles.append(profile_name)
-                            break
-                    if not found:
+                    if profile_name.lower() in profiles_by_lower_name:
+                        found_profiles.append(profile_name)
+                    else:
                         missing_profiles.append(profile_name)
 
                 if missing_profiles:
@@ -4306,13 +4872,12 @@ class Plugin:
 
             # 3. Validate channel groups (if specified)
             logger.debug("[Stream-Mapparr] Validating channel groups...")
-            selected_groups_str = settings.get("selected_groups") or ""
-            selected_groups_str = selected_groups_str.strip() if selected_groups_str else ""
+            selected_groups_str = self._setting_str(settings, "selected_groups")
 
             if selected_groups_str:
                 selected_groups = [g.strip() for g in selected_groups_str.split(',') if g.strip()]
                 all_groups = self._get_all_groups(logger)
-                available_group_names = [g.get('name') for g in all_groups if 'name' in g]
+                available_group_names = {g.get('name') for g in all_groups if 'name' in g}
 
                 missing_groups = []
                 found_groups = []
@@ -4339,8 +4904,7 @@ class Plugin:
             else:
                 # Validate timezone is valid
                 try:
-                    import pytz
-                    pytz.timezone(timezone_str)
+                    _pytz_timezone(timezone_str)
                     validation_results.append(f"✅ Timezone")
                 except pytz.exceptions.UnknownTimeZoneError:
                     validation_results.append(f"❌ Timezone: Invalid '{timezone_str}'")
@@ -4385,7 +4949,7 @@ class Plugin:
 
     def validate_settings_action(self, settings, logger):
         """Validate all plugin settings including profiles, groups, and API connection."""
-        has_errors, validation_results = self._validate_plugin_settings(settings, logger)
+        has_errors, validation_results = self._validate_plugin_settings(settings, logger, use_cache=False)
 
         # Notification message is kept to a single line; full validation
         # detail is written to logs and can be viewed via Dispatcharr logs.
@@ -4397,12 +4961,23 @@ class Plugin:
             return {"status": "error", "message": message}
         return {"status": "success", "message": f"All settings valid ({len(validation_results)} check(s) passed)."}
 
+    def _take_processed_data(self):
+        """The snapshot load_process_channels_action just built, handed over in
+        memory once; otherwise (or on a second call) read back from disk."""
+        processed_data = getattr(self, '_processed_data_handoff', None)
+        self._processed_data_handoff = None
+        if processed_data is not None:
+            return processed_data
+        return _load_json_path(self.processed_data_file)
+
     def load_process_channels_action(self, settings, logger, context=None):
         """Load and process channels from specified profile and groups."""
         try:
             # Self-initialize matcher + alias map for entry paths that bypass run()
             # (the background scheduler calls this action directly). Idempotent.
             self._ensure_matcher_and_aliases(settings)
+            self._reset_run_caches()
+            self._processed_data_handoff = None
             self._send_progress_update("load_process_channels", 'running', 5, 'Validating settings...', context)
             logger.debug("[Stream-Mapparr] Validating settings before loading channels...")
             has_errors, validation_results = self._validate_plugin_settings(settings, logger)
@@ -4416,18 +4991,13 @@ class Plugin:
             self._send_progress_update("load_process_channels", 'running', 10, 'Settings validated, loading data...', context)
             logger.info("[Stream-Mapparr] Settings validated successfully, proceeding with channel load...")
 
-            profile_names_str = settings.get("profile_name") or ""
-            profile_names_str = profile_names_str.strip() if profile_names_str else ""
+            profile_names_str = self._setting_str(settings, "profile_name")
             if profile_names_str == "_none":
                 profile_names_str = ""
-            selected_groups_str = settings.get("selected_groups") or ""
-            selected_groups_str = selected_groups_str.strip() if selected_groups_str else ""
-            selected_stream_groups_str = settings.get("selected_stream_groups") or ""
-            selected_stream_groups_str = selected_stream_groups_str.strip() if selected_stream_groups_str else ""
-            selected_m3us_str = settings.get("selected_m3us") or ""
-            selected_m3us_str = selected_m3us_str.strip() if selected_m3us_str else ""
-            ignore_tags_str = settings.get("ignore_tags") or ""
-            ignore_tags_str = ignore_tags_str.strip() if ignore_tags_str else ""
+            selected_groups_str = self._setting_str(settings, "selected_groups")
+            selected_stream_groups_str = self._setting_str(settings, "selected_stream_groups")
+            selected_m3us_str = self._setting_str(settings, "selected_m3us")
+            ignore_tags_str = self._setting_str(settings, "ignore_tags")
             visible_channel_limit_str = settings.get("visible_channel_limit", str(PluginConfig.DEFAULT_VISIBLE_CHANNEL_LIMIT))
             visible_channel_limit = int(visible_channel_limit_str) if visible_channel_limit_str else PluginConfig.DEFAULT_VISIBLE_CHANNEL_LIMIT
 
@@ -4443,14 +5013,12 @@ class Plugin:
             self._send_progress_update("load_process_channels", 'running', 20, 'Fetching profiles...', context)
             profiles = self._get_all_profiles(logger)
 
+            profiles_by_lower_name = self._profiles_by_lower_name(profiles)
+
             target_profiles = []
             profile_ids = []
             for profile_name in profile_names:
-                found_profile = None
-                for profile in profiles:
-                    if profile.get('name', '').lower() == profile_name.lower():
-                        found_profile = profile
-                        break
+                found_profile = profiles_by_lower_name.get(profile_name.lower())
                 if not found_profile:
                     return {"status": "error", "message": f"Profile '{profile_name}' not found."}
                 target_profiles.append(found_profile)
@@ -4461,7 +5029,7 @@ class Plugin:
             # Fetch groups via ORM
             self._send_progress_update("load_process_channels", 'running', 30, 'Fetching channel groups...', context)
             all_groups = self._get_all_groups(logger)
-            group_name_to_id = {g['name']: g['id'] for g in all_groups if 'name' in g and 'id' in g}
+            group_name_to_id = self._name_to_id(all_groups)
 
             # Fetch stream groups via ORM
             self._send_progress_update("load_process_channels", 'running', 35, 'Fetching stream groups...', context)
@@ -4473,61 +5041,58 @@ class Plugin:
             all_m3us = self._get_all_m3u_accounts(logger)
             logger.info(f"[Stream-Mapparr] Found {len(all_m3us)} M3U sources")
 
-            m3u_name_to_id = {m['name']: m['id'] for m in all_m3us if 'name' in m and 'id' in m}
-
-            # Fetch channels via ORM
-            self._send_progress_update("load_process_channels", 'running', 40, 'Fetching channels...', context)
-            all_channels = self._get_all_channels(logger)
-
-            # Filter channels by profile membership (single bulk query)
-            profile_channel_ids = set(ChannelProfileMembership.objects.filter(
-                channel_profile_id__in=profile_ids,
-                enabled=True
-            ).values_list('channel_id', flat=True))
-            channels_in_profile = [ch for ch in all_channels if ch['id'] in profile_channel_ids]
+            m3u_name_to_id = self._name_to_id(all_m3us)
 
             if selected_groups_str:
                 selected_groups = [g.strip() for g in selected_groups_str.split(',') if g.strip()]
-                valid_group_ids = [group_name_to_id[name] for name in selected_groups if name in group_name_to_id]
+                valid_group_ids = {group_name_to_id[name] for name in selected_groups if name in group_name_to_id}
                 if not valid_group_ids:
                     return {"status": "error", "message": "None of the specified groups were found."}
-
-                filtered_channels = [ch for ch in channels_in_profile if ch.get('channel_group_id') in valid_group_ids]
-                channels_in_profile = filtered_channels
                 group_filter_info = f" in groups: {', '.join(selected_groups)}"
             else:
                 selected_groups = []
+                valid_group_ids = None
                 group_filter_info = " (all groups)"
 
+            # Profile membership and the group filter resolve in one subquery (the
+            # group test joins through channel), so only matching channels come back.
+            memberships = ChannelProfileMembership.objects.filter(
+                channel_profile_id__in=profile_ids,
+                enabled=True
+            )
+            if valid_group_ids is not None:
+                memberships = memberships.filter(channel__channel_group_id__in=valid_group_ids)
+
+            # Fetch channels via ORM
+            self._send_progress_update("load_process_channels", 'running', 40, 'Fetching channels...', context)
+            channels_in_profile = self._get_all_channels(
+                logger, channel_ids=memberships.values('channel_id'))
+
             if not channels_in_profile:
                 return {"status": "error", "message": f"No channels found in profile."}
 
             channels_to_process = channels_in_profile
 
-            # Fetch all streams via ORM
-            self._send_progress_update("load_process_channels", 'running', 60, 'Fetching streams...', context)
-            logger.info("[Stream-Mapparr] Fetching all streams via ORM...")
-            all_streams_data = self._get_all_streams(logger)
-
-            # Filter streams by selected stream groups (uses channel_group field)
+            # Resolve the stream-group and M3U filters first so the stream query
+            # itself applies them; the result then needs only the priority tag.
+            valid_stream_group_ids = None
             if selected_stream_groups_str:
                 selected_stream_groups = [g.strip() for g in selected_stream_groups_str.split(',') if g.strip()]
-                valid_stream_group_ids = [group_name_to_id[name] for name in selected_stream_groups if name in group_name_to_id]
+                valid_stream_group_ids = {group_name_to_id[name] for name in selected_stream_groups if name in group_name_to_id}
                 if not valid_stream_group_ids:
                     logger.warning("[Stream-Mapparr] None of the specified stream groups were found. Using all streams.")
                     selected_stream_groups = []
+                    valid_stream_group_ids = None
                     stream_group_filter_info = " (all stream groups - specified groups not found)"
                 else:
-                    # Filter streams by channel_group (which is the group ID)
-                    filtered_streams = [s for s in all_streams_data if s.get('channel_group') in valid_stream_group_ids]
-                    logger.info(f"[Stream-Mapparr] Filtered streams from {len(all_streams_data)} to {len(filtered_streams)} based on stream groups: {', '.join(selected_stream_groups)}")
-                    all_streams_data = filtered_streams
                     stream_group_filter_info = f" in stream groups: {', '.join(selected_stream_groups)}"
             else:
                 selected_stream_groups = []
                 stream_group_filter_info = " (all stream groups)"
 
-            # Filter streams by selected M3U sources and add priority metadata
+            # M3U ID -> priority (0 = highest, by order in selected_m3us); streams
+            # from unselected M3Us get 999 when no M3U filter applies.
+            m3u_priority_map = None
             if selected_m3us_str:
                 selected_m3us = [m.strip() for m in selected_m3us_str.split(',') if m.strip()]
                 valid_m3u_ids = [m3u_name_to_id[name] for name in selected_m3us if name in m3u_name_to_id]
@@ -4535,32 +5100,27 @@ class Plugin:
                     logger.warning("[Stream-Mapparr] None of the specified M3U sources were found. Using all streams.")
                     selected_m3us = []
                     m3u_filter_info = " (all M3U sources - specified M3Us not found)"
-                    # Add default priority to all streams (no prioritization)
-                    for stream in all_streams_data:
-                        stream['_m3u_priority'] = 999  # Low priority for unspecified M3Us
                 else:
-                    # Create M3U ID to priority mapping (0 = highest priority)
-                    m3u_priority_map = {m3u_id: idx for idx, m3u_id in enumerate(valid_m3u_ids)}
-                    
-                    # Filter streams by m3u_account (which is the M3U account ID) and add priority
-                    filtered_streams = []
-                    for s in all_streams_data:
-                        m3u_id = s.get('m3u_account')
-                        if m3u_id in valid_m3u_ids:
-                            # Add priority metadata based on order in selected_m3us list
-                            s['_m3u_priority'] = m3u_priority_map[m3u_id]
-                            filtered_streams.append(s)
-                    
-                    logger.info(f"[Stream-Mapparr] Filtered streams from {len(all_streams_data)} to {len(filtered_streams)} based on M3U sources: {', '.join(selected_m3us)}")
+                    m3u_priority_map = self._m3u_priority_map(valid_m3u_ids)
                     logger.info(f"[Stream-Mapparr] M3U priority order: {', '.join([f'{name} (priority {idx})' for idx, name in enumerate(selected_m3us)])}")
-                    all_streams_data = filtered_streams
                     m3u_filter_info = f" in M3U sources: {', '.join(selected_m3us)}"
             else:
                 selected_m3us = []
                 m3u_filter_info = " (all M3U sources)"
-                # Add default priority to all streams (no prioritization when no M3U filter)
+
+            # Fetch streams via ORM, filtered server-side
+            self._send_progress_update("load_process_channels", 'running', 60, 'Fetching streams...', context)
+            logger.info("[Stream-Mapparr] Fetching streams via ORM...")
+            all_streams_data = self._get_all_streams(
+                logger, channel_group_ids=valid_stream_group_ids,
+                m3u_account_ids=list(m3u_priority_map) if m3u_priority_map is not None else None)
+            if m3u_priority_map is None:
                 for stream in all_streams_data:
                     stream['_m3u_priority'] = 999  # Low priority for unspecified M3Us
+            else:
+                for stream in all_streams_data:
+                    stream['_m3u_priority'] = m3u_priority_map.get(stream.get('m3u_account'), 999)
+            logger.info(f"[Stream-Mapparr] Fetched {len(all_streams_data)} streams{stream_group_filter_info}{m3u_filter_info}")
 
             self.loaded_channels = channels_to_process
             self.loaded_streams = all_streams_data
@@ -4588,8 +5148,8 @@ class Plugin:
             }
 
             self._send_progress_update("load_process_channels", 'running', 90, 'Saving processed data...', context)
-            with open(self.processed_data_file, 'w') as f:
-                json.dump(processed_data, f, indent=2)
+            _dump_json_path(self.processed_data_file, processed_data)
+            self._processed_data_handoff = processed_data
 
             logger.info("[Stream-Mapparr] Channel and stream data loaded and saved successfully")
             
@@ -4632,6 +5192,32 @@ class Plugin:
             labeled.append(f"{s['name']} [{src}]" if src else s['name'])
         return labeled
 
+    def _lower_threshold_rows(self, threshold_matches, current_threshold, matched_streams, logger):
+        """[(threshold, new stream count, labels), ...] for the streams that are NEW
+        at each threshold below current_threshold, highest first; callsign_*
+        keys are skipped.
+
+        Neighbouring thresholds usually have the same winner and so the same
+        streams (in separate lists), so each distinct stream-id sequence is
+        diffed and labelled only once.
+        """
+        current_stream_ids = frozenset(s['id'] for s in matched_streams)
+        rows = []
+        new_by_streams = {}
+        for threshold in sorted((t for t in threshold_matches
+                                 if isinstance(t, int) and t < current_threshold), reverse=True):
+            bucket = threshold_matches[threshold]['streams']
+            bucket_key = tuple(s['id'] for s in bucket)
+            diff = new_by_streams.get(bucket_key)
+            if diff is None:
+                new_streams = [s for s in bucket if s['id'] not in current_stream_ids]
+                diff = new_by_streams[bucket_key] = (
+                    (len(new_streams), self._label_streams(new_streams, logger))
+                    if new_streams else ())
+            if diff:
+                rows.append((threshold, *diff))
+        return rows
+
     def _label_streams(self, streams, logger):
         """Tag stream names with their M3U source for CSV output.
 
@@ -4724,32 +5310,35 @@ class Plugin:
         recommendations_added = False
         
         if threshold_data:
-            # Find lowest threshold with matches
-            lowest_threshold_with_matches = None
-            threshold_summary = {}
+            # Streams matched per threshold, and a few token-mismatch examples
+            # from the thresholds below the current one
+            threshold_summary = Counter()
             token_mismatch_examples = []
-            
+
             for channel_name, thresholds in threshold_data.items():
+                channel_tokens = None
                 for threshold, data in thresholds.items():
-                    if isinstance(threshold, int) and data.get('streams'):
-                        if lowest_threshold_with_matches is None or threshold < lowest_threshold_with_matches:
-                            lowest_threshold_with_matches = threshold
-                        
-                        if threshold not in threshold_summary:
-                            threshold_summary[threshold] = 0
-                        threshold_summary[threshold] += len(data['streams'])
-                        
-                        # Analyze token mismatches
-                        if threshold < current_threshold:
-                            for stream in data['streams'][:2]:  # Check first 2 streams
-                                mismatch_info = self._analyze_token_mismatch(channel_name, _mname(stream))
-                                if mismatch_info and len(token_mismatch_examples) < 3:
-                                    token_mismatch_examples.append({
-                                        'channel': channel_name,
-                                        'stream': stream['name'],
-                                        'mismatch': mismatch_info
-                                    })
-            
+                    if not (isinstance(threshold, int) and data.get('streams')):
+                        continue
+                    threshold_summary[threshold] += len(data['streams'])
+
+                    # Analyze token mismatches until three examples are found
+                    if threshold < current_threshold and len(token_mismatch_examples) < 3:
+                        if channel_tokens is None:
+                            channel_tokens = _MULTI_CHAR_WORD_RE.findall(channel_name.lower())
+                        for stream in data['streams'][:2]:  # Check first 2 streams
+                            mismatch_info = self._analyze_token_mismatch(channel_name, _mname(stream), channel_tokens)
+                            if mismatch_info:
+                                token_mismatch_examples.append({
+                                    'channel': channel_name,
+                                    'stream': stream['name'],
+                                    'mismatch': mismatch_info
+                                })
+                                if len(token_mismatch_examples) >= 3:
+                                    break
+
+            lowest_threshold_with_matches = min(threshold_summary, default=None)
+
             # Add threshold recommendation if lower thresholds have matches
             if lowest_threshold_with_matches and lowest_threshold_with_matches < current_threshold:
                 if not recommendations_added:
@@ -4830,17 +5419,17 @@ class Plugin:
         
         return '\n'.join(header_lines) + '\n'
 
-    def _analyze_token_mismatch(self, channel_name, stream_name):
+    def _analyze_token_mismatch(self, channel_name, stream_name, channel_tokens=None):
         """Analyze if channel and stream names have mismatched first or last tokens.
-        
+
+        channel_tokens may be passed in when the same channel is checked against
+        several streams.
+
         Returns dict with mismatch info or None if tokens match well.
         """
-        # Clean names for comparison
-        channel_clean = re.sub(r'[^\w\s]', ' ', channel_name.lower())
-        stream_clean = re.sub(r'[^\w\s]', ' ', stream_name.lower())
-        
-        channel_tokens = [t for t in channel_clean.split() if len(t) > 1]
-        stream_tokens = [t for t in stream_clean.split() if len(t) > 1]
+        if channel_tokens is None:
+            channel_tokens = _MULTI_CHAR_WORD_RE.findall(channel_name.lower())
+        stream_tokens = _MULTI_CHAR_WORD_RE.findall(stream_name.lower())
         
         if not channel_tokens or not stream_tokens:
             return None
@@ -4883,20 +5472,125 @@ class Plugin:
         
         return None
 
-    def _sort_channels_by_priority(self, channels):
-        """Sort channels by quality tag priority, then by channel number."""
-        def get_priority_key(channel):
-            quality_tag = self._extract_channel_quality_tag(channel['name'])
+    @staticmethod
+    def _existing_streams_by_channel(channel_ids):
+        """channel_id -> set of assigned stream ids for many channels, in one query
+        (feeds _write_channel_streams when not overwriting)."""
+        by_channel = defaultdict(set)
+        for channel_id, stream_id in ChannelStream.objects.filter(
+                channel_id__in=list(channel_ids)).values_list('channel_id', 'stream_id'):
+            by_channel[channel_id].add(stream_id)
+        return dict(by_channel)
+
+    def _prefetch_existing_streams(self, channel_ids, logger):
+        """_existing_streams_by_channel, or None if the read fails so that each
+        _write_channel_streams call reads its own channel instead."""
+        try:
+            return self._existing_streams_by_channel(channel_ids)
+        except Exception as e:
+            logger.warning(f"[Stream-Mapparr] Could not prefetch existing channel streams, reading per channel: {e}")
+            return None
+
+    def _assign_ota_streams(self, matched_channels, overwrite, logger):
+        """Write each matched OTA channel's stream_ids. Without overwrite, the
+        current assignments are read per EXISTING_STREAMS_PREFETCH_CHANNELS chunk,
+        just before that chunk is written. Returns (success_count, error_count)."""
+        success_count = 0
+        error_count = 0
+        existing_streams_by_channel = None
+        prefetch_size = PluginConfig.EXISTING_STREAMS_PREFETCH_CHANNELS
+
+        next_progress_log = time.monotonic() + PluginConfig.PROGRESS_LOG_MIN_INTERVAL
+        for idx, channel_data in enumerate(matched_channels, 1):
+            if not overwrite and (idx - 1) % prefetch_size == 0:
+                existing_streams_by_channel = self._prefetch_existing_streams(
+                    (c['channel_id'] for c in matched_channels[idx - 1:idx - 1 + prefetch_size]), logger)
             try:
-                quality_index = self.CHANNEL_QUALITY_TAG_ORDER.index(quality_tag)
-            except ValueError:
-                quality_index = len(self.CHANNEL_QUALITY_TAG_ORDER)
+                channel_id = channel_data['channel_id']
+                stream_ids = channel_data['stream_ids']
+
+                now = time.monotonic()
+                if now >= next_progress_log:
+                    logger.info(f"[Stream-Mapparr] Assigning streams {idx}/{len(matched_channels)}...")
+                    next_progress_log = now + PluginConfig.PROGRESS_LOG_MIN_INTERVAL
+
+                self._write_channel_streams(
+                    channel_id, stream_ids, overwrite, existing_streams_by_channel)
+
+                success_count += 1
+
+            except Exception as e:
+                logger.error(f"[Stream-Mapparr] Error assigning streams to channel {channel_data['channel_name']}: {e}")
+                error_count += 1
+        return success_count, error_count
+
+    @staticmethod
+    def _ordered_streams_by_channel(channel_ids):
+        """channel_id -> assigned stream ids in `order`, for many channels in one query."""
+        by_channel = defaultdict(list)
+        for channel_id, stream_id in ChannelStream.objects.filter(
+                channel_id__in=list(channel_ids)).order_by('order').values_list('channel_id', 'stream_id'):
+            by_channel[channel_id].append(stream_id)
+        return dict(by_channel)
+
+    def _write_channel_streams(self, channel_id, stream_ids, overwrite, existing_by_channel=None):
+        """Assign stream_ids to a channel, list position as `order`, in one transaction.
+
+        With overwrite the channel's current streams are replaced, so the delete
+        and insert commit together and the channel is never briefly empty;
+        otherwise streams it already has are skipped (existing_by_channel, when
+        prefetched by the caller, saves the per-channel query). Rows go in with
+        one bulk_create (batched by CHANNEL_STREAM_BULK_BATCH_SIZE). Returns the
+        number of rows inserted.
+        """
+        with transaction.atomic():
+            if overwrite:
+                ChannelStream.objects.filter(channel_id=channel_id).delete()
+                existing_stream_ids = ()
+            elif existing_by_channel is not None:
+                existing_stream_ids = existing_by_channel.get(channel_id, ())
+            else:
+                existing_stream_ids = set(ChannelStream.objects.filter(
+                    channel_id=channel_id).values_list('stream_id', flat=True))
+            rows = [
+                ChannelStream(channel_id=channel_id, stream_id=stream_id, order=order)
+                for order, stream_id in enumerate(stream_ids)
+                if stream_id not in existing_stream_ids
+            ]
+            if rows:
+                ChannelStream.objects.bulk_create(
+                    rows, batch_size=PluginConfig.CHANNEL_STREAM_BULK_BATCH_SIZE)
+        return len(rows)
 
-            channel_number = channel.get('channel_number', 999999)
-            if channel_number is None: channel_number = 999999
-            return (quality_index, channel_number)
+    @staticmethod
+    def _set_profile_channels_enabled(profile_id, channel_ids, enabled):
+        """Set `enabled` on a profile's memberships for channel_ids, in UPDATEs of at
+        most VISIBILITY_UPDATE_BATCH_SIZE ids so each IN list stays small. Returns
+        the number of rows that actually changed."""
+        channel_ids = list(channel_ids)
+        batch_size = PluginConfig.VISIBILITY_UPDATE_BATCH_SIZE
+        updated = 0
+        for start in range(0, len(channel_ids), batch_size):
+            # Rows already in the target state are left out of the UPDATE
+            updated += ChannelProfileMembership.objects.filter(
+                channel_profile_id=profile_id,
+                channel_id__in=channel_ids[start:start + batch_size],
+                enabled=not enabled
+            ).update(enabled=enabled)
+        return updated
 
-        return sorted(channels, key=get_priority_key)
+    def _channel_priority_key(self, channel):
+        """(quality tag rank, channel number); lower sorts first."""
+        quality_tag = self._extract_channel_quality_tag(channel['name'])
+        quality_index = self._CHANNEL_QUALITY_TAG_RANK.get(quality_tag, len(self.CHANNEL_QUALITY_TAG_ORDER))
+
+        channel_number = channel.get('channel_number', 999999)
+        if channel_number is None: channel_number = 999999
+        return (quality_index, channel_number)
+
+    def _sort_channels_by_priority(self, channels):
+        """Sort channels by quality tag priority, then by channel number."""
+        return sorted(channels, key=self._channel_priority_key)
 
     def preview_changes_action(self, settings, logger, context=None):
         """Preview which streams will be added to channels without making changes."""
@@ -4915,8 +5609,7 @@ class Plugin:
             if has_errors: return {"status": "error", "message": "Validation failed."}
 
             channels_data = self._load_channels_data(logger, settings)
-            with open(self.processed_data_file, 'r') as f:
-                processed_data = json.load(f)
+            processed_data = self._take_processed_data()
 
             channels = processed_data.get('channels', [])
             streams = processed_data.get('streams', [])
@@ -4946,16 +5639,12 @@ class Plugin:
                     ignore_quality=ignore_quality, ignore_regional=ignore_regional,
                     ignore_geographic=ignore_geographic, ignore_misc=ignore_misc)
 
-            channel_groups = {}
+            channel_groups = defaultdict(list)
             for channel in channels:
-                channel_info = self._get_channel_info_from_json(channel['name'], channels_data, logger)
-                if self._is_ota_channel(channel_info):
-                    callsign = channel_info.get('callsign', '')
-                    group_key = f"OTA_{callsign}" if callsign else self._clean_channel_name(channel['name'], ignore_tags)
-                else:
-                    group_key = self._clean_channel_name(channel['name'], ignore_tags, ignore_quality, ignore_regional, ignore_geographic, ignore_misc)
+                group_key = self._channel_group_key(
+                    channel['name'], channels_data, logger, ignore_tags,
+                    ignore_quality, ignore_regional, ignore_geographic, ignore_misc)
 
-                if group_key not in channel_groups: channel_groups[group_key] = []
                 channel_groups[group_key].append(channel)
 
             # bug-068: same zone-aware routing as Match & Assign, so the preview
@@ -5010,18 +5699,21 @@ class Plugin:
                 _updated_ids = {c['id'] for c in channels_to_update}
                 channels_not_updated = [c for c in sorted_channels if c['id'] not in _updated_ids]
 
+                # Threshold analysis for the group, from the same primary channel the
+                # current-threshold matches above come from; shared by every row.
+                threshold_matches = self._get_matches_at_thresholds(
+                    sorted_channels[0], streams, logger, ignore_tags, ignore_quality,
+                    ignore_regional, ignore_geographic, ignore_misc, channels_data,
+                    current_threshold, restrict_matching_to_country,
+                    allow_same_name_streams
+                ) if channels_to_update else {}
+                lower_threshold_rows = self._lower_threshold_rows(
+                    threshold_matches, current_threshold, matched_streams, logger)
+
                 for channel in channels_to_update:
                     match_count = len(matched_streams)
                     streams_for_channel = self._streams_for_channel(matched_streams, channel['id'], zone_routed)
 
-                    # Get detailed threshold analysis
-                    threshold_matches = self._get_matches_at_thresholds(
-                        channel, streams, logger, ignore_tags, ignore_quality,
-                        ignore_regional, ignore_geographic, ignore_misc, channels_data,
-                        current_threshold, restrict_matching_to_country,
-                        allow_same_name_streams
-                    )
-                    
                     # Store threshold analysis for recommendations
                     threshold_data[channel['name']] = threshold_matches
                     
@@ -5046,24 +5738,16 @@ class Plugin:
                         })
                     
                     # Add rows for additional matches at lower thresholds
-                    for threshold in sorted([t for t in threshold_matches.keys() if isinstance(t, int) and t < current_threshold], reverse=True):
-                        threshold_info = threshold_matches[threshold]
-                        threshold_streams = threshold_info['streams']
-                        
-                        # Find streams that are NEW at this threshold (not in current matches)
-                        current_stream_ids = {s['id'] for s in matched_streams}
-                        new_streams = [s for s in threshold_streams if s['id'] not in current_stream_ids]
-                        
-                        if new_streams:
-                            all_matches.append({
-                                "channel_id": channel['id'],
-                                "channel_name": f"  └─ (at threshold {threshold})",
-                                "threshold": threshold,
-                                "matched_streams": len(new_streams),
-                                "stream_names": self._label_streams(new_streams, logger),
-                                "will_update": False,
-                                "is_current": False
-                            })
+                    for threshold, new_count, new_labels in lower_threshold_rows:
+                        all_matches.append({
+                            "channel_id": channel['id'],
+                            "channel_name": f"  └─ (at threshold {threshold})",
+                            "threshold": threshold,
+                            "matched_streams": new_count,
+                            "stream_names": new_labels,
+                            "will_update": False,
+                            "is_current": False
+                        })
 
                 for channel in channels_not_updated:
                     all_matches.append({
@@ -5089,7 +5773,7 @@ class Plugin:
             filepath = os.path.join("/data/exports", filename)
             os.makedirs("/data/exports", exist_ok=True)
 
-            with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
+            with open(filepath, 'w', newline='', encoding='utf-8', buffering=PluginConfig.CSV_EXPORT_BUFFER_BYTES) as csvfile:
                 header_comment = self._generate_csv_header_comment(settings, processed_data,
                                                                    action_name="Preview Changes (Dry Run)",
                                                                    is_scheduled=False,
@@ -5099,15 +5783,14 @@ class Plugin:
                 fieldnames = ['will_update', 'threshold', 'channel_id', 'channel_name', 'matched_streams', 'stream_names']
                 writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
                 writer.writeheader()
-                for match in all_matches:
-                    writer.writerow({
-                        'will_update': 'Yes' if match['will_update'] else 'No',
-                        'threshold': match.get('threshold', current_threshold),
-                        'channel_id': match['channel_id'],
-                        'channel_name': match['channel_name'],
-                        'matched_streams': match['matched_streams'],
-                        'stream_names': '; '.join(match.get('stream_names', []))
-                    })
+                writer.writerows({
+                    'will_update': _YES_NO[bool(match['will_update'])],
+                    'threshold': match.get('threshold', current_threshold),
+                    'channel_id': match['channel_id'],
+                    'channel_name': match['channel_name'],
+                    'matched_streams': match['matched_streams'],
+                    'stream_names': '; '.join(match.get('stream_names', []))
+                } for match in all_matches)
 
             # Log CSV creation prominently
             logger.info(f"[Stream-Mapparr] 📄 CSV PREVIEW REPORT CREATED: {filepath}")
@@ -5184,7 +5867,7 @@ class Plugin:
         # Check dry run mode
         dry_run = settings.get('dry_run_mode', False)
         if isinstance(dry_run, str):
-            dry_run = dry_run.lower() in ('true', 'yes', '1')
+            dry_run = dry_run.lower() in _TRUTHY_STRINGS
         
         mode_label = "DRY RUN (Preview)" if dry_run else "LIVE MODE"
         logger.info(f"[Stream-Mapparr] === MATCH & ASSIGN STREAMS ACTION STARTED ({mode_label}) ===")
@@ -5201,8 +5884,7 @@ class Plugin:
             limiter = SmartRateLimiter(settings.get("rate_limiting", "none"), logger)
             
             channels_data = self._load_channels_data(logger, settings)
-            with open(self.processed_data_file, 'r') as f:
-                processed_data = json.load(f)
+            processed_data = self._take_processed_data()
 
             channels = processed_data.get('channels', [])
             streams = processed_data.get('streams', [])
@@ -5212,7 +5894,7 @@ class Plugin:
             ignore_tags = processed_data.get('ignore_tags', [])
             visible_channel_limit = processed_data.get('visible_channel_limit', PluginConfig.DEFAULT_VISIBLE_CHANNEL_LIMIT)
             overwrite_streams = settings.get('overwrite_streams', PluginConfig.DEFAULT_OVERWRITE_STREAMS)
-            if isinstance(overwrite_streams, str): overwrite_streams = overwrite_streams.lower() in ('true', 'yes', '1')
+            if isinstance(overwrite_streams, str): overwrite_streams = overwrite_streams.lower() in _TRUTHY_STRINGS
 
             ignore_quality = processed_data.get('ignore_quality', True)
             ignore_regional = processed_data.get('ignore_regional', True)
@@ -5234,16 +5916,12 @@ class Plugin:
                     ignore_quality=ignore_quality, ignore_regional=ignore_regional,
                     ignore_geographic=ignore_geographic, ignore_misc=ignore_misc)
 
-            channel_groups = {}
+            channel_groups = defaultdict(list)
             for channel in channels:
-                channel_info = self._get_channel_info_from_json(channel['name'], channels_data, logger)
-                if self._is_ota_channel(channel_info):
-                    callsign = channel_info.get('callsign', '')
-                    group_key = f"OTA_{callsign}" if callsign else self._clean_channel_name(channel['name'], ignore_tags)
-                else:
-                    group_key = self._clean_channel_name(channel['name'], ignore_tags, ignore_quality, ignore_regional, ignore_geographic, ignore_misc)
+                group_key = self._channel_group_key(
+                    channel['name'], channels_data, logger, ignore_tags,
+                    ignore_quality, ignore_regional, ignore_geographic, ignore_misc)
 
-                if group_key not in channel_groups: channel_groups[group_key] = []
                 channel_groups[group_key].append(channel)
 
             # bug-068: zone-aware routing. Map channels that share a zone-stripped
@@ -5281,6 +5959,11 @@ class Plugin:
             # them instead of re-running the fuzzy-match pipeline.
             group_match_cache = {}
 
+            # One query for which loaded channels still exist, instead of an
+            # exists() per channel inside the loop.
+            existing_channel_ids = set(Channel.objects.filter(
+                id__in=[c['id'] for c in channels]).values_list('id', flat=True))
+
             for group_key, group_channels in channel_groups.items():
                 limiter.wait() # Rate limit processing
                 sorted_channels = self._sort_channels_by_priority(group_channels)
@@ -5303,11 +5986,21 @@ class Plugin:
                     'channels_to_update': channels_to_update,
                 }
 
+                # Without overwrite, each write skips streams the channel already
+                # has. Read those for the whole group in one query, right before
+                # its writes, so assignments changed while earlier groups were
+                # being matched are seen. If that read fails, each write reads
+                # its own channel instead.
+                existing_streams_by_channel = None
+                if matched_streams and not (dry_run or overwrite_streams):
+                    existing_streams_by_channel = self._prefetch_existing_streams(
+                        (c['id'] for c in channels_to_update if c['id'] in existing_channel_ids), logger)
+
                 for channel in channels_to_update:
                     channel_id = channel['id']
 
                     # Validate that channel exists in database before attempting operations
-                    if not Channel.objects.filter(id=channel_id).exists():
+                    if channel_id not in existing_channel_ids:
                         logger.warning(f"[Stream-Mapparr] Skipping channel '{channel['name']}' (ID: {channel_id}) - channel no longer exists in database. Consider reloading channels.")
                         channels_skipped += 1
                         continue
@@ -5320,25 +6013,12 @@ class Plugin:
                         if matched_streams:
                             # Only apply changes if not in dry run mode
                             if not dry_run:
-                                if overwrite_streams:
-                                    ChannelStream.objects.filter(channel_id=channel_id).delete()
-
-                                # Bulk insert to collapse N round-trips to 1. The list is
-                                # quality-sorted (see _sort_streams_by_quality), optionally
-                                # zone-reordered above, so the enumerate index is the
+                                # The list is quality-sorted (see _sort_streams_by_quality),
+                                # optionally zone-reordered above, so its index is the
                                 # correct `order` value for each row.
-                                existing_stream_ids = (
-                                    set() if overwrite_streams
-                                    else set(ChannelStream.objects.filter(channel_id=channel_id).values_list('stream_id', flat=True))
-                                )
-                                rows = [
-                                    ChannelStream(channel_id=channel_id, stream_id=stream['id'], order=index)
-                                    for index, stream in enumerate(streams_for_channel)
-                                    if overwrite_streams or stream['id'] not in existing_stream_ids
-                                ]
-                                if rows:
-                                    ChannelStream.objects.bulk_create(rows)
-                                streams_added = len(rows)
+                                streams_added = self._write_channel_streams(
+                                    channel_id, [stream['id'] for stream in streams_for_channel],
+                                    overwrite_streams, existing_streams_by_channel)
                                 total_streams_added += streams_added
                             else:
                                 # Dry run: just count what would be added
@@ -5374,7 +6054,7 @@ class Plugin:
             # CSV Export - create if dry run OR if setting is enabled
             create_csv = settings.get('enable_scheduled_csv_export', PluginConfig.DEFAULT_ENABLE_CSV_EXPORT)
             if isinstance(create_csv, str):
-                create_csv = create_csv.lower() in ('true', 'yes', '1')
+                create_csv = create_csv.lower() in _TRUTHY_STRINGS
             
             # Always create CSV in dry run mode
             if dry_run or create_csv:
@@ -5389,30 +6069,28 @@ class Plugin:
                     # Threshold analysis is intentionally skipped here; it belongs in
                     # Preview Changes. This loop was previously the wall-clock bottleneck
                     # (a full re-match plus 5 threshold variants per channel).
-                    csv_data = []
+                    # Only one summary per group is kept (its channels share the
+                    # labels); the per-channel rows are generated while writing.
+                    group_rows = []
                     low_match_channels = []
                     threshold_data = {}
                     current_threshold = self._resolve_match_threshold(settings)
 
                     for group_key, cache_entry in group_match_cache.items():
                         matched_streams = cache_entry['matched_streams']
-                        for channel in cache_entry['channels_to_update']:
-                            match_count = len(matched_streams)
-                            csv_data.append({
-                                'channel_id': channel['id'],
-                                'channel_name': channel['name'],
-                                'threshold': current_threshold,
-                                'matched_streams': match_count,
-                                'stream_names': '; '.join(self._label_streams(matched_streams, logger)),
-                            })
-                            if 0 < match_count <= 3:
+                        match_count = len(matched_streams)
+                        labels = self._label_streams(matched_streams, logger) if match_count else []
+                        group_rows.append((cache_entry['channels_to_update'], match_count,
+                                           '; '.join(labels) if labels else ''))
+                        if 0 < match_count <= 3:
+                            for channel in cache_entry['channels_to_update']:
                                 low_match_channels.append({
                                     'name': channel['name'],
                                     'count': match_count,
-                                    'streams': self._label_streams(matched_streams[:3], logger),
+                                    'streams': labels[:3],
                                 })
 
-                    with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
+                    with open(filepath, 'w', newline='', encoding='utf-8', buffering=PluginConfig.CSV_EXPORT_BUFFER_BYTES) as csvfile:
                         header_comment = self._generate_csv_header_comment(settings, processed_data,
                                                                           action_name="Match & Assign Streams",
                                                                           is_scheduled=is_scheduled,
@@ -5424,12 +6102,18 @@ class Plugin:
                         fieldnames = ['threshold', 'channel_id', 'channel_name', 'matched_streams', 'stream_names']
                         writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
                         writer.writeheader()
-                        for row in csv_data:
-                            writer.writerow(row)
+                        writer.writerows({
+                            'channel_id': channel['id'],
+                            'channel_name': channel['name'],
+                            'threshold': current_threshold,
+                            'matched_streams': match_count,
+                            'stream_names': stream_names,
+                        } for channels_in_group, match_count, stream_names in group_rows
+                          for channel in channels_in_group)
 
                     # Log CSV creation prominently
                     logger.info(f"[Stream-Mapparr] 📄 CSV EXPORT CREATED: {filepath}")
-                    logger.info(f"[Stream-Mapparr] Export contains {len(csv_data)} channel updates")
+                    logger.info(f"[Stream-Mapparr] Export contains {sum(len(channels_in_group) for channels_in_group, _, _ in group_rows)} channel updates")
                     csv_created = filepath
                 except Exception as e:
                     logger.error(f"[Stream-Mapparr] Failed to create CSV export: {e}")
@@ -5486,11 +6170,12 @@ class Plugin:
         """
         try:
             allow_same_name_streams = self._resolve_allow_same_name_streams(settings)
-            # Check dry run mode
-            dry_run = settings.get('dry_run_mode', False)
-            if isinstance(dry_run, str):
-                dry_run = dry_run.lower() in ('true', 'yes', '1')
-            
+            # Resolve every boolean setting once, up front
+            dry_run = self._get_bool_setting(settings, 'dry_run_mode', False)
+            filter_dead = self._get_bool_setting(settings, 'filter_dead_streams', False)
+            overwrite = self._get_bool_setting(
+                settings, 'overwrite_streams', PluginConfig.DEFAULT_OVERWRITE_STREAMS)
+
             mode_label = "PREVIEW" if dry_run else "LIVE"
             logger.info(f"[Stream-Mapparr] ========== US OTA MATCHING STARTED ({mode_label} MODE) ==========")
             
@@ -5513,26 +6198,22 @@ class Plugin:
             # Load channels via ORM
             logger.info("[Stream-Mapparr] Loading channels via ORM...")
 
-            profile_names_str = settings.get("profile_name") or ""
-            profile_names_str = profile_names_str.strip() if profile_names_str else ""
+            profile_names_str = self._setting_str(settings, "profile_name")
             if profile_names_str == "_none":
                 profile_names_str = ""
-            selected_groups_str = settings.get("selected_groups") or ""
-            selected_groups_str = selected_groups_str.strip() if selected_groups_str else ""
+            selected_groups_str = self._setting_str(settings, "selected_groups")
 
             profile_names = [name.strip() for name in profile_names_str.split(',') if name.strip()]
 
             # Fetch profiles via ORM
             profiles = self._get_all_profiles(logger)
 
+            profiles_by_lower_name = self._profiles_by_lower_name(profiles)
+
             target_profiles = []
             profile_ids = []
             for profile_name in profile_names:
-                found_profile = None
-                for profile in profiles:
-                    if profile.get('name', '').lower() == profile_name.lower():
-                        found_profile = profile
-                        break
+                found_profile = profiles_by_lower_name.get(profile_name.lower())
                 if not found_profile:
                     return {"status": "error", "message": f"Profile '{profile_name}' not found."}
                 target_profiles.append(found_profile)
@@ -5542,30 +6223,25 @@ class Plugin:
             group_name_to_id = {}
             if selected_groups_str:
                 all_groups = self._get_all_groups(logger)
-                group_name_to_id = {g['name']: g['id'] for g in all_groups if 'name' in g and 'id' in g}
-
-            # Fetch all channels via ORM
-            all_channels = self._get_all_channels(logger)
+                group_name_to_id = self._name_to_id(all_groups)
 
-            # Filter channels by profile (single bulk query)
-            profile_channel_ids = set(ChannelProfileMembership.objects.filter(
+            # Profile membership and the group filter resolve in one subquery, so
+            # only the channels this action matches are fetched.
+            memberships = ChannelProfileMembership.objects.filter(
                 channel_profile_id__in=profile_ids,
                 enabled=True
-            ).values_list('channel_id', flat=True))
-            channels_in_profile = [ch for ch in all_channels if ch['id'] in profile_channel_ids]
-
-            # Filter by groups if specified
+            )
             if selected_groups_str:
                 selected_groups = [g.strip() for g in selected_groups_str.split(',') if g.strip()]
-                valid_group_ids = [group_name_to_id[name] for name in selected_groups if name in group_name_to_id]
+                valid_group_ids = {group_name_to_id[name] for name in selected_groups if name in group_name_to_id}
                 if not valid_group_ids:
                     return {"status": "error", "message": "None of the specified groups were found."}
+                memberships = memberships.filter(channel__channel_group_id__in=valid_group_ids)
 
-                filtered_channels = [ch for ch in channels_in_profile if ch.get('channel_group_id') in valid_group_ids]
-                channels = filtered_channels
+            channels = self._get_all_channels(logger, channel_ids=memberships.values('channel_id'))
+            if selected_groups_str:
                 logger.info(f"[Stream-Mapparr] Filtered to {len(channels)} channels in groups: {', '.join(selected_groups)}")
             else:
-                channels = channels_in_profile
                 logger.info(f"[Stream-Mapparr] Using all channels from profile (no group filter)")
 
             if not channels:
@@ -5590,10 +6266,6 @@ class Plugin:
             logger.info(f"[Stream-Mapparr] Loaded {len(all_streams)} streams")
             
             # Filter dead streams if enabled
-            filter_dead = settings.get('filter_dead_streams', False)
-            if isinstance(filter_dead, str):
-                filter_dead = filter_dead.lower() in ('true', 'yes', '1')
-            
             working_streams = all_streams
             if filter_dead:
                 logger.info("[Stream-Mapparr] Filtering dead streams (0x0 resolution)...")
@@ -5607,23 +6279,33 @@ class Plugin:
             logger.info("[Stream-Mapparr] Matching channels using US OTA callsign database...")
             logger.info("[Stream-Mapparr] Note: Only channels with valid US callsigns will be matched")
             
+            # One pass over the streams indexes them by callsign-shaped word.
+            callsign_stream_index = self._ota_callsign_stream_index(working_streams, us_callsign_db)
+            named_streams = None  # (stream, match name) pairs, built if a scan is needed
+
             matched_channels = []
             skipped_no_callsign = 0
             skipped_not_in_db = 0
             skipped_no_streams = 0
             
+            next_progress_log = time.monotonic() + PluginConfig.PROGRESS_LOG_MIN_INTERVAL
             for idx, channel in enumerate(channels, 1):
                 channel_name = channel.get('name', '')
                 channel_id = channel.get('id')
-                
-                if idx % 100 == 0:
+
+                # Time-based, so the cadence stays readable however fast the loop runs
+                now = time.monotonic()
+                if now >= next_progress_log:
                     logger.info(f"[Stream-Mapparr] Processing channel {idx}/{len(channels)}...")
+                    next_progress_log = now + PluginConfig.PROGRESS_LOG_MIN_INTERVAL
                 
                 # Extract callsign from Dispatcharr channel name using fuzzy_matcher
-                callsign = self.fuzzy_matcher.extract_callsign(channel_name)
+                # (skipped outright when the name cannot contain one)
+                callsign = (self.fuzzy_matcher.extract_callsign(channel_name)
+                            if _US_CALLSIGN_HINT_RE.search(channel_name) else None)
                 
                 if not callsign:
-                    logger.debug(f"[Stream-Mapparr] Skipping '{channel_name}' - no US callsign found")
+                    logger.debug("[Stream-Mapparr] Skipping '%s' - no US callsign found", channel_name)
                     skipped_no_callsign += 1
                     continue
                 
@@ -5632,29 +6314,36 @@ class Plugin:
                 
                 # Check if callsign exists in US database
                 if base_callsign not in us_callsign_db:
-                    logger.debug(f"[Stream-Mapparr] Skipping '{channel_name}' - callsign '{base_callsign}' not in US database")
+                    logger.debug("[Stream-Mapparr] Skipping '%s' - callsign '%s' not in US database",
+                                 channel_name, base_callsign)
                     skipped_not_in_db += 1
                     continue
                 
                 # Search streams for callsign (uppercase only)
                 matching_streams = []
                 
-                # Create regex pattern for base callsign + variations
-                # Matches: WKRG, WKRG-DT, WKRG-DT2, etc. (case-sensitive)
-                callsign_pattern = r'\b' + re.escape(base_callsign) + r'(?:-[A-Z]{2}\d?)?\b'
+                # Base callsign + variations: WKRG, WKRG-DT, WKRG-DT2, etc. (case-sensitive).
+                # Single-word callsigns come straight from the stream word index.
+                if _WORD_RE.fullmatch(base_callsign):
+                    candidate_streams = callsign_stream_index.get(base_callsign, ())
+                else:
+                    # The match is case-sensitive, so a plain substring test
+                    # rejects most names before the regex runs.
+                    callsign_search = _ota_callsign_pattern(base_callsign).search
+                    if named_streams is None:
+                        named_streams = [(s, _mname(s)) for s in working_streams]
+                    candidate_streams = [s for s, name in named_streams
+                                         if base_callsign in name and callsign_search(name)]
                 needs_corroboration = self._callsign_needs_corroboration(base_callsign)
 
-                for stream in working_streams:
-                    stream_name = _mname(stream)
-
-                    # Search for uppercase callsign occurrences only
-                    if re.search(callsign_pattern, stream_name):
-                        if needs_corroboration and not self._callsign_corroborated(stream_name, base_callsign):
-                            continue
-                        matching_streams.append(stream)
+                for stream in candidate_streams:
+                    if needs_corroboration and not self._callsign_corroborated(_mname(stream), base_callsign):
+                        continue
+                    matching_streams.append(stream)
                 
                 if not matching_streams:
-                    logger.debug(f"[Stream-Mapparr] No streams found for '{channel_name}' (callsign: {base_callsign})")
+                    logger.debug("[Stream-Mapparr] No streams found for '%s' (callsign: %s)",
+                                 channel_name, base_callsign)
                     skipped_no_streams += 1
                     continue
                 
@@ -5672,7 +6361,8 @@ class Plugin:
                     'match_type': f'US OTA callsign: {base_callsign}'
                 })
                 
-                logger.debug(f"[Stream-Mapparr] Matched '{channel_name}' ({base_callsign}) with {len(sorted_streams)} stream(s)")
+                logger.debug("[Stream-Mapparr] Matched '%s' (%s) with %d stream(s)",
+                             channel_name, base_callsign, len(sorted_streams))
             
             # Log summary
             logger.info(f"[Stream-Mapparr] ===== US OTA Matching Summary =====")
@@ -5705,7 +6395,7 @@ class Plugin:
                     'selected_m3us': []
                 }
                 
-                with open(csv_filepath, 'w', newline='', encoding='utf-8') as csvfile:
+                with open(csv_filepath, 'w', newline='', encoding='utf-8', buffering=PluginConfig.CSV_EXPORT_BUFFER_BYTES) as csvfile:
                     # Write header comment
                     csvfile.write(self._generate_csv_header_comment(
                         settings=settings,
@@ -5718,18 +6408,15 @@ class Plugin:
                     writer = csv.writer(csvfile)
                     writer.writerow(['will_update', 'channel_id', 'channel_name', 'callsign', 'matched_streams', 'stream_names'])
                     
-                    for channel_data in matched_channels:
-                        will_update = "yes" if not dry_run else "preview"
-                        stream_names = "; ".join(channel_data['stream_names'])
-                        
-                        writer.writerow([
-                            will_update,
-                            channel_data['channel_id'],
-                            channel_data['channel_name'],
-                            channel_data['callsign'],
-                            len(channel_data['stream_ids']),
-                            stream_names
-                        ])
+                    will_update = "yes" if not dry_run else "preview"
+                    writer.writerows([
+                        will_update,
+                        channel_data['channel_id'],
+                        channel_data['channel_name'],
+                        channel_data['callsign'],
+                        len(channel_data['stream_ids']),
+                        "; ".join(channel_data['stream_names'])
+                    ] for channel_data in matched_channels)
                 
                 logger.info(f"📄 [Stream-Mapparr] CSV export created: {csv_filepath}")
                 
@@ -5754,42 +6441,7 @@ class Plugin:
                 }
             
             # Assign streams to channels (LIVE MODE using Django ORM)
-            overwrite = settings.get('overwrite_streams', PluginConfig.DEFAULT_OVERWRITE_STREAMS)
-            if isinstance(overwrite, str):
-                overwrite = overwrite.lower() in ('true', 'yes', '1')
-            
-            success_count = 0
-            error_count = 0
-            
-            for idx, channel_data in enumerate(matched_channels, 1):
-                try:
-                    channel_id = channel_data['channel_id']
-                    stream_ids = channel_data['stream_ids']
-                    
-                    if idx % 50 == 0:
-                        logger.info(f"[Stream-Mapparr] Assigning streams {idx}/{len(matched_channels)}...")
-                    
-                    if overwrite:
-                        ChannelStream.objects.filter(channel_id=channel_id).delete()
-
-                    # Bulk insert to collapse N round-trips to 1.
-                    existing_stream_ids = (
-                        set() if overwrite
-                        else set(ChannelStream.objects.filter(channel_id=channel_id).values_list('stream_id', flat=True))
-                    )
-                    rows = [
-                        ChannelStream(channel_id=channel_id, stream_id=stream_id, order=order)
-                        for order, stream_id in enumerate(stream_ids)
-                        if overwrite or stream_id not in existing_stream_ids
-                    ]
-                    if rows:
-                        ChannelStream.objects.bulk_create(rows)
-
-                    success_count += 1
-                    
-                except Exception as e:
-                    logger.error(f"[Stream-Mapparr] Error assigning streams to channel {channel_data['channel_name']}: {e}")
-                    error_count += 1
+            success_count, error_count = self._assign_ota_streams(matched_channels, overwrite, logger)
             
             logger.info(f"✅ [Stream-Mapparr] US OTA MATCHING COMPLETED")
             logger.info(f"[Stream-Mapparr] Successfully assigned: {success_count} channels")
@@ -5827,7 +6479,7 @@ class Plugin:
             # Check dry run mode
             dry_run = settings.get('dry_run_mode', False)
             if isinstance(dry_run, str):
-                dry_run = dry_run.lower() in ('true', 'yes', '1')
+                dry_run = dry_run.lower() in _TRUTHY_STRINGS
             
             mode_label = "DRY RUN (Preview)" if dry_run else "LIVE MODE"
             logger.info(f"[Stream-Mapparr] === SORT STREAMS ACTION STARTED ({mode_label}) ===")
@@ -5842,13 +6494,13 @@ class Plugin:
             )
 
             # Get settings
-            profile_name = settings.get('profile_name', '').strip()
+            profile_name = self._setting_str(settings, "profile_name")
             if profile_name == "_none":
                 profile_name = ""
             if not profile_name:
                 return {"status": "error", "message": "Profile name is required"}
             
-            selected_groups_str = settings.get('selected_groups', '').strip()
+            selected_groups_str = self._setting_str(settings, "selected_groups")
             
             # Fetch all channels for the profile via ORM
             logger.info(f"[Stream-Mapparr] Fetching channels for profile: {profile_name}")
@@ -5856,9 +6508,10 @@ class Plugin:
             # Get profile IDs via ORM
             all_profiles = self._get_all_profiles(logger)
             profile_names = [p.strip() for p in profile_name.split(',')]
+            wanted_profile_names = set(profile_names)
             profile_ids = []
             for profile in all_profiles:
-                if profile['name'] in profile_names:
+                if profile['name'] in wanted_profile_names:
                     profile_ids.append(profile['id'])
 
             if not profile_ids:
@@ -5869,7 +6522,7 @@ class Plugin:
             if selected_groups_str:
                 logger.info(f"[Stream-Mapparr] Fetching channel groups for filtering...")
                 all_groups = self._get_all_groups(logger)
-                group_name_to_id = {g['name']: g['id'] for g in all_groups if 'name' in g and 'id' in g}
+                group_name_to_id = self._name_to_id(all_groups)
 
             # Fetch ALL channels via ORM
             all_channels = self._get_all_channels(logger)
@@ -5887,7 +6540,7 @@ class Plugin:
             # Filter by channel groups if specified
             if selected_groups_str:
                 selected_groups = [g.strip() for g in selected_groups_str.split(',') if g.strip()]
-                valid_group_ids = [group_name_to_id[name] for name in selected_groups if name in group_name_to_id]
+                valid_group_ids = {group_name_to_id[name] for name in selected_groups if name in group_name_to_id}
                 
                 if not valid_group_ids:
                     return {"status": "error", "message": f"None of the specified channel groups were found: {selected_groups_str}"}
@@ -5900,60 +6553,64 @@ class Plugin:
             # bug-068: zone-aware ordering so Sort keeps West feeds on West channels
             # instead of reverting to pure quality (which would undo Match & Assign).
             _ig_q, _ig_r, _ig_g, _ig_m = self._resolve_ignore_flags(settings)
-            _ig_tags_str = settings.get('ignore_tags', '').strip()
+            _ig_tags_str = self._setting_str(settings, "ignore_tags")
             _ig_tags = self._parse_tags(_ig_tags_str) if _ig_tags_str else []
             zone_routed = self._zone_routed_map(channels_in_profile, _ig_tags, _ig_q, _ig_r, _ig_g, _ig_m)
 
             # Build M3U priority map if M3U sources are specified
-            selected_m3us_str = settings.get('selected_m3us', '').strip()
+            selected_m3us_str = self._setting_str(settings, "selected_m3us")
             m3u_priority_map = {}
             if selected_m3us_str:
                 # Fetch M3U sources via ORM
                 try:
                     all_m3us = self._get_all_m3u_accounts(logger)
-                    m3u_name_to_id = {m['name']: m['id'] for m in all_m3us if 'name' in m and 'id' in m}
+                    m3u_name_to_id = self._name_to_id(all_m3us)
 
                     selected_m3us = [m.strip() for m in selected_m3us_str.split(',') if m.strip()]
                     valid_m3u_ids = [m3u_name_to_id[name] for name in selected_m3us if name in m3u_name_to_id]
 
                     if valid_m3u_ids:
                         # Create M3U ID to priority mapping (0 = highest priority)
-                        m3u_priority_map = {m3u_id: idx for idx, m3u_id in enumerate(valid_m3u_ids)}
+                        m3u_priority_map = self._m3u_priority_map(valid_m3u_ids)
                         logger.info(f"[Stream-Mapparr] M3U priority order: {', '.join([f'{name} (priority {idx})' for idx, name in enumerate(selected_m3us)])}")
                 except Exception as e:
                     logger.warning(f"[Stream-Mapparr] Could not fetch M3U sources for prioritization: {e}")
             
-            # Get channels with multiple streams using Django ORM
+            # Get channels with multiple streams using Django ORM: one query for
+            # every channel's assignments, one for the details of their streams.
+            stream_ids_by_channel = self._ordered_streams_by_channel(ch['id'] for ch in channels_in_profile)
+            multi_stream_ids = {
+                channel_id: stream_ids for channel_id, stream_ids in stream_ids_by_channel.items()
+                if len(stream_ids) > 1
+            }
+            streams_by_id = {
+                row['id']: row for row in Stream.objects.filter(
+                    id__in=[sid for ids in multi_stream_ids.values() for sid in ids]
+                ).values('id', 'name', 'm3u_account', 'stream_stats')
+            } if multi_stream_ids else {}
+
             channels_with_multiple_streams = []
             for channel in channels_in_profile:
-                channel_id = channel['id']
-                # Query ChannelStream relationships to get stream count
-                stream_ids = list(ChannelStream.objects.filter(channel_id=channel_id).order_by('order').values_list('stream_id', flat=True))
-                
-                if len(stream_ids) > 1:
+                stream_ids = multi_stream_ids.get(channel['id'])
+                if stream_ids:
                     # Fetch stream details including stats and M3U account
                     streams = []
                     for stream_id in stream_ids:
-                        try:
-                            stream = Stream.objects.get(id=stream_id)
-                            
-                            # Get M3U priority for this stream
-                            m3u_account_id = stream.m3u_account_id
-                            if m3u_account_id and m3u_account_id in m3u_priority_map:
-                                m3u_priority = m3u_priority_map[m3u_account_id]
-                            else:
-                                # Stream not from a prioritized M3U source
-                                m3u_priority = 999
-                            
-                            streams.append({
-                                'id': stream.id,
-                                'name': stream.name,
-                                'stats': stream.stream_stats or {},
-                                '_m3u_priority': m3u_priority
-                            })
-                        except Stream.DoesNotExist:
+                        stream = streams_by_id.get(stream_id)
+                        if stream is None:
                             logger.warning(f"[Stream-Mapparr] Stream {stream_id} no longer exists, skipping")
-                    
+                            continue
+
+                        # Streams not from a prioritized M3U source sort last
+                        m3u_priority = m3u_priority_map.get(stream['m3u_account'], 999)
+
+                        streams.append({
+                            'id': stream['id'],
+                            'name': stream['name'],
+                            'stats': stream['stream_stats'] or {},
+                            '_m3u_priority': m3u_priority
+                        })
+
                     if len(streams) > 1:
                         channel['streams'] = streams
                         channels_with_multiple_streams.append(channel)
@@ -5988,7 +6645,8 @@ class Plugin:
                     # Log the reordering
                     stream_names = [s['name'] for s in sorted_streams]
                     logger.info(f"[Stream-Mapparr] Channel '{channel_name}': Reordered {len(sorted_streams)} streams")
-                    logger.debug(f"[Stream-Mapparr]   Order: {' → '.join(stream_names[:3])}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("[Stream-Mapparr]   Order: %s", ' → '.join(stream_names[:3]))
 
                     # Per-stream throughput diagnostics (aligned with stream_names).
                     # Read directly from the in-memory cache that _sort_streams_by_quality
@@ -6018,13 +6676,8 @@ class Plugin:
                     
                     # Apply changes if not dry run
                     if not dry_run:
-                        ChannelStream.objects.filter(channel_id=channel_id).delete()
-                        rows = [
-                            ChannelStream(channel_id=channel_id, stream_id=stream['id'], order=index)
-                            for index, stream in enumerate(sorted_streams)
-                        ]
-                        if rows:
-                            ChannelStream.objects.bulk_create(rows)
+                        self._write_channel_streams(
+                            channel_id, [stream['id'] for stream in sorted_streams], overwrite=True)
                 else:
                     already_sorted_count += 1
             
@@ -6034,7 +6687,7 @@ class Plugin:
             # Create CSV if dry run OR if export setting enabled
             create_csv = settings.get('enable_scheduled_csv_export', PluginConfig.DEFAULT_ENABLE_CSV_EXPORT)
             if isinstance(create_csv, str):
-                create_csv = create_csv.lower() in ('true', 'yes', '1')
+                create_csv = create_csv.lower() in _TRUTHY_STRINGS
             
             csv_created = None
             if dry_run or create_csv:
@@ -6060,7 +6713,7 @@ class Plugin:
                         'filter_dead_streams': False
                     }
                     
-                    with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
+                    with open(filepath, 'w', newline='', encoding='utf-8', buffering=PluginConfig.CSV_EXPORT_BUFFER_BYTES) as csvfile:
                         # Write comprehensive header using standard generator
                         header_comment = self._generate_csv_header_comment(
                             settings,
@@ -6077,16 +6730,15 @@ class Plugin:
                         writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
                         writer.writeheader()
 
-                        for change in changes:
-                            writer.writerow({
-                                'channel_id': change['channel_id'],
-                                'channel_name': change['channel_name'],
-                                'stream_count': change['stream_count'],
-                                'stream_names': '; '.join(change['stream_names']),
-                                'tiers': '; '.join(change.get('tiers') or []),
-                                'throughput_mbps': '; '.join(change.get('throughput_mbps') or []),
-                                'edge_ips': '; '.join(change.get('edge_ips') or []),
-                            })
+                        writer.writerows({
+                            'channel_id': change['channel_id'],
+                            'channel_name': change['channel_name'],
+                            'stream_count': change['stream_count'],
+                            'stream_names': '; '.join(change['stream_names']),
+                            'tiers': '; '.join(change.get('tiers') or []),
+                            'throughput_mbps': '; '.join(change.get('throughput_mbps') or []),
+                            'edge_ips': '; '.join(change.get('edge_ips') or []),
+                        } for change in changes)
                     
                     logger.info(f"[Stream-Mapparr] 📄 CSV EXPORT CREATED: {filepath}")
                     csv_created = filepath
@@ -6120,7 +6772,7 @@ class Plugin:
             return {"status": "error", "message": f"Error sorting streams: {str(e)}"}
 
     def manage_channel_visibility_action(self, settings, logger, context=None):
-        """Disable all channels, then enable only channels with 1 or more streams."""
+        """Enable one channel with 1 or more streams per group and disable the rest."""
         if not os.path.exists(self.processed_data_file):
             return {"status": "error", "message": "No processed data found. Please run 'Load/Process Channels' first."}
 
@@ -6128,11 +6780,14 @@ class Plugin:
             self._send_progress_update("manage_channel_visibility", 'running', 5, 'Initializing...', context)
             
             self._send_progress_update("manage_channel_visibility", 'running', 10, 'Loading channel data...', context)
-            with open(self.processed_data_file, 'r') as f:
-                processed_data = json.load(f)
+            processed_data = _load_json_path(self.processed_data_file)
 
             profile_id = processed_data.get('profile_id')
-            channels = processed_data.get('channels', [])
+            # The processed file only decides which channels are in scope; names,
+            # numbers and attachments come from one query so the decision uses
+            # the current DB state rather than whatever was true at load time.
+            channels = self._get_all_channels(
+                logger, channel_ids=[ch['id'] for ch in processed_data.get('channels', [])])
             channels_data = self._load_channels_data(logger, settings)
 
             # Step 1: Get stream counts (single bulk query)
@@ -6142,29 +6797,11 @@ class Plugin:
             stream_counts_qs = ChannelStream.objects.filter(
                 channel_id__in=channel_ids
             ).values('channel_id').annotate(count=Count('id'))
+            # Channels without a ChannelStream row are absent, i.e. a count of 0
             stream_count_map = {row['channel_id']: row['count'] for row in stream_counts_qs}
-            channel_stream_counts = {}
-            for channel in channels:
-                ch_id = channel['id']
-                channel_stream_counts[ch_id] = {'name': channel['name'], 'stream_count': stream_count_map.get(ch_id, 0)}
-
-            # Step 2: Disable all channels using Django ORM
-            self._send_progress_update("manage_channel_visibility", 'running', 40, f'Disabling all {len(channels)} channels...', context)
-            logger.info(f"[Stream-Mapparr] Disabling all {len(channels)} channels using Django ORM...")
 
-            channel_ids = [ch['id'] for ch in channels]
-            ChannelProfileMembership.objects.filter(
-                channel_profile_id=profile_id,
-                channel_id__in=channel_ids
-            ).update(enabled=False)
-            
-            logger.info(f"[Stream-Mapparr] Disabled {len(channel_ids)} channels in profile {profile_id}")
-
-            # Step 3: Determine channels to enable
-            self._send_progress_update("manage_channel_visibility", 'running', 60, 'Determining channels to enable...', context)
-            channels_to_enable = []
-            channel_groups = {}
-            
+            # Step 2: Determine channels to enable
+            self._send_progress_update("manage_channel_visibility", 'running', 40, 'Determining channels to enable...', context)
             # Reuse grouping logic
             ignore_tags = processed_data.get('ignore_tags', [])
             ignore_quality = processed_data.get('ignore_quality', True)
@@ -6173,39 +6810,50 @@ class Plugin:
             ignore_misc = processed_data.get('ignore_misc', True)
             filter_dead = processed_data.get('filter_dead_streams', PluginConfig.DEFAULT_FILTER_DEAD_STREAMS)
 
+            # Each group enables its highest-priority eligible channel (not attached,
+            # 1+ streams). Eligibility doesn't depend on the group, so a running
+            # minimum per group picks the same channel as sorting the whole group
+            # and taking the first eligible one (strict < keeps the earlier on ties,
+            # like the stable sort).
+            best_by_group = {}
             for channel in channels:
-                channel_info = self._get_channel_info_from_json(channel['name'], channels_data, logger)
-                if self._is_ota_channel(channel_info):
-                    callsign = channel_info.get('callsign', '')
-                    group_key = f"OTA_{callsign}" if callsign else self._clean_channel_name(channel['name'], ignore_tags)
-                else:
-                    group_key = self._clean_channel_name(channel['name'], ignore_tags, ignore_quality, ignore_regional, ignore_geographic, ignore_misc)
-                if group_key not in channel_groups: 
-                    channel_groups[group_key] = []
-                channel_groups[group_key].append(channel)
-
-            for group_key, group_channels in channel_groups.items():
-                sorted_channels = self._sort_channels_by_priority(group_channels)
-                enabled_in_group = False
-                for ch in sorted_channels:
-                    stream_count = channel_stream_counts[ch['id']]['stream_count']
-                    is_attached = ch.get('attached_channel_id') is not None
-
-                    if not is_attached and not enabled_in_group and stream_count >= 1:
-                        channels_to_enable.append(ch['id'])
-                        enabled_in_group = True
-
-            # Step 4: Enable channels using Django ORM
-            self._send_progress_update("manage_channel_visibility", 'running', 80, f'Enabling {len(channels_to_enable)} channels...', context)
-            logger.info(f"[Stream-Mapparr] Enabling {len(channels_to_enable)} channels using Django ORM...")
-
-            if channels_to_enable:
-                ChannelProfileMembership.objects.filter(
-                    channel_profile_id=profile_id,
-                    channel_id__in=channels_to_enable
-                ).update(enabled=True)
-                
-                logger.info(f"[Stream-Mapparr] Enabled {len(channels_to_enable)} channels in profile {profile_id}")
+                if channel.get('attached_channel_id') is not None or stream_count_map.get(channel['id'], 0) < 1:
+                    continue
+                group_key = self._channel_group_key(
+                    channel['name'], channels_data, logger, ignore_tags,
+                    ignore_quality, ignore_regional, ignore_geographic, ignore_misc)
+                priority = self._channel_priority_key(channel)
+                best = best_by_group.get(group_key)
+                if best is None or priority < best[0]:
+                    best_by_group[group_key] = (priority, channel['id'])
+            channels_to_enable = [channel_id for _, channel_id in best_by_group.values()]
+
+            # Step 3: Apply visibility using Django ORM. Only the delta against the
+            # profile's current memberships is written (channels staying enabled
+            # are never disabled in between), and both sides commit together so
+            # the profile is never briefly all-hidden.
+            enable_set = set(channels_to_enable)
+            currently_enabled = dict(ChannelProfileMembership.objects.filter(
+                channel_profile_id=profile_id, channel_id__in=channel_ids
+            ).values_list('channel_id', 'enabled'))
+            to_enable = [cid for cid in channels_to_enable if currently_enabled.get(cid) is False]
+            to_disable = [cid for cid, is_enabled in currently_enabled.items() if is_enabled and cid not in enable_set]
+
+            if not to_enable and not to_disable:
+                logger.info(f"[Stream-Mapparr] Visibility in profile {profile_id} already up to date")
+                success_msg = f"Visibility already up to date. {len(channels_to_enable)} of {len(channels)} channels enabled."
+                self._send_progress_update("manage_channel_visibility", 'success', 100, success_msg, context)
+                return {"status": "success", "message": success_msg}
+
+            self._send_progress_update("manage_channel_visibility", 'running', 70,
+                                       f'Enabling {len(to_enable)} and disabling {len(to_disable)} channels...', context)
+            logger.info(f"[Stream-Mapparr] Enabling {len(to_enable)} and disabling {len(to_disable)} channels using Django ORM...")
+
+            with transaction.atomic():
+                disabled = self._set_profile_channels_enabled(profile_id, to_disable, False)
+                enabled = self._set_profile_channels_enabled(profile_id, to_enable, True)
+
+            logger.info(f"[Stream-Mapparr] Visibility changes in profile {profile_id}: {enabled} enabled, {disabled} disabled")
 
             self._trigger_frontend_refresh(settings, logger)
             
@@ -6246,7 +6894,7 @@ class Plugin:
             except (TypeError, ValueError):
                 rate_per_min = PluginConfig.DEFAULT_PROBE_RATE_PER_MINUTE
 
-            profile_name = (settings.get('profile_name') or '').strip()
+            profile_name = self._setting_str(settings, "profile_name")
             if profile_name == "_none":
                 profile_name = ""
             if not profile_name:
@@ -6266,7 +6914,7 @@ class Plugin:
             if not channel_ids:
                 return {"status": "success", "message": "No enabled channels in profile."}
 
-            selected_groups_str = (settings.get('selected_groups') or '').strip()
+            selected_groups_str = self._setting_str(settings, "selected_groups")
             if selected_groups_str:
                 wanted = [g.strip() for g in selected_groups_str.split(',') if g.strip()]
                 channel_ids = list(
@@ -6354,7 +7002,7 @@ class Plugin:
                     continue
 
                 last_probe_started = time.time()
-                logger.debug(f"[Stream-Mapparr] Probing stream {stream['id']} (account={acct_id})")
+                logger.debug("[Stream-Mapparr] Probing stream %s (account=%s)", stream['id'], acct_id)
                 mbps, edge = self._probe_stream_throughput(
                     url, duration_s, ua_by_account.get(acct_id), logger
                 )
@@ -6410,12 +7058,13 @@ class Plugin:
                 return {"status": "success", "message": "No export directory found."}
 
             deleted_count = 0
-            for filename in os.listdir(export_dir):
-                if filename.startswith("stream_mapparr_") and filename.endswith(".csv"):
-                    try:
-                        os.remove(os.path.join(export_dir, filename))
-                        deleted_count += 1
-                    except Exception: pass
+            with os.scandir(export_dir) as entries:
+                for entry in entries:
+                    if _EXPORT_CSV_NAME_RE.fullmatch(entry.name) and entry.is_file():
+                        try:
+                            os.remove(entry.path)
+                            deleted_count += 1
+                        except Exception: pass
 
             return {"status": "success", "message": f"Deleted {deleted_count} CSV files."}
         except Exception as e:
@@ -6423,6 +7072,7 @@ class Plugin:
 
     def clear_operation_lock_action(self, settings, logger):
         """Manually clear the operation lock file"""
+        self._lock_check_cache = None
         try:
             lock_file = PluginConfig.OPERATION_LOCK_FILE
             
@@ -6431,12 +7081,8 @@ class Plugin:
             
             # Read lock info before deleting
             try:
-                with open(lock_file, 'r') as f:
-                    lock_data = json.load(f)
-                action_name = lock_data.get('action', 'unknown')
-                lock_time_str = lock_data.get('start_time')
-                if lock_time_str:
-                    lock_time = datetime.fromisoformat(lock_time_str)
+                action_name, lock_time, _pid = self._parse_operation_lock(lock_file)
+                if lock_time:
                     age_minutes = (datetime.now() - lock_time).total_seconds() / 60
                     lock_info = f"{action_name} (started {age_minutes:.1f} minutes ago)"
                 else:
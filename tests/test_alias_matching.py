@@ -164,3 +164,23 @@ def test_ensure_matcher_and_aliases_idempotent(plugin_module):
     p._ensure_matcher_and_aliases({"channel_database": "US"})
     assert p.fuzzy_matcher is sentinel       # not re-initialized
     assert p._alias_map == {"Custom": ["X"]}  # not clobbered
+
+
+def test_threshold_path_scores_channel_once(plugin_module, fuzzy_module):
+    p = plugin_module.Plugin.__new__(plugin_module.Plugin)
+    p.fuzzy_matcher = fuzzy_module.FuzzyMatcher(match_threshold=85)
+    p._alias_map = {}
+    calls = []
+    real = p.fuzzy_matcher.fuzzy_match_thresholds
+    p.fuzzy_matcher.fuzzy_match_thresholds = lambda *a, **kw: calls.append(a[2]) or real(*a, **kw)
+
+    streams = [{"name": "Comedy Central HD", "id": 1, "m3u_account": 1},
+               {"name": "Comedy Central", "id": 2, "m3u_account": 1}]
+    results = p._get_matches_at_thresholds(
+        {"name": "Comedy Centrl", "id": 12}, streams, logger=None, ignore_tags=[],
+        ignore_quality=True, ignore_regional=True, ignore_geographic=True,
+        ignore_misc=True, channels_data=[], current_threshold=85)
+    assert calls == [[85, 80, 75, 70, 65]]
+    assert p.fuzzy_matcher.match_threshold == 85
+    assert set(results) == {85, 80, 75, 70, 65}
+    assert {s["id"] for s in results[85]["streams"]} == {1, 2}
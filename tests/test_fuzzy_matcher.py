@@ -567,3 +567,130 @@ def test_bein_4k_3840p_matches_after_resolution_fix(matcher):
     match, score = m.find_best_match("beIN Sports", ["### beIN " + "SP⚽RTS" + " 4K 3840P ###"])
     assert match is not None
     assert score == 100
+
+
+# --------------------------------------------------------------------------- #
+# _best_similarity — batched Stage-3 scorer keeps per-pair semantics
+# --------------------------------------------------------------------------- #
+
+def test_best_similarity_first_best_wins_and_gates(matcher):
+    m = matcher()
+    choices = [("A", "abc"), ("B", "abd"), ("C", "abd")]
+    assert m._best_similarity("abd", choices, 0.5) == ("B", 1.0)
+    cand, score = m._best_similarity("xyz", choices, 0.9)
+    assert score == 0.0
+    assert m._best_similarity("abc", [], 0.5) == (None, -1.0)
+
+
+def test_best_similarity_batched_matches_per_pair(fuzzy_module, matcher):
+    import sys as _sys
+    if fuzzy_module._rf_process is None:
+        pytest.skip("rapidfuzz not installed; only one path available")
+    m = matcher()
+    core_mod = _sys.modules[m.__class__.__mro__[1].__module__]
+    choices = [(n, m.process_string_for_matching(n)) for n in
+               ("fox sports 2", "fox sports 1", "sports fox 1", "cnn")]
+    fast = m._best_similarity("fox sports 1", choices, 0.85)
+    core_mod._USE_RAPIDFUZZ = False
+    try:
+        slow = m._best_similarity("fox sports 1", choices, 0.85)
+    finally:
+        core_mod._USE_RAPIDFUZZ = True
+    assert fast[0] == slow[0]
+    assert fast[1] == pytest.approx(slow[1], abs=1e-9)
+
+
+def test_best_similarity_length_prefilter_skips_hopeless_pairs(fuzzy_module, matcher):
+    import sys as _sys
+    core_mod = _sys.modules[fuzzy_module.FuzzyMatcherCore.__module__]
+    m = matcher()
+    calls = []
+    real = m.calculate_similarity
+    m.calculate_similarity = lambda a, b, min_ratio=0.0: calls.append(b) or real(a, b, min_ratio)
+    choices = [("long", "fox sports one hd east"), ("near", "fox sports 1"), ("short", "fox")]
+    saved = core_mod._USE_RAPIDFUZZ
+    core_mod._USE_RAPIDFUZZ = False
+    try:
+        assert m._best_similarity("fox sport 1", choices, 0.8) == ("near", real("fox sport 1", "fox sports 1"))
+        assert calls == ["fox sports 1"]
+        # Nothing survives: the first choice still carries the gated 0.0 score.
+        assert m._best_similarity("fox sport 1", choices[::2], 0.8) == ("long", 0.0)
+    finally:
+        core_mod._USE_RAPIDFUZZ = saved
+
+
+@pytest.mark.parametrize("short,long_", [
+    ("espn", "espn news"), ("history", "story"), ("cnn", "cnn hd"), ("bbc one", "bbc one hd"),
+])
+def test_substring_similarity_equals_length_ratio(matcher, short, long_):
+    """Stage-2 shortcut: when one string contains the other, similarity is
+    exactly min(len)/max(len), so the substring stage can skip the DP."""
+    m = matcher()
+    expected = min(len(short), len(long_)) / max(len(short), len(long_))
+    assert m.calculate_similarity(short, long_) == pytest.approx(expected, abs=1e-12)
+
+
+def test_precomputed_digit_tokens_keep_numeric_sibling_guard(matcher):
+    m = matcher(90)
+    names = ["Fox Sports 2", "Fox Sports 1 HD", "ESPN"]
+    m.precompute_normalizations(names)
+    assert m._digit_tokens_cache["Fox Sports 2"] == {"2"}
+    assert m.fuzzy_match("Fox Sports 1", names)[0] == "Fox Sports 1 HD"
+    assert m.fuzzy_match("Fox Sports 1", ["Fox Sports 2"])[0] is None
+
+
+def test_fuzzy_match_scores_duplicate_normalized_names_once(matcher):
+    m = matcher(70)
+    names = ["Comedy Central HD", "Comedy Central FHD", "Comedy Central", "Comedy Gold"]
+    m.precompute_normalizations(names)
+    calls = []
+    real = m.calculate_similarity
+    m.calculate_similarity = lambda a, b, **kw: calls.append((a, b)) or real(a, b, **kw)
+    assert m.fuzzy_match("Comedy Centrl", names)[0] == "Comedy Central HD"
+    assert len(calls) == len(set(calls))
+
+
+def test_fuzzy_match_normalizes_query_once_per_precompute(matcher):
+    m = matcher(80)
+    names = ["ESPN HD", "CNN"]
+    m.precompute_normalizations(names)
+    calls = []
+    real = m.normalize_name
+    m.normalize_name = lambda name, *a, **kw: calls.append(name) or real(name, *a, **kw)
+    first = m.fuzzy_match("ESPN", names)
+    assert m.fuzzy_match("ESPN", names) == first
+    assert calls.count("ESPN") == 1
+    m.precompute_normalizations(names)
+    m.fuzzy_match("ESPN", names)
+    assert calls.count("ESPN") == 2
+
+
+@pytest.mark.parametrize("query", ["Comedy Centrl", "Comedy Central", "Fox Sports 1",
+                                   "History", "History Chanel"])
+def test_fuzzy_match_thresholds_agrees_with_per_threshold_calls(matcher, query):
+    names = ["Comedy Central HD", "Comedy Centr", "Comedy Gold", "Fox Sports 1",
+             "Fox Sports 2", "History Channel", "The History Channel Plus"]
+    thresholds = [95, 90, 85, 80, 75, 70, 65]
+    batched = matcher(85).fuzzy_match_thresholds(query, names, thresholds)
+    for threshold in thresholds:
+        assert batched[threshold] == matcher(threshold).fuzzy_match(query, names), threshold
+
+
+def test_fuzzy_match_thresholds_empty_inputs(matcher):
+    m = matcher(85)
+    assert m.fuzzy_match_thresholds("ESPN", [], [90, 80]) == {90: (None, 0, None), 80: (None, 0, None)}
+    assert m.fuzzy_match_thresholds("ESPN", ["ESPN"], []) == {}
+
+
+def test_uncached_candidates_normalize_once_per_tag_list(matcher):
+    m = matcher(90)
+    calls = []
+    real = m.normalize_name
+    m.normalize_name = lambda name, *a, **kw: calls.append(name) or real(name, *a, **kw)
+    assert m.fuzzy_match("Comedy Centrl", ["Comedy Central HD", "ESPN"])[0] == "Comedy Central HD"
+    assert sorted(calls) == ["Comedy Central HD", "Comedy Centrl", "ESPN"]
+    calls.clear()
+    m.fuzzy_match("Comedy Centrl", ["Comedy Central HD"], user_ignored_tags=["HD"])
+    assert calls == ["Comedy Centrl", "Comedy Central HD"]
+    m.precompute_normalizations([])
+    assert m._fallback_norm_cache == {}
@@ -221,3 +221,33 @@ def test_on_m3u_refresh_releases_locks_on_exception(plugin_module, tmp_m3u):
     fd = p._acquire_m3u_refresh_flock(log)             # flock released -> re-acquirable
     assert fd is not None
     p._release_m3u_refresh_flock(fd, log)
+
+
+def test_operation_lock_check_is_cached_briefly(plugin_module, tmp_m3u):
+    p = plugin_module.Plugin.__new__(plugin_module.Plugin)
+    assert p._check_operation_lock(log)[0] is False
+    lock_file = tmp_m3u / "operation.lock"
+    lock_file.write_text('{"action": "other", "start_time": "%s", "pid": %d}'
+                         % (plugin_module.datetime.now().isoformat(), plugin_module.os.getpid()))
+    assert p._check_operation_lock(log)[0] is False                  # polling read within TTL
+    assert p._check_operation_lock(log, use_cache=False)[0] is True   # fresh read sees it
+    assert p._acquire_operation_lock("mine", log) is False            # acquire never trusts the cache
+    lock_file.unlink()
+    assert p._acquire_operation_lock("mine", log) is True
+    assert p._check_operation_lock(log)[1]["action"] == "mine"        # acquire invalidated the cache
+    p._release_operation_lock(log)
+    assert p._check_operation_lock(log)[0] is False
+
+
+def test_operation_lock_file_is_plain_text_with_mtime_start(plugin_module, tmp_m3u):
+    p = plugin_module.Plugin.__new__(plugin_module.Plugin)
+    assert p._acquire_operation_lock("sort_streams", log) is True
+    lock_file = tmp_m3u / "operation.lock"
+    assert lock_file.read_text() == "sort_streams\n%d\n" % plugin_module.os.getpid()
+    action, start, pid = p._parse_operation_lock(str(lock_file))
+    assert (action, pid) == ("sort_streams", plugin_module.os.getpid())
+    assert abs((plugin_module.datetime.now() - start).total_seconds()) < 60
+    old = plugin_module.time.time() - 3600
+    plugin_module.os.utime(lock_file, (old, old))                   # stale by mtime
+    assert p._check_operation_lock(log, use_cache=False)[0] is False
+    assert not lock_file.exists()
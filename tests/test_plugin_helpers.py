@@ -5,6 +5,7 @@ those before import. We exercise the genuinely pure helpers — the ones whose p
 breakage is recorded in .wolf/buglog.json / cerebrum Do-Not-Repeat.
 """
 
+import re
 from datetime import datetime, timedelta, timezone as dt_tz
 
 import pytest
@@ -36,6 +37,16 @@ def test_parse_tags_drops_empties(plugin_module):
     assert Plugin._parse_tags("a,,b,") == ["a", "b"]
 
 
+def test_setting_str_strips_and_defaults(plugin_module):
+    Plugin = plugin_module.Plugin
+    settings = {"a": "  x ", "b": "   ", "c": None, "d": 5}
+    assert Plugin._setting_str(settings, "a") == "x"
+    assert Plugin._setting_str(settings, "b") == ""
+    assert Plugin._setting_str(settings, "c") == ""
+    assert Plugin._setting_str(settings, "d", "dflt") == "dflt"
+    assert Plugin._setting_str(settings, "missing", "dflt") == "dflt"
+
+
 # --------------------------------------------------------------------------- #
 # _parse_priority_list — lowercased delegation to _parse_tags
 # --------------------------------------------------------------------------- #
@@ -157,6 +168,50 @@ def test_dedup_keeps_same_name_from_different_accounts(plugin_module):
     assert [s["id"] for s in out] == [1, 2]
 
 
+# --------------------------------------------------------------------------- #
+# _clean_channel_name (no-matcher fallback) — ignore tags stripped via one
+#   cached alternation per tag kind.
+# --------------------------------------------------------------------------- #
+
+def test_clean_channel_name_fallback_strips_ignore_tags(plugin_module):
+    p = _bare_plugin(plugin_module)
+    p.fuzzy_matcher = None
+    tags = ["[4K]", "Backup", "(VIP)"]
+    assert p._clean_channel_name("ESPN [4k] Backup (VIP) Plus", tags) == "ESPN  Plus"
+    # word tags respect word boundaries
+    assert p._clean_channel_name("Backups Channel", ["Backup"]) == "Backups Channel"
+    assert plugin_module._ignore_tag_patterns(tuple(tags)) is \
+        plugin_module._ignore_tag_patterns(tuple(tags))
+
+
+# --------------------------------------------------------------------------- #
+# _filter_working_streams — IPTV Checker metadata is fetched in one IN query
+#   and memoized for the run (called once per channel with the same streams).
+# --------------------------------------------------------------------------- #
+
+def test_filter_working_streams_memoizes_health_per_run(plugin_module, monkeypatch):
+    import logging
+    from unittest.mock import MagicMock
+    stream_model = MagicMock(name="Stream")
+    stream_model.objects.filter.return_value.values_list.return_value = [
+        (1, 1920, 1080), (2, 0, 0), (3, None, None)]
+    monkeypatch.setattr(plugin_module, "Stream", stream_model)
+    p = _bare_plugin(plugin_module)
+    p._reset_run_caches()
+    streams = [{"id": 1, "name": "A"}, {"id": 2, "name": "B"},
+               {"id": 3, "name": "C"}, {"id": 4, "name": "D"}]
+    log = logging.getLogger("test")
+
+    # dead (0x0) dropped; unchecked (None) and unknown (not in DB) kept
+    assert [s["id"] for s in p._filter_working_streams(streams, log)] == [1, 3, 4]
+    p._filter_working_streams(streams[:3], log)
+    assert stream_model.objects.filter.call_count == 1
+
+    p._reset_run_caches()
+    p._filter_working_streams(streams[:3], log)
+    assert stream_model.objects.filter.call_count == 2
+
+
 # --------------------------------------------------------------------------- #
 # _labeled_stream_names — tag CSV stream names with their M3U source so
 #   multi-source copies (same name, different provider) are distinguishable.
@@ -370,3 +425,610 @@ def test_claim_scheduled_slot_survives_flock_failure(plugin_module, tmp_sched, m
                         types.SimpleNamespace(LOCK_EX=2, LOCK_UN=8, flock=boom))
     assert p._claim_scheduled_slot("05:00", "2026-06-24", log) is True    # proceeds degraded
     assert p._claim_scheduled_slot("05:00", "2026-06-24", log) is False   # still dedups via the file
+
+
+# --------------------------------------------------------------------------- #
+# _extract_quality — substring fast path for [Q]/(Q), regex only for bare Q
+# --------------------------------------------------------------------------- #
+
+def test_extract_quality_forms(plugin_module):
+    p = _bare_plugin(plugin_module)
+    assert p._extract_quality("ESPN [fhd]") == "[FHD]"
+    # each entry accepts all three spellings, so the family's first entry wins
+    assert p._extract_quality("ESPN HD") == "[HD]"
+    assert p._extract_quality("ESPN (Slow)") == "Slow"
+    assert p._extract_quality("ESPN (H)") == "(H)"
+    assert p._extract_quality("HDTV News") is None
+
+
+# --------------------------------------------------------------------------- #
+# SmartRateLimiter — token bucket: burst up to capacity, then paced
+# --------------------------------------------------------------------------- #
+
+def test_rate_limiter_bursts_then_paces(plugin_module, monkeypatch):
+    clock = [100.0]
+    sleeps = []
+    monkeypatch.setattr(plugin_module.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(plugin_module.time, "sleep", sleeps.append)
+    limiter = plugin_module.SmartRateLimiter("medium")  # 0.5s -> 2 ops/sec
+    for _ in range(plugin_module.PluginConfig.RATE_LIMIT_BURST):
+        limiter.wait()
+    assert sleeps == []
+    limiter.wait()
+    assert sleeps == [pytest.approx(0.5)]
+    clock[0] += 10.0  # idle refills, but never past capacity
+    limiter.wait()
+    assert len(sleeps) == 1
+    assert limiter.tokens == pytest.approx(plugin_module.PluginConfig.RATE_LIMIT_BURST - 1)
+
+
+def test_rate_limiter_none_never_sleeps(plugin_module, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(plugin_module.time, "sleep", sleeps.append)
+    limiter = plugin_module.SmartRateLimiter("none")
+    for _ in range(10):
+        limiter.wait()
+    assert sleeps == []
+
+
+# --------------------------------------------------------------------------- #
+# _load_json_path — orjson when present, stdlib json otherwise
+# --------------------------------------------------------------------------- #
+
+def test_load_json_path_stdlib_fallback(plugin_module, tmp_path, monkeypatch):
+    path = tmp_path / "db.json"
+    path.write_text('{"channels": [{"channel_name": "Ça va"}]}', encoding="utf-8")
+    monkeypatch.setattr(plugin_module, "orjson", None)
+    assert plugin_module._load_json_path(str(path)) == {"channels": [{"channel_name": "Ça va"}]}
+    path.write_text("{not json", encoding="utf-8")
+    with pytest.raises(ValueError):
+        plugin_module._load_json_path(str(path))
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dump_json_path_round_trips(plugin_module, tmp_path, monkeypatch, use_orjson):
+    if use_orjson and plugin_module.orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(plugin_module, "orjson", None)
+    data = {"channels": [{"name": "Ça va", "id": 1}], "streams": [], "ignore_tags": ["[HD]"]}
+    path = str(tmp_path / "processed.json")
+    plugin_module._dump_json_path(path, data)
+    assert plugin_module._load_json_path(path) == data
+    assert "\n" not in open(path, encoding="utf-8").read()   # compact, not indented
+
+
+def test_dump_json_path_failure_keeps_previous_snapshot(plugin_module, tmp_path, monkeypatch):
+    monkeypatch.setattr(plugin_module, "orjson", None)
+    path = tmp_path / "processed.json"
+    plugin_module._dump_json_path(str(path), {"channels": [1]})
+    with pytest.raises(TypeError):
+        plugin_module._dump_json_path(str(path), {"channels": [object()]})
+    assert plugin_module._load_json_path(str(path)) == {"channels": [1]}
+    assert [p.name for p in tmp_path.iterdir()] == ["processed.json"]
+
+
+# --------------------------------------------------------------------------- #
+# _get_channel_databases — the label scan is cached until a file changes
+# --------------------------------------------------------------------------- #
+
+def test_channel_databases_rescanned_only_when_files_change(plugin_module, tmp_path, monkeypatch):
+    monkeypatch.setattr(plugin_module, "__file__", str(tmp_path / "plugin.py"))
+    parsed = []
+    real = plugin_module._load_json_path
+    monkeypatch.setattr(plugin_module, "_load_json_path", lambda path: parsed.append(path) or real(path))
+    (tmp_path / "US_channels.json").write_text('{"country_code": "US", "country_name": "USA"}')
+    p = _bare_plugin(plugin_module)
+    first = p._get_channel_databases()
+    first[0]["label"] = "mutated"
+    assert [d["label"] for d in p._get_channel_databases()] == ["USA"]
+    assert len(parsed) == 1
+    (tmp_path / "CA_channels.json").write_text('{"country_code": "CA", "country_name": "Canada"}')
+    assert [d["id"] for d in p._get_channel_databases()] == ["CA", "US"]
+    assert len(parsed) == 3
+
+
+# --------------------------------------------------------------------------- #
+# _load_channels_data — parallel reads keep enabled-database order
+# --------------------------------------------------------------------------- #
+
+def test_load_channels_data_keeps_database_order(plugin_module, tmp_path):
+    import json as _json
+    import logging
+    dbs = []
+    for code in ("US", "UK", "CA"):
+        path = tmp_path / f"{code}_channels.json"
+        path.write_text(_json.dumps({"channels": [{"channel_name": f"{code} One"}]}))
+        dbs.append({"id": code, "label": code, "file_path": str(path)})
+    bad = tmp_path / "XX_channels.json"
+    bad.write_text("{broken")
+    dbs.insert(1, {"id": "XX", "label": "XX", "file_path": str(bad)})
+
+    p = _bare_plugin(plugin_module)
+    p._get_channel_databases = lambda: dbs
+    out = p._load_channels_data(logging.getLogger("test"))
+    assert [(c["channel_name"], c["_country_code"]) for c in out] == [
+        ("US One", "US"), ("UK One", "UK"), ("CA One", "CA")]
+
+
+def test_load_channels_data_reused_until_a_database_changes(plugin_module, tmp_path):
+    import logging
+    import os as _os
+    path = tmp_path / "US_channels.json"
+    path.write_text('{"channels": [{"channel_name": "ABC"}]}')
+    p = _bare_plugin(plugin_module)
+    p._get_channel_databases = lambda: [{"id": "US", "label": "US", "file_path": str(path)}]
+    logger = logging.getLogger("test")
+    first = p._load_channels_data(logger)
+    assert p._load_channels_data(logger) is first
+    path.write_text('{"channels": [{"channel_name": "ABC"}, {"channel_name": "NBC"}]}')
+    _os.utime(path, ns=(0, 0))
+    assert [c["channel_name"] for c in p._load_channels_data(logger)] == ["ABC", "NBC"]
+
+
+# --------------------------------------------------------------------------- #
+# _stream_artifact_lookup — stream names are cleaned once per run, not once
+#   per channel
+# --------------------------------------------------------------------------- #
+
+def test_stream_names_cleaned_once_across_channels(plugin_module, matcher):
+    import logging
+    p = _bare_plugin(plugin_module)
+    p.fuzzy_matcher = matcher(80)
+    p._alias_map = {}
+    p._reset_run_caches()
+    streams = [{"id": 1, "name": "ESPN HD", "m3u_account": 1},
+               {"id": 2, "name": "ESPN 2 HD", "m3u_account": 1},
+               {"id": 3, "name": "CNN", "m3u_account": 1}]
+    cleaned = []
+    real_clean = p._clean_channel_name
+    p._clean_channel_name = lambda name, *a, **kw: cleaned.append(name) or real_clean(name, *a, **kw)
+
+    log = logging.getLogger("test")
+    first = p._match_streams_to_channel({"id": 10, "name": "ESPN"}, streams, log)
+    second = p._match_streams_to_channel({"id": 11, "name": "ESPN"}, streams, log)
+    assert [s["id"] for s in first[0]] == [s["id"] for s in second[0]] == [1]
+    assert first[2] == second[2]
+    for stream in streams:
+        assert cleaned.count(stream["name"]) == 1
+
+
+def test_fuzzy_match_skipped_when_rematch_scan_is_empty(plugin_module, matcher):
+    import logging
+    p = _bare_plugin(plugin_module)
+    p.fuzzy_matcher = matcher(80)
+    p._alias_map = {}
+    p._reset_run_caches()
+    calls = []
+    real = p.fuzzy_matcher.fuzzy_match
+    p.fuzzy_matcher.fuzzy_match = lambda *a, **kw: calls.append(a[0]) or real(*a, **kw)
+    streams = [{"id": 1, "name": "ESPN HD", "m3u_account": 1},
+               {"id": 2, "name": "CNN", "m3u_account": 1}]
+    log = logging.getLogger("test")
+
+    miss = p._match_streams_to_channel({"id": 10, "name": "Discovery"}, streams, log)
+    assert miss[0] == [] and miss[3] == "No fuzzy match"
+    assert calls == []
+    hit = p._match_streams_to_channel({"id": 11, "name": "ESPN"}, streams, log)
+    assert [s["id"] for s in hit[0]] == [1] and hit[3].startswith("Fuzzy match")
+    assert calls == ["ESPN"]
+
+
+def test_stream_artifacts_precompute_token_variants(plugin_module):
+    p = _bare_plugin(plugin_module)
+    p.fuzzy_matcher = None
+    p._reset_run_caches()
+    art = p._stream_artifact_lookup([])("Sky Sports F 1")
+    assert art.tokens == {"sky", "sports", "f", "1"}
+    assert art.multi_tokens == {"sky", "sports"}
+    assert art.number_tokens == {"1"}
+
+
+def test_clean_channel_name_memoized_per_run(plugin_module, matcher):
+    p = _bare_plugin(plugin_module)
+    p.fuzzy_matcher = matcher()
+    p._reset_run_caches()
+    calls = []
+    real_normalize = p.fuzzy_matcher.normalize_name
+    p.fuzzy_matcher.normalize_name = lambda *a, **kw: calls.append(a[0]) or real_normalize(*a, **kw)
+
+    first = p._clean_channel_name("ESPN HD", ["[4K]"])
+    assert p._clean_channel_name("ESPN HD", ["[4K]"]) == first
+    assert calls == ["ESPN HD"]
+    p._clean_channel_name("ESPN HD", ["[4K]"], ignore_quality=False)  # different flags
+    assert len(calls) == 2
+    p._reset_run_caches()
+    p._clean_channel_name("ESPN HD", ["[4K]"])
+    assert len(calls) == 3
+
+
+def test_token_signature_never_rejects_overlapping_sets(plugin_module):
+    sig = plugin_module._token_signature
+    assert sig(frozenset()) == 0
+    assert sig({"espn", "news"}) & sig({"news", "hd"})
+    assert sig({"espn"}) == sig({"espn"})
+
+
+@pytest.mark.parametrize("callsign,name,expected", [
+    ("WABC", "US: WABC ABC 7 New York", True),
+    ("wabc", "US: WABC-DT", True),
+    ("WABC", "WABCD HD", False),
+    ("WFAA-TV", "WFAA-TV Dallas", True),
+    ("WFAA-TV", "WFAA Dallas", False),
+])
+def test_callsign_stream_filter_matches_word_boundary_regex(plugin_module, callsign, name, expected):
+    p = _bare_plugin(plugin_module)
+    assert bool(p._callsign_stream_filter(callsign)(name)) is expected
+    assert bool(re.search(rf'\b{re.escape(callsign)}\b', name, re.IGNORECASE)) is expected
+
+
+def test_channel_info_lookup_exact_then_case_insensitive_first_wins(plugin_module):
+    p = _bare_plugin(plugin_module)
+    data = [{"channel_name": "ESPN", "id": 1}, {"channel_name": "espn", "id": 2},
+            {"channel_name": "Espn", "id": 3}, {"channel_name": "ESPN", "id": 4}, {"id": 5}]
+    assert p._get_channel_info_from_json("espn", data, None)["id"] == 2
+    assert p._get_channel_info_from_json("ESPN", data, None)["id"] == 1
+    assert p._get_channel_info_from_json("eSpN", data, None)["id"] == 1
+    assert p._get_channel_info_from_json("CNN", data, None) is None
+    other = [{"channel_name": "CNN", "id": 9}]
+    assert p._get_channel_info_from_json("cnn", other, None)["id"] == 9   # new list -> new index
+
+
+def test_channel_group_key_ota_callsign_else_cleaned(plugin_module, fuzzy_module):
+    p = _bare_plugin(plugin_module)
+    p.fuzzy_matcher = fuzzy_module.FuzzyMatcher(match_threshold=85)
+    data = [{"channel_name": "WABC", "callsign": "WABC"}, {"channel_name": "CNN"}]
+    assert p._channel_group_key("WABC", data, None, []) == "OTA_WABC"
+    assert p._channel_group_key("CNN HD", data, None, []) == p._clean_channel_name("CNN HD", [])
+
+
+def test_channel_group_key_memoized_until_reset(plugin_module, fuzzy_module):
+    p = _bare_plugin(plugin_module)
+    p.fuzzy_matcher = fuzzy_module.FuzzyMatcher(match_threshold=85)
+    data = [{"channel_name": "WABC", "callsign": "WABC"}]
+    assert p._channel_group_key("WABC", data, None, []) == "OTA_WABC"
+    p._get_channel_info_from_json = lambda *a, **kw: pytest.fail("recomputed")
+    assert p._channel_group_key("WABC", data, None, []) == "OTA_WABC"
+    del p._get_channel_info_from_json
+    # A different list of the same length must not get the other list's keys
+    assert p._channel_group_key("WABC", [{"channel_name": "WABC"}], None, []) != "OTA_WABC"
+    assert p._channel_group_key("WABC", data, None, []) == "OTA_WABC"
+    p._reset_run_caches()
+    data[0].pop("callsign")
+    assert p._channel_group_key("WABC", data, None, []) != "OTA_WABC"
+
+
+def test_lookup_rows_cached_until_reset_or_ttl(plugin_module, monkeypatch):
+    p = _bare_plugin(plugin_module)
+    calls = []
+    fetch = lambda: calls.append(1) or [{"id": 1, "name": "Sports"}]
+    rows = p._cached_lookup_rows("groups", fetch)
+    rows.append({"id": 2})                                   # callers get their own list
+    assert p._cached_lookup_rows("groups", fetch) == [{"id": 1, "name": "Sports"}]
+    assert len(calls) == 1
+    p._reset_run_caches()
+    p._cached_lookup_rows("groups", fetch)
+    assert len(calls) == 2
+    monkeypatch.setattr(plugin_module.PluginConfig, "LOOKUP_QUERY_CACHE_TTL_SECONDS", 0)
+    p._reset_run_caches()
+    p._cached_lookup_rows("groups", fetch)
+    p._cached_lookup_rows("groups", fetch)
+    assert len(calls) == 4
+
+
+def test_estimate_eta_counts_distinct_groups(plugin_module, matcher, tmp_path):
+    import json as _json
+    import logging
+    p = _bare_plugin(plugin_module)
+    p.fuzzy_matcher = matcher(80)
+    p._reset_run_caches()
+    p.processed_data_file = str(tmp_path / "processed.json")
+    (tmp_path / "processed.json").write_text(_json.dumps({"channels": [
+        {"name": "ESPN HD"}, {"name": "ESPN"}, {"name": "CNN"}, {"name": "WABC"}]}))
+    p._load_channels_data = lambda logger, settings: [
+        {"channel_name": "WABC", "type": "broadcast (OTA)", "callsign": "WABC"}]
+    eta = p._estimate_eta_seconds({}, logging.getLogger("test"))
+    assert eta == pytest.approx(3 * plugin_module.PluginConfig.ESTIMATED_SECONDS_PER_ITEM)
+
+
+def test_processed_data_eta_snapshot_reparsed_only_on_change(plugin_module, tmp_path, monkeypatch):
+    import json as _json
+    import os
+    p = _bare_plugin(plugin_module)
+    path = tmp_path / "processed.json"
+    p.processed_data_file = str(path)
+    assert p._processed_data_eta_snapshot() is None          # missing file
+    path.write_text(_json.dumps({"channels": [{"name": "ESPN"}], "ignore_tags": ["[X]"]}))
+    loads = []
+    real = plugin_module._load_json_path
+    monkeypatch.setattr(plugin_module, "_load_json_path", lambda f: loads.append(f) or real(f))
+    snap = p._processed_data_eta_snapshot()
+    assert snap == (("ESPN",), ["[X]"], (True, True, True, True))
+    assert p._processed_data_eta_snapshot() == snap
+    assert len(loads) == 1
+    path.write_text(_json.dumps({"channels": [{"name": "CNN"}, {"name": "HBO"}]}))
+    os.utime(path, ns=(1, 1))
+    assert p._processed_data_eta_snapshot()[0] == ("CNN", "HBO")
+    assert len(loads) == 2
+
+
+def test_profiles_by_lower_name_first_wins(plugin_module):
+    index = plugin_module.Plugin._profiles_by_lower_name(
+        [{"id": 1, "name": "Main"}, {"id": 2, "name": "MAIN"}, {"id": 3}])
+    assert index["main"]["id"] == 1
+    assert index[""]["id"] == 3
+
+
+def test_sort_channels_by_priority_quality_then_number(plugin_module):
+    p = _bare_plugin(plugin_module)
+    channels = [{"name": "ESPN [SD]", "channel_number": 1}, {"name": "ESPN", "channel_number": 2},
+                {"name": "ESPN [4K]", "channel_number": 9}, {"name": "ESPN [HD]", "channel_number": None},
+                {"name": "ESPN [HD]", "channel_number": 3}]
+    out = p._sort_channels_by_priority(channels)
+    assert [(c["name"], c["channel_number"]) for c in out] == [
+        ("ESPN [4K]", 9), ("ESPN [HD]", 3), ("ESPN [HD]", None), ("ESPN [SD]", 1), ("ESPN", 2)]
+
+
+@pytest.mark.parametrize("name", ["ESPN 2 HD", "A&E (East)", "US: Fox-News", "x", "Ñandú TV|4K", ""])
+def test_mismatch_tokens_match_sub_split(plugin_module, name):
+    legacy = [t for t in re.sub(r'[^\w\s]', ' ', name.lower()).split() if len(t) > 1]
+    assert plugin_module._MULTI_CHAR_WORD_RE.findall(name.lower()) == legacy
+
+
+def test_analyze_token_mismatch_reuses_channel_tokens(plugin_module):
+    p = _bare_plugin(plugin_module)
+    expected = {"tokens": ["fox", "cbs"], "position": "first"}
+    assert p._analyze_token_mismatch("Fox News Now", "CBS News Now") == expected
+    assert p._analyze_token_mismatch("ignored", "CBS News Now", ["fox", "news", "now"]) == expected
+
+
+def test_csv_header_threshold_recommendation_and_example_cap(plugin_module, monkeypatch):
+    p = _bare_plugin(plugin_module)
+    calls = []
+    real = p._analyze_token_mismatch
+    monkeypatch.setattr(p, "_analyze_token_mismatch", lambda *a: calls.append(a) or real(*a))
+    threshold_data = {
+        f"Fox News {i}": {85: {"streams": []},
+                          75: {"streams": [{"name": f"CBS News {i}"}, {"name": f"NBC News {i}"}]},
+                          "meta": {"streams": [{"name": "x"}]}}
+        for i in range(5)}
+    header = p._generate_csv_header_comment({"fuzzy_match_threshold": 85}, {},
+                                            threshold_data=threshold_data)
+    assert "# 10 additional stream(s) available at lower thresholds." in header
+    assert "from 85 to 75" in header
+    assert len(calls) == 3   # stops analysing once three examples are collected
+
+
+def test_m3u_priority_map_first_listing_wins(plugin_module):
+    assert plugin_module.Plugin._m3u_priority_map([7, 3, 7, 9]) == {7: 0, 3: 1, 9: 2}
+    assert plugin_module.Plugin._m3u_priority_map([]) == {}
+
+
+def test_take_processed_data_hands_over_once_then_reads_file(plugin_module, tmp_path):
+    p = _bare_plugin(plugin_module)
+    p.processed_data_file = str(tmp_path / "processed.json")
+    plugin_module._dump_json_path(p.processed_data_file, {"channels": ["disk"]})
+    fresh = {"channels": ["memory"]}
+    p._processed_data_handoff = fresh
+    assert p._take_processed_data() is fresh
+    assert p._take_processed_data() == {"channels": ["disk"]}
+
+
+def test_write_channel_streams_skips_existing_or_replaces(plugin_module, monkeypatch):
+    from unittest.mock import MagicMock
+    model = MagicMock()
+    model.side_effect = lambda **kw: kw
+    model.objects.filter.return_value.values_list.return_value = [2]
+    monkeypatch.setattr(plugin_module, "ChannelStream", model)
+    p = _bare_plugin(plugin_module)
+
+    assert p._write_channel_streams(10, [1, 2, 3], overwrite=False) == 2
+    rows = model.objects.bulk_create.call_args[0][0]
+    assert rows == [{"channel_id": 10, "stream_id": 1, "order": 0},
+                    {"channel_id": 10, "stream_id": 3, "order": 2}]
+    model.objects.filter.return_value.delete.assert_not_called()
+
+    assert p._write_channel_streams(10, [2], overwrite=True) == 1
+    model.objects.filter.return_value.delete.assert_called_once()
+    assert p._write_channel_streams(10, [], overwrite=False) == 0
+
+
+def test_write_channel_streams_uses_prefetched_existing(plugin_module, monkeypatch):
+    from unittest.mock import MagicMock
+    model = MagicMock()
+    model.side_effect = lambda **kw: kw
+    model.objects.filter.return_value.values_list.return_value = [(10, 1), (10, 2), (11, 5)]
+    monkeypatch.setattr(plugin_module, "ChannelStream", model)
+    p = _bare_plugin(plugin_module)
+
+    existing = p._existing_streams_by_channel([10, 11, 12])
+    assert existing == {10: {1, 2}, 11: {5}}
+    model.objects.filter.reset_mock()
+    assert p._write_channel_streams(10, [1, 3], False, existing) == 1
+    assert p._write_channel_streams(12, [1], False, existing) == 1   # no prior streams
+    model.objects.filter.assert_not_called()                          # no per-channel query
+
+
+def test_ordered_streams_by_channel_single_query(plugin_module, monkeypatch):
+    from unittest.mock import MagicMock
+    model = MagicMock()
+    ordered = model.objects.filter.return_value.order_by.return_value
+    ordered.values_list.return_value = [(10, 3), (11, 5), (10, 1)]
+    monkeypatch.setattr(plugin_module, "ChannelStream", model)
+
+    out = plugin_module.Plugin._ordered_streams_by_channel(iter([10, 11, 12]))
+    assert out == {10: [3, 1], 11: [5]}       # query order kept per channel
+    model.objects.filter.assert_called_once_with(channel_id__in=[10, 11, 12])
+    model.objects.filter.return_value.order_by.assert_called_once_with('order')
+
+
+def test_name_to_id_skips_incomplete_rows(plugin_module):
+    rows = [{"name": "Sports", "id": 1}, {"name": "News"}, {"id": 3},
+            {"name": "Sports", "id": 4}, {"name": "Kids", "id": 0}]
+    assert plugin_module.Plugin._name_to_id(rows) == {"Sports": 4, "Kids": 0}
+
+
+def test_validation_reuses_recent_pass_for_same_settings(plugin_module):
+    import logging
+    p = _bare_plugin(plugin_module)
+    log = logging.getLogger("test")
+    outcomes = [(False, ["✅ ok"]), (False, ["✅ ok"]), (True, ["❌ bad"]), (True, ["❌ bad"])]
+    calls = []
+    p._run_settings_validation = lambda settings, logger: calls.append(dict(settings)) or outcomes[len(calls) - 1]
+
+    settings = {"profile_name": "Main"}
+    assert p._validate_plugin_settings(settings, log) == (False, ["✅ ok"])
+    assert p._validate_plugin_settings(dict(settings), log) == (False, ["✅ ok"])
+    assert len(calls) == 1
+    p._validate_plugin_settings(settings, log, use_cache=False)          # Validate button
+    assert len(calls) == 2
+    assert p._validate_plugin_settings({"profile_name": "Other"}, log)[0] is True
+    assert p._validate_plugin_settings({"profile_name": "Other"}, log)[0] is True  # failures not cached
+    assert len(calls) == 4
+
+
+def test_ota_callsign_pattern_matches_suffixed_uppercase_only(plugin_module):
+    pat = plugin_module._ota_callsign_pattern("WKRG")
+    assert pat is plugin_module._ota_callsign_pattern("WKRG")   # compiled once
+    assert pat.search("US: WKRG-DT2 Mobile")
+    assert pat.search("WKRG HD")
+    assert not pat.search("wkrg hd")
+    assert not pat.search("WKRGX")
+
+
+def test_ota_callsign_stream_index_agrees_with_regex(plugin_module):
+    names = ["WKRG-DT2 Mobile", "US: WKRG HD", "wkrg lower", "WKRGX", "WKRG-DTX", "KXYZ WKRG WKRG",
+             "FOX_WKRG", "WABC (ABC) New York"]
+    streams = [{"id": i, "name": n} for i, n in enumerate(names)]
+    index = plugin_module.Plugin._ota_callsign_stream_index(streams, {"WKRG": {}, "WABC": {}})
+    for callsign in ("WKRG", "WABC"):
+        pat = plugin_module._ota_callsign_pattern(callsign)
+        assert [s["id"] for s in index.get(callsign, [])] == \
+            [s["id"] for s in streams if pat.search(s["name"])]
+    assert "KXYZ" not in index    # only callsigns from the database are indexed
+
+
+@pytest.mark.parametrize("name", ["WKRG 5 Mobile", "(wabc) New York", "US: KYW", "NBC (KXAS-TV)",
+                                  "ESPN", "CNN HD", "BBC One", "Fox News", "Network 1"])
+def test_us_callsign_hint_never_hides_an_extractable_callsign(plugin_module, fuzzy_module, name):
+    matcher = fuzzy_module.FuzzyMatcher(match_threshold=85)
+    hinted = plugin_module._US_CALLSIGN_HINT_RE.search(name) is not None
+    assert hinted or matcher.extract_callsign(name) is None
+
+
+def test_set_profile_channels_enabled_batches_updates(plugin_module, monkeypatch):
+    from unittest.mock import MagicMock
+    model = MagicMock()
+    model.objects.filter.return_value.update.side_effect = lambda enabled: 2
+    monkeypatch.setattr(plugin_module, "ChannelProfileMembership", model)
+    monkeypatch.setattr(plugin_module.PluginConfig, "VISIBILITY_UPDATE_BATCH_SIZE", 2)
+
+    assert plugin_module.Plugin._set_profile_channels_enabled(7, iter([1, 2, 3]), False) == 4
+    batches = [c.kwargs["channel_id__in"] for c in model.objects.filter.call_args_list]
+    assert batches == [[1, 2], [3]]
+    assert all(c.kwargs["channel_profile_id"] == 7 and c.kwargs["enabled"] is True
+               for c in model.objects.filter.call_args_list)   # already-disabled rows skipped
+    model.objects.filter.return_value.update.assert_called_with(enabled=False)
+
+
+@pytest.mark.parametrize("name", [
+    "stream_mapparr_20240101_120000.csv", "stream_mapparr_preview_x.csv",
+    "stream_mapparr_.csv", "stream_mapparr_a\nb.csv", "stream_mapparr_x.csv.bak",
+    "other_stream_mapparr_x.csv", "stream_mapparr_processed.json", "stream_mapparr.csv",
+])
+def test_export_csv_name_re_matches_prefix_suffix_check(plugin_module, name):
+    expected = name.startswith("stream_mapparr_") and name.endswith(".csv")
+    assert bool(plugin_module._EXPORT_CSV_NAME_RE.fullmatch(name)) is expected
+
+
+@pytest.mark.parametrize("memberships,expected_writes", [
+    ([(1, True), (2, False)], None),                  # already right: no writes, no refresh
+    ([(1, False), (2, True), (3, False)], ([2], [1])),  # only the delta is written
+])
+def test_manage_visibility_writes_only_membership_delta(plugin_module, monkeypatch, tmp_path,
+                                                        memberships, expected_writes):
+    import logging
+    import sys as _sys
+    import types
+    from unittest.mock import MagicMock
+    monkeypatch.setitem(_sys.modules, "django.db.models", types.SimpleNamespace(Count=MagicMock()))
+    counts = MagicMock()
+    counts.objects.filter.return_value.values.return_value.annotate.return_value = [
+        {"channel_id": 1, "count": 2}, {"channel_id": 2, "count": 1}]
+    monkeypatch.setattr(plugin_module, "ChannelStream", counts)
+    membership = MagicMock()
+    membership.objects.filter.return_value.values_list.return_value = memberships
+    monkeypatch.setattr(plugin_module, "ChannelProfileMembership", membership)
+
+    processed = tmp_path / "processed.json"
+    processed.write_text('{"profile_id": 7, "channels": [{"id": 1}, {"id": 2}, {"id": 3}]}')
+    p = _bare_plugin(plugin_module)
+    p.processed_data_file = str(processed)
+    p._get_all_channels = lambda logger, channel_ids=None: [
+        {"id": cid, "name": "ABC", "channel_number": cid} for cid in channel_ids]
+    p._load_channels_data = lambda logger, settings: []
+    p._channel_group_key = lambda name, *a: name
+    p._channel_priority_key = lambda channel: channel["channel_number"]
+    p._send_progress_update = lambda *a, **kw: None
+    p._trigger_frontend_refresh = MagicMock()
+    writes = []
+    p._set_profile_channels_enabled = lambda profile_id, ids, enabled: writes.append(list(ids)) or len(ids)
+
+    result = p.manage_channel_visibility_action({}, logging.getLogger("test"))
+    assert result["status"] == "success"
+    if expected_writes is None:
+        assert writes == [] and "already up to date" in result["message"]
+        p._trigger_frontend_refresh.assert_not_called()
+    else:
+        assert tuple(writes) == expected_writes
+        p._trigger_frontend_refresh.assert_called_once()
+
+
+def test_lower_threshold_rows_label_each_distinct_winner_once(plugin_module):
+    p = _bare_plugin(plugin_module)
+    labelled = []
+    p._label_streams = lambda streams, logger: labelled.append([s["id"] for s in streams]) or ["x"]
+    current = [{"id": 1}]
+    wide = [{"id": 1}, {"id": 2}]
+    wider = [{"id": 1}, {"id": 2}, {"id": 3}]
+    # Like _get_matches_at_thresholds: equal stream lists are separate objects.
+    threshold_matches = {
+        85: {"streams": list(current)},
+        80: {"streams": list(wide)}, 75: {"streams": list(wide)},
+        70: {"streams": list(wider)}, 65: {"streams": list(wider)},
+        "callsign_85": {"streams": list(wider)},
+    }
+    rows = p._lower_threshold_rows(threshold_matches, 85, current, None)
+    assert rows == [(80, 1, ["x"]), (75, 1, ["x"]), (70, 2, ["x"]), (65, 2, ["x"])]
+    assert labelled == [[2], [2, 3]]
+
+
+def test_assign_ota_streams_falls_back_when_prefetch_fails(plugin_module, monkeypatch):
+    import logging
+    monkeypatch.setattr(plugin_module.PluginConfig, "EXISTING_STREAMS_PREFETCH_CHANNELS", 2)
+    p = _bare_plugin(plugin_module)
+
+    def failing_prefetch(channel_ids):
+        raise RuntimeError("db went away")
+
+    p._existing_streams_by_channel = failing_prefetch
+    writes = []
+    p._write_channel_streams = lambda cid, ids, overwrite, existing: writes.append((cid, existing))
+    matched = [{"channel_id": cid, "channel_name": f"C{cid}", "stream_ids": [cid]} for cid in (1, 2, 3)]
+
+    assert p._assign_ota_streams(matched, False, logging.getLogger("test")) == (3, 0)
+    assert writes == [(1, None), (2, None), (3, None)]   # each write reads its own channel
+
+
+def test_prefetch_existing_streams_returns_none_on_failure(plugin_module, monkeypatch):
+    import logging
+    from unittest.mock import MagicMock
+    model = MagicMock()
+    model.objects.filter.return_value.values_list.return_value = [(10, 1), (10, 2)]
+    monkeypatch.setattr(plugin_module, "ChannelStream", model)
+    p = _bare_plugin(plugin_module)
+    logger = logging.getLogger("test")
+    assert p._prefetch_existing_streams([10], logger) == {10: {1, 2}}
+
+    model.objects.filter.side_effect = RuntimeError("db went away")
+    assert p._prefetch_existing_streams([10], logger) is None   # Add Streams keeps going
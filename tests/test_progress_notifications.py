@@ -178,6 +178,42 @@ def test_persist_progress_new_op_emits_started_toast(plugin_module, tmp_state, m
     assert st["status"] == "running" and st["action"] == "sort_streams"
 
 
+def test_persist_progress_throttles_running_writes(plugin_module, tmp_state, monkeypatch):
+    p = _bare(plugin_module)
+    monkeypatch.setattr(p, "_emit_plugin_toast", lambda m: None)
+    writes = []
+    real = p._save_progress_state
+    monkeypatch.setattr(p, "_save_progress_state", lambda st: writes.append(st["progress"]) or real(st))
+    p._persist_progress("sort_streams", "running", 5, "a")
+    assert p._persist_progress("sort_streams", "running", 10, "b") is None   # within interval
+    p._persist_progress("sort_streams", "success", 100, "done")             # terminal always written
+    assert writes == [5, 100]
+    monkeypatch.setattr(plugin_module.PluginConfig, "PROGRESS_PERSIST_MIN_INTERVAL", 0)
+    p._persist_progress("sort_streams", "running", 5, "a")
+    p._persist_progress("sort_streams", "running", 10, "b")
+    assert writes == [5, 100, 5, 10]
+
+
+def test_persist_progress_flushes_last_throttled_update(plugin_module, tmp_state, monkeypatch):
+    p = _bare(plugin_module)
+    monkeypatch.setattr(p, "_emit_plugin_toast", lambda m: None)
+    monkeypatch.setattr(plugin_module.PluginConfig, "PROGRESS_PERSIST_MIN_INTERVAL", 0.05)
+    p._persist_progress("sort_streams", "running", 5, "a")
+    p._persist_progress("sort_streams", "running", 10, "b")
+    p._persist_progress("sort_streams", "running", 20, "long phase")   # skipped for now
+    assert p._load_progress_state()["progress"] == 5
+    time.sleep(0.3)
+    st = p._load_progress_state()
+    assert (st["progress"], st["message"], st["status"]) == (20, "long phase", "running")
+
+    # A terminal write supersedes a pending running update
+    p._persist_progress("sort_streams", "running", 30, "c")
+    p._persist_progress("sort_streams", "running", 40, "d")             # pending
+    p._persist_progress("sort_streams", "success", 100, "done")
+    time.sleep(0.3)
+    assert p._load_progress_state()["status"] == "complete"
+
+
 def test_send_progress_update_completion_writes_last_results(plugin_module, tmp_state):
     p = _bare(plugin_module)
     p._send_progress_update("sort_streams", "success", 100, "Sorted 5 streams.", None, {"streams_sorted": 5})
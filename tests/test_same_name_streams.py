@@ -158,3 +158,28 @@ def test_stream_fetch_selects_url(plugin_module):
     import inspect
     src = inspect.getsource(plugin_module.Plugin._get_all_streams)
     assert "'url'" in src or '"url"' in src
+
+
+def test_stream_fetch_pushes_filters_into_query(plugin_module, monkeypatch):
+    from unittest.mock import MagicMock
+    stream_model = MagicMock()
+    monkeypatch.setattr(plugin_module, "Stream", stream_model)
+    p = _bare(plugin_module)
+    p._get_all_streams(None)
+    stream_model.objects.all.return_value.filter.assert_not_called()
+    p._get_all_streams(None, channel_group_ids={3}, m3u_account_ids=[7, 8])
+    qs = stream_model.objects.all.return_value
+    qs.filter.assert_called_once_with(channel_group_id__in={3})
+    qs.filter.return_value.filter.assert_called_once_with(m3u_account_id__in=[7, 8])
+
+
+def test_channel_fetch_pushes_id_filter_into_query(plugin_module, monkeypatch):
+    from unittest.mock import MagicMock
+    channel_model = MagicMock()
+    monkeypatch.setattr(plugin_module, "Channel", channel_model)
+    p = _bare(plugin_module)
+    qs = channel_model.objects.select_related.return_value.all.return_value
+    p._get_all_channels(None)
+    qs.filter.assert_not_called()
+    p._get_all_channels(None, channel_ids=[4, 5])
+    qs.filter.assert_called_once_with(id__in=[4, 5])
@@ -16,6 +16,18 @@ def _bare_plugin(plugin_module):
 # coerce_timezone — validate IANA name, UTC fallback
 # --------------------------------------------------------------------------- #
 
+def test_pytz_timezone_memoized_per_name(plugin_module, monkeypatch):
+    calls = []
+    monkeypatch.setattr(plugin_module.pytz, "timezone", lambda name: calls.append(name) or name)
+    plugin_module._pytz_timezone.cache_clear()
+    try:
+        assert plugin_module._pytz_timezone("UTC") == "UTC"
+        assert plugin_module._pytz_timezone("UTC") == "UTC"
+        assert calls == ["UTC"]
+    finally:
+        plugin_module._pytz_timezone.cache_clear()
+
+
 def test_coerce_timezone_valid(plugin_module):
     assert plugin_module.coerce_timezone("US/Eastern") == "US/Eastern"
     assert plugin_module.coerce_timezone("Europe/Oslo") == "Europe/Oslo"